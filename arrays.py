@@ -0,0 +1,108 @@
+import numpy
+
+from errors import error
+
+# ARRAY values are NumPy arrays of 64-bit integers, which wrap around
+# on overflow. Dividing them with '/' gives arrays of floats.
+ARRAY = numpy.ndarray
+ELEMENT_TYPE = numpy.int64
+MIN_ELEMENT = -2 ** 63
+MAX_ELEMENT = 2 ** 63 - 1
+
+OPERATORS = {'+': numpy.add, '-': numpy.subtract, '*': numpy.multiply,
+             '/': numpy.true_divide, '%': numpy.remainder}
+
+
+def make_array(length):
+    """
+    :return: ARRAY of ''length'' zeros.
+    """
+    if length < 0:
+        error('', 'Length passed to array() must not be negative.')
+    try:
+        return numpy.zeros(length, dtype=ELEMENT_TYPE)
+    except (ValueError, MemoryError):
+        error('', 'Length passed to array() is too large.')
+
+
+def parse_array(line):
+    """
+    :return: ARRAY of the integers of ''line'', separated by whitespace.
+    """
+    try:
+        return numpy.array(line.split(), dtype=ELEMENT_TYPE)
+    except (ValueError, OverflowError):
+        error('', 'Input to readarray must be a line of NUM values.')
+
+
+def format_array(array):
+    """
+    :return: Elements of ''array'' separated by spaces, as read by
+    ''readarray''.
+    """
+    return ' '.join(map(str, array.tolist()))
+
+
+def check_element(value):
+    """
+    Checks that the NUM ''value'' fits into an element of an ARRAY.
+    """
+    if not MIN_ELEMENT <= value <= MAX_ELEMENT:
+        error('', 'NUM value does not fit into an ARRAY element.')
+
+
+def elementwise(op, left, right):
+    """
+    Applies the binary operator ''op'' to the elements of two ARRAY
+    values of the same length, or of an ARRAY and a NUM.
+    :return: ARRAY of the results.
+    """
+    for operand in (left, right):
+        if operand.__class__ is not ARRAY:
+            if not isinstance(operand, int):
+                error('', f'Binary operator {op} can only be applied to arguments of type NUM or ARRAY.')
+            check_element(operand)
+    if left.__class__ is ARRAY and right.__class__ is ARRAY and len(left) != len(right):
+        error('', f'Binary operator {op} can only be applied to ARRAY values of the same length.')
+    if op in ('/', '%') and not numpy.all(right):
+        error('', 'Division by zero.')
+    return OPERATORS[op](left, right)
+
+
+def check_index(array, index):
+    """
+    Checks that the 1-based ''index'' is within ''array''.
+    """
+    if not 1 <= index <= len(array):
+        error('', f'Array index {index} out of range 1..{len(array)}.')
+
+
+def get_element(array, index):
+    """
+    :return: Element of ''array'' at the 1-based ''index''.
+    """
+    check_index(array, index)
+    return array.item(index - 1)
+
+
+def set_element(array, index, value):
+    """
+    Assigns ''value'' to the element of ''array'' at the 1-based ''index''.
+    """
+    check_index(array, index)
+    check_element(value)
+    array[index - 1] = value
+
+
+def reduce(reduction, array):
+    """
+    :param reduction: 'sum', 'min' or 'max'.
+    :return: Sum, minimum or maximum of the elements of ''array''.
+    """
+    if reduction == 'sum':
+        return array.sum().item()
+    if not len(array):
+        error('', f'Argument passed to {reduction}() must not be empty.')
+    if reduction == 'min':
+        return array.min().item()
+    return array.max().item()
@@ -2,6 +2,13 @@ from abc import ABC, abstractmethod
 
 
 class Node(ABC):
+    # Line of the first token of the node, set by the parsers.
+    lineno = None
+    # Type of the values of an expression, and whether the type checks
+    # of the node are certain to pass, set by the ''TypeChecker''.
+    static_type = None
+    type_safe = False
+
     @abstractmethod
     def accept(self, visitor):
         pass
@@ -15,6 +22,8 @@ class Node(ABC):
 class Program(Node):
     def __init__(self, instr):
         self.instr = instr
+        # Number of variable slots, set once resolved by the ''Resolver''.
+        self.slot_count = None
 
     def accept(self, visitor):
         return visitor.visit_program(self)
@@ -52,16 +61,32 @@ class AssignStmt(Node):
     def __init__(self, ident, expr):
         self.ident = ident
         self.expr = expr
+        # Environment key of the variable: its name, or an
+        # integer slot once resolved by the ''Resolver''.
+        self.slot = ident
 
     def accept(self, visitor):
         return visitor.visit_assign_stmt(self)
 
 
+class IndexAssignStmt(Node):
+    def __init__(self, ident, num_expr, expr):
+        self.ident = ident
+        self.num_expr = num_expr
+        self.expr = expr
+
+    def accept(self, visitor):
+        return visitor.visit_index_assign_stmt(self)
+
+
 # Expressions
 
 class Ident(Node):
     def __init__(self, name):
         self.name = name
+        # Environment key of the variable: its name, or an
+        # integer slot once resolved by the ''Resolver''.
+        self.slot = name
 
     def accept(self, visitor):
         return visitor.visit_ident(self)
@@ -128,6 +153,24 @@ class PosExpr(Node):
         return visitor.visit_pos_expr(self)
 
 
+class IndexExpr(Node):
+    def __init__(self, ident, num_expr):
+        self.ident = ident
+        self.num_expr = num_expr
+
+    def accept(self, visitor):
+        return visitor.visit_index_expr(self)
+
+
+class ReductionExpr(Node):
+    def __init__(self, reduction, array_expr):
+        self.reduction = reduction
+        self.array_expr = array_expr
+
+    def accept(self, visitor):
+        return visitor.visit_reduction_expr(self)
+
+
 # String expressions
 
 class ReadstrExpr(Node):
@@ -157,6 +200,24 @@ class SubstrExpr(Node):
         return visitor.visit_substr_expr(self)
 
 
+# Array expressions
+
+class ArrayExpr(Node):
+    def __init__(self, num_expr):
+        self.num_expr = num_expr
+
+    def accept(self, visitor):
+        return visitor.visit_array_expr(self)
+
+
+class ReadarrayExpr(Node):
+    def __init__(self):
+        pass
+
+    def accept(self, visitor):
+        return visitor.visit_readarray_expr(self)
+
+
 # Control flow statements
 
 class IfStmt(Node):
@@ -170,6 +231,9 @@ class IfStmt(Node):
 
 
 class WhileStmt(Node):
+    # ''ClosedForm'' of the loop, if any, set by the ''LoopAnalyzer''.
+    closed_form = None
+
     def __init__(self, cond, simple_instr, do_while=False):
         self.cond = cond
         self.simple_instr = simple_instr
@@ -227,3 +291,49 @@ class PrintStmt(Node):
 
     def accept(self, visitor):
         return visitor.visit_print_stmt(self)
+
+
+def iter_child_nodes(node):
+    """
+    Yields all direct children of ''node'', in the order in
+    which they were passed to its constructor.
+    :param node: Node whose children to yield.
+    """
+    for value in node.__dict__.values():
+        if isinstance(value, Node):
+            yield value
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, Node):
+                    yield item
+
+
+def walk(node):
+    """
+    Yields ''node'' and all of its descendants in pre-order.
+    :param node: Root of the subtree to walk.
+    """
+    yield node
+    for child in iter_child_nodes(node):
+        yield from walk(child)
+
+
+def builtin_call(name, args):
+    """
+    Creates the node of a call of the builtin function ''name''.
+    Builtins are named by identifiers rather than reserved words,
+    so that their names remain usable as variable names.
+    :param name: Name the function is called by.
+    :param args: List of the argument expressions.
+    :return: The node, or None if there is no builtin ''name''
+    taking as many arguments.
+    """
+    if not args:
+        if name == 'readarray':
+            return ReadarrayExpr()
+    elif len(args) == 1:
+        if name == 'array':
+            return ArrayExpr(args[0])
+        if name == 'sum' or name == 'min' or name == 'max':
+            return ReductionExpr(name, args[0])
+    return None
@@ -0,0 +1,191 @@
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+import traceback
+
+import lexer_prim
+import parser_prim
+from cache import ProgramCache
+from errors import error
+from governor import Governor, LimitExceeded
+from input_source import BufferedInput, StringInput
+from interpreter import Interpreter, PARSERS
+from optimizer import PassManager, passes
+from output import BufferedOutput
+
+# State of a worker process, set up once by ''init_worker''.
+cache = None
+pass_names = ()
+parser = 'ply'
+limits = None
+
+
+def init_worker(worker_pass_names=(), worker_parser='ply', worker_limits=None):
+    """
+    Prepares a worker process: builds the lexer and parser, and
+    creates the cache of parsed programs shared by all of its jobs.
+    :param worker_pass_names: Names of the optimization passes to run.
+    :param worker_parser: One of ''PARSERS''.
+    :param worker_limits: Tuple of the ''Governor'' limits of every
+    job, or None to run them without limits.
+    """
+    global cache, pass_names, parser, limits
+    lexer_prim.make_lexer()
+    parser_prim.make_parser()
+    cache = ProgramCache()
+    pass_names = tuple(worker_pass_names)
+    parser = worker_parser
+    limits = worker_limits
+
+
+def read_manifest(path):
+    """
+    Reads a manifest of jobs, one JSON object per line with the
+    path of a ''program'' and, optionally, of the file its
+    standard input is read from, ''stdin''. Relative paths are
+    relative to the directory of the manifest.
+    :param path: Path of the manifest.
+    :return: List of jobs, dictionaries with absolute paths.
+    """
+    base = os.path.dirname(os.path.abspath(path))
+    jobs = []
+    with open(path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            job = json.loads(line)
+            job['program'] = os.path.join(base, job['program'])
+            if job.get('stdin') is not None:
+                job['stdin'] = os.path.join(base, job['stdin'])
+            jobs.append(job)
+    return jobs
+
+
+def exit_status(code):
+    """
+    :return: Exit status of a process exiting with ''code''.
+    """
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    sys.stderr.write(f'{code}\n')
+    return 1
+
+
+def run_job(job):
+    """
+    Runs a single job in the current process. Errors, which exit
+    the interpreter, only end this job, with exit status 1.
+    :param job: Dictionary with the path of the ''program'' and
+    of its ''stdin'' file, if any.
+    :return: Dictionary with the job, what the program wrote to
+    ''stdout'' and ''stderr'', its ''exit_status'', ''wall_time'',
+    and the name of the resource ''limit'' it exceeded, if any.
+    """
+    if cache is None:
+        init_worker()
+    out = io.StringIO()
+    err = io.StringIO()
+    status = 0
+    limit = None
+    start = time.perf_counter()
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(contextlib.redirect_stdout(out))
+        stack.enter_context(contextlib.redirect_stderr(err))
+        try:
+            with open(job['program']) as f:
+                source = f.read()
+            if job.get('stdin') is not None:
+                input_source = BufferedInput(stack.enter_context(open(job['stdin'], 'rb')),
+                                             encoding='utf-8')
+            else:
+                input_source = StringInput('')
+            program = cache.get_program(source, pass_names, PARSERS[parser])
+            if program is None:
+                raise SystemExit(1)
+            governor = None if limits is None else Governor(*limits)
+            try:
+                Interpreter(program=program, output=BufferedOutput(out), input_source=input_source,
+                            governor=governor)
+            except LimitExceeded as e:
+                limit = e.limit
+                error('', str(e))
+        except SystemExit as e:
+            status = exit_status(e.code)
+        except Exception:
+            traceback.print_exc()
+            status = 1
+    result = dict(job)
+    result.update(stdout=out.getvalue(), stderr=err.getvalue(), exit_status=status,
+                  wall_time=time.perf_counter() - start, limit=limit)
+    return result
+
+
+def run_batch(jobs, workers=None, pass_names=(), parser='ply', limits=None):
+    """
+    Runs jobs over a pool of worker processes.
+    :param jobs: Iterable of jobs, as returned by ''read_manifest''.
+    :param workers: Number of worker processes, the number of CPUs
+    by default.
+    :param pass_names: Names of the optimization passes to run.
+    :param parser: One of ''PARSERS''.
+    :param limits: Tuple of the arguments of the ''Governor'' of
+    every job, or None to run them without limits.
+    :return: Generator of the results of ''run_job'', in the order
+    of ''jobs''.
+    """
+    with ProcessPoolExecutor(workers, initializer=init_worker,
+                             initargs=(tuple(pass_names), parser, limits)) as executor:
+        yield from executor.map(run_job, jobs, chunksize=4)
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description='Runs a batch of programs in parallel.')
+    arg_parser.add_argument('manifest',
+                            help='JSON lines file of jobs: {"program": path, "stdin": path}.')
+    arg_parser.add_argument('-o', '--report', help='JSON lines report to write, '
+                                                   'standard output by default.')
+    arg_parser.add_argument('-j', '--workers', type=int,
+                            help='Number of worker processes (default: number of CPUs).')
+    arg_parser.add_argument('--parser', choices=PARSERS, default='ply',
+                            help='Parser (default: ply).')
+    arg_parser.add_argument('--passes', default='',
+                            help='Comma separated optimization passes to run before execution, '
+                                 f'from: {", ".join(passes)}.')
+    arg_parser.add_argument('--max-steps', type=int,
+                            help='Maximum number of loop iterations of every job.')
+    arg_parser.add_argument('--max-time', type=float,
+                            help='Maximum run time of every job in seconds.')
+    arg_parser.add_argument('--max-string-bytes', type=int,
+                            help='Maximum total length of the STRING values held by the variables '
+                                 'of every job.')
+    args = arg_parser.parse_args(argv)
+    try:
+        pass_manager = PassManager([name for name in args.passes.split(',') if name])
+    except ValueError as e:
+        arg_parser.error(str(e))
+    limits = (args.max_steps, args.max_time, args.max_string_bytes)
+    if limits == (None, None, None):
+        limits = None
+    jobs = read_manifest(args.manifest)
+    failed = 0
+    exceeded = 0
+    with contextlib.ExitStack() as stack:
+        report = stack.enter_context(open(args.report, 'w')) if args.report else sys.stdout
+        for result in run_batch(jobs, args.workers, pass_manager.pass_names, args.parser, limits):
+            report.write(json.dumps(result) + '\n')
+            if result['exit_status'] != 0:
+                failed += 1
+            if result['limit'] is not None:
+                exceeded += 1
+    sys.stderr.write(f'{len(jobs)} jobs, {failed} failed, {exceeded} exceeded a limit\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""
+Measures the tree interpreter on a line of integers read from input:
+scaled, shifted and summed with ARRAY operations, and the same done
+element by element with a loop.
+
+Usage: python benchmarks/array_operations.py [elements]
+"""
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from interpreter import compile  # noqa: E402
+
+VECTORIZED = '''
+a := readarray();
+b := a * 3 - 1;
+print(sum(b % 7));
+print(max(b) - min(b))
+'''
+
+LOOP = '''
+a := readarray();
+n := length(a);
+s := 0;
+low := 3 * a[1] - 1;
+high := low;
+i := 1;
+while i <= n do
+begin
+v := 3 * a[i] - 1;
+s := s + v % 7;
+if v < low then low := v;
+if v > high then high := v;
+i := i + 1
+end;
+print(s);
+print(high - low)
+'''
+
+
+def bench(program, stdin):
+    """
+    :return: Seconds taken by one run of ''program'', and its output.
+    """
+    stdout = io.StringIO()
+    start = time.perf_counter()
+    program.run(stdin=stdin, stdout=stdout)
+    return time.perf_counter() - start, stdout.getvalue()
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    stdin = ' '.join(str(i * 7919 % 10007 - 5000) for i in range(n)) + '\n'
+    loop, output = bench(compile(LOOP), stdin)
+    vectorized, vectorized_output = bench(compile(VECTORIZED), stdin)
+    assert vectorized_output == output
+    print('{:<10} {:>10}'.format('workload', 'seconds'))
+    print('{:<10} {:>9.3f}s'.format('loop', loop))
+    print('{:<10} {:>9.3f}s'.format('vectorized', vectorized))
+
+
+if __name__ == '__main__':
+    main()
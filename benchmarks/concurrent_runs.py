@@ -0,0 +1,98 @@
+"""
+Check that a compiled program can be shared: runs the examples and the
+loop benchmarks from several threads at once, each thread running the
+same ''CompiledProgram'', and compares every output with the one of a
+run on its own.
+
+Usage: python benchmarks/concurrent_runs.py [threads] [rounds]
+"""
+import io
+import os
+import sys
+import threading
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+from interpreter import compile  # noqa: E402
+from loop_throughput import WORKLOADS  # noqa: E402
+
+# Input read by the examples which call ''readint'' and ''readstr''.
+STDIN = '42\nhello\n'
+
+
+def outcome(program):
+    """
+    :return: Printable result of running ''program'': everything it
+    printed, and whether it stopped on an error.
+    """
+    out = io.StringIO()
+    try:
+        program.run(stdin=STDIN, stdout=out)
+        status = 'ok'
+    except SystemExit as e:
+        status = 'exit {}'.format(e.code)
+    return '{}\n{}'.format(out.getvalue(), status)
+
+
+def concurrent_outcomes(program, threads):
+    """
+    :return: Outcomes of ''program'' run by ''threads'' threads, which
+    all start at the same time.
+    """
+    outcomes = [None] * threads
+    barrier = threading.Barrier(threads)
+
+    def run(index):
+        barrier.wait()
+        outcomes[index] = outcome(program)
+
+    workers = [threading.Thread(target=run, args=(index,)) for index in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return outcomes
+
+
+def main():
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    sources = []
+    examples = os.path.join(ROOT, 'examples')
+    for name in sorted(os.listdir(examples)):
+        with open(os.path.join(examples, name)) as f:
+            sources.append((name, f.read()))
+    # Long enough for the loops to be specialized and traced.
+    sources += [(name, source.format(n=20000, outer=200)) for name, source in WORKLOADS]
+    # Switch threads as often as possible, so that the runs interleave
+    # inside the loops.
+    sys.setswitchinterval(1e-6)
+
+    failures = 0
+    stderr = sys.stderr
+    for name, source in sources:
+        # Errors are reported to standard error by every run.
+        sys.stderr = io.StringIO()
+        try:
+            program = compile(source)
+        except SystemExit:
+            sys.stderr = stderr
+            continue
+        try:
+            expected = outcome(program)
+            for _ in range(rounds):
+                for actual in concurrent_outcomes(program, threads):
+                    if actual != expected:
+                        failures += 1
+                        if failures <= 5:
+                            stderr.write('MISMATCH for {}:\n--- alone:\n{}\n--- concurrent:\n{}\n'.format(
+                                name, expected, actual))
+        finally:
+            sys.stderr = stderr
+    print('{} programs, {} runs, {} mismatches'.format(len(sources), len(sources) * threads * rounds, failures))
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
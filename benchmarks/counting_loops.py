@@ -0,0 +1,72 @@
+"""
+Measures loops which only count and accumulate, run by the tree
+interpreter in closed form and iteration by iteration.
+
+Usage: python benchmarks/counting_loops.py [iterations]
+"""
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import interpreter  # noqa: E402
+from interpreter import compile  # noqa: E402
+
+SUM = '''
+i := 0;
+s := 0;
+while i < {n} do
+begin
+s := s + i;
+i := i + 1
+end;
+print(s)
+'''
+
+AFFINE = '''
+i := {n};
+j := 0;
+s := 0;
+t := 0;
+do
+begin
+s := s + 3 * i - j;
+j := j + 2;
+t := t - (i - 1) * 5;
+i := i - 1
+end
+while i > 0;
+print(s);
+print(t)
+'''
+
+
+def bench(program, closed_forms):
+    """
+    :return: Seconds taken by one run of ''program'', and its output.
+    """
+    interpreter.Interpreter.closed_forms = closed_forms
+    try:
+        stdout = io.StringIO()
+        start = time.perf_counter()
+        program.run(stdout=stdout)
+        return time.perf_counter() - start, stdout.getvalue()
+    finally:
+        interpreter.Interpreter.closed_forms = True
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    print('{:<10} {:>10} {:>12}'.format('workload', 'iterated', 'closed form'))
+    for name, source in (('sum', SUM), ('affine', AFFINE)):
+        program = compile(source.format(n=n))
+        iterated, output = bench(program, False)
+        closed, closed_output = bench(program, True)
+        assert closed_output == output
+        print('{:<10} {:>9.3f}s {:>11.6f}s'.format(name, iterated, closed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Reports how often the fused nodes of the tree interpreter trigger on
+the programs in ''examples'' and the workloads of the suite: how many
+of the statements of every kind were fused, and how many of the
+statements executed by a run were fused ones. Loops count once per
+iteration.
+
+Usage: python benchmarks/fusion_coverage.py [example ...]
+"""
+from collections import Counter
+import contextlib
+import glob
+import io
+import os
+import sys
+
+BENCHMARKS = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCHMARKS, '..'))
+
+import ast  # noqa: E402
+from fusion import IncrementStmt, CountedWhileStmt, CompareBranchStmt  # noqa: E402
+from interpreter import compile  # noqa: E402
+from profiler import Profile  # noqa: E402
+from suite import FIXTURES, workloads  # noqa: E402
+
+FORMS = ((IncrementStmt, ast.AssignStmt), (CountedWhileStmt, ast.WhileStmt), (CompareBranchStmt, ast.IfStmt))
+# Input of the examples, which read at most a NUM and a STRING.
+EXAMPLE_INPUT = '42\nhello\n'
+
+
+def corpus(examples):
+    """
+    :return: List of (name, source, input) tuples of the programs.
+    """
+    programs = []
+    for path in examples:
+        with open(path) as f:
+            programs.append((os.path.basename(path), f.read(), EXAMPLE_INPUT))
+    for workload in workloads():
+        if workload.run:
+            stdin = ''
+            if workload.stdin is not None:
+                with open(os.path.join(FIXTURES, workload.stdin)) as f:
+                    stdin = f.read()
+            programs.append((workload.name, workload.source, stdin))
+    return programs
+
+
+def count(program, stdin):
+    """
+    :return: ''Counter'' of the fused and generic statements of
+    ''program'', and one of those executed by running it.
+    """
+    static = Counter()
+    for node in ast.walk(program.program):
+        static[node.__class__] += 1
+    profile = Profile()
+    # Runtime errors are printed to standard error, and exit.
+    with contextlib.redirect_stderr(io.StringIO()):
+        try:
+            program.run(stdin=stdin, stdout=io.StringIO(), profile=profile)
+        except SystemExit:
+            pass
+    dynamic = Counter()
+    for node, stats in profile.nodes.items():
+        executions = stats.count
+        if isinstance(node, ast.WhileStmt):
+            body = profile.nodes.get(node.simple_instr)
+            executions = 0 if body is None else body.count
+        dynamic[node.__class__] += executions
+    return static, dynamic
+
+
+def main():
+    examples = sys.argv[1:] or sorted(glob.glob(os.path.join(BENCHMARKS, '..', 'examples', '*.txt')))
+    static = Counter()
+    dynamic = Counter()
+    for name, source, stdin in corpus(examples):
+        program_static, program_dynamic = count(compile(source), stdin)
+        static += program_static
+        dynamic += program_dynamic
+    print('{:<18} {:>8} {:>8} {:>7} {:>12} {:>12} {:>7}'.format(
+        'node', 'fused', 'of', '%', 'executed', 'of', '%'))
+    for fused, generic in FORMS:
+        static_total = static[fused] + static[generic]
+        dynamic_total = dynamic[fused] + dynamic[generic]
+        print('{:<18} {:>8} {:>8} {:>6.1f}% {:>12} {:>12} {:>6.1f}%'.format(
+            fused.__name__, static[fused], static_total, static[fused] / (static_total or 1) * 100,
+            dynamic[fused], dynamic_total, dynamic[fused] / (dynamic_total or 1) * 100))
+
+
+if __name__ == '__main__':
+    main()
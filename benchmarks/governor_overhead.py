@@ -0,0 +1,44 @@
+"""
+Measures the cost of running the loop benchmarks under a
+''Governor'' whose limits are never reached.
+
+Usage: python benchmarks/governor_overhead.py [iterations] [runs]
+"""
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from governor import Governor  # noqa: E402
+from interpreter import compile  # noqa: E402
+from loop_throughput import WORKLOADS  # noqa: E402
+
+
+def bench(program, governor):
+    """
+    :return: Seconds taken by one run of ''program''.
+    """
+    start = time.perf_counter()
+    program.run(stdout=io.StringIO(), governor=governor)
+    return time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    for name, source in WORKLOADS:
+        program = compile(source.format(n=n, outer=n // 100))
+        # Runs alternate, so that both are equally affected by
+        # changes in the load of the machine.
+        plain = governed = float('inf')
+        for _ in range(runs):
+            plain = min(plain, bench(program, None))
+            governed = min(governed, bench(program, Governor(10 ** 12, 3600, 10 ** 9)))
+        print('{:<12} {:>8.3f}s {:>8.3f}s governed  {:>+6.1f}%'.format(
+            name, plain, governed, (governed / plain - 1) * 100))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""
+Measures input-heavy programs reading with ''readint'' from every
+kind of ''InputSource'', and with input() as used before for every
+''readint'' and ''readstr''. Input is read from a temporary file.
+
+Usage: python benchmarks/input_throughput.py [readints]
+"""
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from interpreter import Interpreter, parse_source  # noqa: E402
+from input_source import BufferedInput, ConsoleInput  # noqa: E402
+from output import BufferedOutput  # noqa: E402
+
+READ_LOOP = '''
+i := 0;
+total := 0;
+while i < {n} do
+begin
+total := total + readint;
+i := i + 1
+end;
+print(total)
+'''
+
+
+@contextlib.contextmanager
+def stdin_from(path):
+    stdin = sys.stdin
+    with open(path) as sys.stdin:
+        try:
+            yield
+        finally:
+            sys.stdin = stdin
+
+
+def bench_source(make, path, n):
+    with stdin_from(path):
+        source = make()
+        start = time.perf_counter()
+        for _ in range(n):
+            source.read_int()
+        return time.perf_counter() - start
+
+
+def bench_program(make, path, program):
+    out = io.StringIO()
+    with stdin_from(path):
+        start = time.perf_counter()
+        Interpreter(program=program, output=BufferedOutput(out), input_source=make())
+        return time.perf_counter() - start, out.getvalue().strip()
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6
+    program = parse_source(READ_LOOP.format(n=n))
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+        f.write(''.join(f'{i}\n' for i in range(n)))
+    try:
+        print('{} readints'.format(n))
+        print('{:<10} {:>10} {:>10}'.format('input', 'source', 'program'))
+        for name, make in (('input()', ConsoleInput), ('buffered', BufferedInput)):
+            source = bench_source(make, f.name, n)
+            total, result = bench_program(make, f.name, program)
+            print('{:<10} {:>9.2f}s {:>9.2f}s  {}'.format(name, source, total, result))
+    finally:
+        os.remove(f.name)
+
+
+if __name__ == '__main__':
+    main()
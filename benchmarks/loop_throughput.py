@@ -0,0 +1,71 @@
+"""
+Measures loop throughput of the execution backends.
+
+Usage: python benchmarks/loop_throughput.py [iterations]
+"""
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from interpreter import BACKENDS, run_source  # noqa: E402
+
+ARITHMETIC_LOOP = '''
+i := 0;
+s := 0;
+while i < {n} do
+begin
+s := s + i * 2 % 7;
+if s > 1000 then s := s - 1000;
+i := i + 1
+end;
+print(s)
+'''
+
+NESTED_LOOP = '''
+i := 0;
+n := 0;
+while i < {outer} do
+begin
+j := 0;
+while j < 100 do
+begin
+if j % 3 = 0 and not (j = 99) then n := n + 1 else n := n - 1;
+j := j + 1
+end;
+i := i + 1
+end;
+print(n)
+'''
+
+WORKLOADS = (('arithmetic', ARITHMETIC_LOOP), ('nested', NESTED_LOOP))
+
+
+def bench(program, backend, n):
+    """
+    Runs a loop ''program'' on ''backend''.
+    :return: Tuple of elapsed seconds and the program's output.
+    """
+    out = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(out):
+        run_source(program.format(n=n, outer=n // 100), backend)
+    return time.perf_counter() - start, out.getvalue()
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    for name, program in WORKLOADS:
+        baseline = None
+        for backend in BACKENDS:
+            elapsed, output = bench(program, backend, n)
+            baseline = baseline or elapsed
+            print('{:<12} {:<8} {:>8.3f}s {:>12.0f} iter/s {:>6.2f}x  output={}'.format(
+                name, backend, elapsed, n / elapsed, baseline / elapsed, output.strip()))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+Measures output-heavy programs with every kind of ''Output'', and
+with the builtin print() previously used for every print statement.
+Output goes to the null device.
+
+Usage: python benchmarks/output_throughput.py [prints]
+"""
+import contextlib
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from interpreter import Interpreter, parse_source  # noqa: E402
+from output import Output, BufferedOutput, LineBufferedOutput, FdOutput  # noqa: E402
+
+PRINT_LOOP = '''
+i := 0;
+while i < {n} do
+begin
+print(i);
+i := i + 1
+end
+'''
+
+
+class PrintOutput(Output):
+    def write_line(self, value):
+        print(value)
+
+    def flush(self):
+        sys.stdout.flush()
+
+
+def bench_sink(output, n):
+    start = time.perf_counter()
+    with output:
+        for i in range(n):
+            output.write_line(i)
+    return time.perf_counter() - start
+
+
+def bench_program(program, output):
+    start = time.perf_counter()
+    Interpreter(program=program, output=output)
+    return time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6
+    program = parse_source(PRINT_LOOP.format(n=n))
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        outputs = (('print()', PrintOutput), ('buffered', BufferedOutput),
+                   ('line', LineBufferedOutput), ('fd', lambda: FdOutput(devnull.fileno())))
+        results = [(name, bench_sink(make(), n), bench_program(program, make()))
+                   for name, make in outputs]
+    print('{} prints'.format(n))
+    print('{:<10} {:>10} {:>10}'.format('output', 'sink', 'program'))
+    for name, sink, total in results:
+        print('{:<10} {:>9.2f}s {:>9.2f}s'.format(name, sink, total))
+
+
+if __name__ == '__main__':
+    main()
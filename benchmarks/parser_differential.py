@@ -0,0 +1,156 @@
+"""
+Differential check of the hand-written parser against the PLY parser:
+parses the examples and randomly generated programs, some of them
+deliberately broken, with both parsers and compares the resulting
+trees, or the reported errors.
+
+Usage: python benchmarks/parser_differential.py [programs] [seed]
+"""
+import contextlib
+import io
+import os
+import random
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+import parser_prim  # noqa: E402
+import parser_rd  # noqa: E402
+
+NAMES = ('x', 'y', 'count', 'trueish', 'falsey', '_s1', 'sum')
+STRINGS = ('""', '"a"', '"hello world"', '"x=1;"')
+
+
+class ProgramGenerator:
+    def __init__(self, rng):
+        self.rng = rng
+
+    def expr(self, depth=0):
+        rng = self.rng
+        if depth > 3 or rng.random() < 0.3:
+            return rng.choice([str(rng.randint(0, 99)), rng.choice(NAMES), rng.choice(STRINGS),
+                               'readint', 'readstr', 'readarray()'])
+        choice = rng.randint(0, 10)
+        if choice < 3:
+            return '{} {} {}'.format(self.expr(depth + 1), rng.choice('+-*/%'), self.expr(depth + 1))
+        elif choice == 3:
+            return '-' + self.expr(depth + 1)
+        elif choice == 4:
+            return '({})'.format(self.expr(depth + 1))
+        elif choice == 5:
+            return 'length({})'.format(self.expr(depth + 1))
+        elif choice == 6:
+            return '{}({}, {})'.format(rng.choice(['position', 'concatenate']),
+                                       self.expr(depth + 1), self.expr(depth + 1))
+        elif choice == 7:
+            return 'substring({}, {}, {})'.format(self.expr(depth + 1), self.expr(depth + 1),
+                                                   self.expr(depth + 1))
+        elif choice == 8:
+            return '{}[{}]'.format(rng.choice(NAMES), self.expr(depth + 1))
+        elif choice == 9:
+            return '{}({})'.format(rng.choice(['sum', 'min', 'max']), self.expr(depth + 1))
+        return 'array({})'.format(self.expr(depth + 1))
+
+    def bool_expr(self, depth=0):
+        rng = self.rng
+        choice = rng.randint(0, 6 if depth < 3 else 2)
+        if choice == 0:
+            return rng.choice(['true', 'false'])
+        elif choice == 1:
+            return '{} {} {}'.format(self.expr(depth + 1), rng.choice(['=', '<', '<=', '>', '>=', '<>']),
+                                     self.expr(depth + 1))
+        elif choice == 2:
+            return '{} {} {}'.format(self.expr(depth + 1), rng.choice(['==', '!=']), self.expr(depth + 1))
+        elif choice == 3:
+            return 'not ' + self.bool_expr(depth + 1)
+        elif choice == 4:
+            return '({})'.format(self.bool_expr(depth + 1))
+        return '{} {} {}'.format(self.bool_expr(depth + 1), rng.choice(['and', 'or']),
+                                 self.bool_expr(depth + 1))
+
+    def simple_instr(self, depth=0):
+        rng = self.rng
+        choice = rng.randint(0, 7 if depth < 3 else 2)
+        if choice == 0:
+            if rng.random() < 0.2:
+                return '{}[{}] := {}'.format(rng.choice(NAMES), self.expr(), self.expr())
+            return '{} := {}'.format(rng.choice(NAMES), self.expr())
+        elif choice == 1:
+            return 'print({})'.format(self.expr())
+        elif choice == 2:
+            return 'exit'
+        elif choice == 3:
+            return 'if {} then {}'.format(self.bool_expr(), self.simple_instr(depth + 1))
+        elif choice == 4:
+            return 'if {} then {} else {}'.format(self.bool_expr(), self.simple_instr(depth + 1),
+                                                  self.simple_instr(depth + 1))
+        elif choice == 5:
+            return 'while {} do {}'.format(self.bool_expr(), self.simple_instr(depth + 1))
+        elif choice == 6:
+            return 'do {} while {}'.format(self.simple_instr(depth + 1), self.bool_expr())
+        return 'begin\n{}\nend'.format(self.instr(depth + 1))
+
+    def instr(self, depth=0):
+        return ';\n'.join(self.simple_instr(depth) for _ in range(self.rng.randint(1, 4)))
+
+    def program(self):
+        source = self.instr()
+        if self.rng.random() < 0.3:
+            source = self.mutate(source)
+        return source
+
+    def mutate(self, source):
+        """
+        Breaks ''source'' by deleting, duplicating or inserting a piece of it.
+        """
+        rng = self.rng
+        pos = rng.randint(0, len(source))
+        choice = rng.randint(0, 2)
+        if choice == 0:
+            return source[:pos] + source[pos + rng.randint(1, 5):]
+        elif choice == 1:
+            return source[:pos] + source[max(0, pos - 4):pos] + source[pos:]
+        return source[:pos] + rng.choice([' ( ', ' ) ', ';', ' then ', ' $ ', '\r', ' true ', ' , ',
+                                          ' [ ', ' ] ']) + source[pos:]
+
+
+def outcome(parse, source):
+    """
+    :return: Printable result of parsing ''source'': the tree, or
+    everything the parser wrote when it failed.
+    """
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(out):
+        try:
+            tree = parse(source)
+        except SystemExit:
+            tree = 'exit'
+    return '{!r}\n{}'.format(tree, out.getvalue())
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    rng = random.Random(int(sys.argv[2]) if len(sys.argv) > 2 else 0)
+    sources = []
+    examples = os.path.join(ROOT, 'examples')
+    for name in sorted(os.listdir(examples)):
+        with open(os.path.join(examples, name)) as f:
+            sources.append(f.read())
+    generator = ProgramGenerator(rng)
+    sources += [generator.program() for _ in range(count)]
+
+    failures = 0
+    for source in sources:
+        expected = outcome(parser_prim.parse, source)
+        actual = outcome(parser_rd.parse, source)
+        if expected != actual:
+            failures += 1
+            if failures <= 5:
+                print('MISMATCH for:\n{}\n--- ply:\n{}\n--- rd:\n{}\n'.format(source, expected, actual))
+    print('{} programs, {} mismatches'.format(len(sources), failures))
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""
+Compares the parsing throughput, in tokens per second, of the PLY
+parser and the hand-written recursive descent parser on a generated
+program of several megabytes.
+
+Usage: python benchmarks/parser_throughput.py [megabytes]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import parser_rd  # noqa: E402
+from interpreter import PARSERS  # noqa: E402
+
+BLOCK = '''begin
+  i := 0;
+  s := "";
+  while i < n and not (i >= 100) do
+  begin
+    s := concatenate(s, substring("abcdef", i % 6 + 1, i % 6 + 1));
+    if position(s, "cd") > 0 then print(length(s)) else i := i + (2 * 3 - 1) / 5;
+    i := i + 1
+  end
+end'''
+
+
+def generate(size):
+    """
+    :return: Program of at least ''size'' characters.
+    """
+    blocks = ['n := 10']
+    length = 0
+    while length < size:
+        blocks.append(BLOCK)
+        length += len(BLOCK) + 2
+    return ';\n'.join(blocks)
+
+
+def main():
+    megabytes = float(sys.argv[1]) if len(sys.argv) > 1 else 4
+    source = generate(int(megabytes * 1024 * 1024))
+    tokens = len(parser_rd.tokenize(source))
+    print('{:.1f} MB, {} tokens'.format(len(source) / 1024 / 1024, tokens))
+    trees = {}
+    for name, parse in PARSERS.items():
+        start = time.perf_counter()
+        program = parse(source)
+        elapsed = time.perf_counter() - start
+        trees[name] = repr(program)
+        print('{:<4} {:>8.2f} s {:>12.0f} tokens/s'.format(name, elapsed, tokens / elapsed))
+    if len(set(trees.values())) != 1:
+        print('the parsers produced different trees')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+Measures ''position'' over a long line read with ''readstr'', with and
+without the search indexes of the tree interpreter: repeated searches
+of the whole line, and a scan taking the rest of the line after every
+occurrence of a sparse delimiter.
+
+Usage: python benchmarks/position_index.py [size] [iterations]
+"""
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import search_index  # noqa: E402
+from interpreter import compile  # noqa: E402
+
+REPEATED = '''
+line := readstr;
+i := 0;
+hits := 0;
+while i < {n} do
+begin
+if position(line, "#") > 0 then hits := hits + 1;
+if position(line, "error") > 0 then hits := hits + 1;
+i := i + 1
+end;
+print(hits)
+'''
+
+SCAN = '''
+line := readstr;
+rest := line;
+records := 0;
+p := position(rest, ";");
+while p > 0 do
+begin
+records := records + 1;
+rest := substring(rest, p + 2, length(rest));
+p := position(rest, ";")
+end;
+print(records)
+'''
+
+
+def generate(size):
+    """
+    :return: Line of about ''size'' characters of comma separated
+    words, with a ';' after every 1000 characters or so and a '#'
+    near the end.
+    """
+    rng = random.Random(size)
+    words = []
+    length = 0
+    while length < size:
+        word = ''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(1, 10)))
+        if rng.random() < 0.01:
+            word += ';'
+        words.append(word)
+        length += len(word) + 1
+    words[-2] += '#'
+    return ','.join(words)
+
+
+def bench(program, line, indexed):
+    """
+    :return: Seconds taken by one run of ''program'' over ''line'',
+    and its output.
+    """
+    min_indexed_length = search_index.MIN_INDEXED_LENGTH
+    if not indexed:
+        search_index.MIN_INDEXED_LENGTH = sys.maxsize
+    try:
+        stdout = io.StringIO()
+        start = time.perf_counter()
+        program.run(stdin=line + '\n', stdout=stdout)
+        return time.perf_counter() - start, stdout.getvalue()
+    finally:
+        search_index.MIN_INDEXED_LENGTH = min_indexed_length
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1024 * 1024
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    line = generate(size)
+    print('{:<10} {:>10} {:>10}'.format('workload', 'find', 'indexed'))
+    for name, source in (('repeated', REPEATED.format(n=n)), ('scan', SCAN)):
+        program = compile(source)
+        plain, output = bench(program, line, False)
+        indexed, indexed_output = bench(program, line, True)
+        assert indexed_output == output
+        print('{:<10} {:>9.3f}s {:>9.3f}s'.format(name, plain, indexed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""
+Measures cold start: the time from launching a fresh Python process
+to the first statement of a program being executed, with the
+pregenerated lexer and parser tables and with tables built from
+scratch, as happens when they are missing or stale.
+
+Usage: python benchmarks/startup.py [runs]
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+PREBUILT = '''
+import interpreter
+interpreter.run_source('print(1)')
+'''
+
+FROM_SCRATCH = '''
+import ply.lex as lex
+import ply.yacc as yacc
+import lexer_prim
+import parser_prim
+import interpreter
+lexer_prim.lexer = lex.lex(module=lexer_prim)
+parser_prim.parser = yacc.yacc(module=parser_prim, tabmodule='_no_such_tables',
+                               debug=False, write_tables=False, errorlog=yacc.NullLogger())
+interpreter.run_source('print(1)')
+'''
+
+
+def cold_start(code):
+    """
+    :return: Seconds until the new process printed its first line.
+    """
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, '-c', code], cwd=ROOT,
+                               stdout=subprocess.PIPE)
+    process.stdout.readline()
+    elapsed = time.perf_counter() - start
+    process.wait()
+    return elapsed
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    baseline = statistics.median(cold_start('pass') for _ in range(runs))
+    print('{:<14} {:>8.1f} ms'.format('empty process', baseline * 1000))
+    for name, code in (('prebuilt', PREBUILT), ('from scratch', FROM_SCRATCH)):
+        elapsed = statistics.median(cold_start(code) for _ in range(runs))
+        print('{:<14} {:>8.1f} ms  ({:.1f} ms over an empty process)'.format(
+            name, elapsed * 1000, (elapsed - baseline) * 1000))
+
+
+if __name__ == '__main__':
+    main()
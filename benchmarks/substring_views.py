@@ -0,0 +1,97 @@
+"""
+Measures a tokenizer written in the language, which splits a long
+line read with ''readstr'' into words and numbers by repeatedly taking
+the ''substring'' after the next space. Every size is run with
+substring views and with substrings copied, whose cost grows with
+the square of the size, up to ''copy_size'' characters.
+
+Usage: python benchmarks/substring_views.py [size] [copy_size]
+"""
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import rope  # noqa: E402
+from interpreter import compile  # noqa: E402
+
+TOKENIZER = '''
+line := readstr;
+rest := line;
+words := 0;
+numbers := 0;
+chars := 0;
+while length(rest) > 0 do
+begin
+p := position(rest, " ");
+if p = 0 then p := length(rest);
+if position("_0123456789", substring(rest, 1, 1)) > 0 then numbers := numbers + 1 else words := words + 1;
+chars := chars + length(substring(rest, 1, p));
+rest := substring(rest, p + 2, length(rest))
+end;
+print(words);
+print(numbers);
+print(chars)
+'''
+
+
+def generate(size):
+    """
+    :return: Line of about ''size'' characters of words and numbers
+    separated by single spaces.
+    """
+    rng = random.Random(size)
+    tokens = []
+    length = 0
+    while length < size:
+        if rng.random() < 0.3:
+            token = str(rng.randrange(10 ** 6))
+        else:
+            token = ''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(1, 10)))
+        tokens.append(token)
+        length += len(token) + 1
+    return ' '.join(tokens)
+
+
+def bench(program, line, views):
+    """
+    :return: Seconds taken by one run of the tokenizer over ''line'',
+    and its output.
+    """
+    min_view_length = rope.MIN_VIEW_LENGTH
+    if not views:
+        rope.MIN_VIEW_LENGTH = sys.maxsize
+    try:
+        stdout = io.StringIO()
+        start = time.perf_counter()
+        program.run(stdin=line + '\n', stdout=stdout)
+        return time.perf_counter() - start, stdout.getvalue()
+    finally:
+        rope.MIN_VIEW_LENGTH = min_view_length
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1024 * 1024
+    copy_size = int(sys.argv[2]) if len(sys.argv) > 2 else size
+    program = compile(TOKENIZER)
+    print('{:>10} {:>10} {:>10}'.format('size', 'views', 'copies'))
+    current = min(size, 64 * 1024)
+    while True:
+        line = generate(current)
+        views, output = bench(program, line, True)
+        copies = '-'
+        if current <= copy_size:
+            copy_time, copy_output = bench(program, line, False)
+            assert copy_output == output
+            copies = '{:.3f}s'.format(copy_time)
+        print('{:>10} {:>9.3f}s {:>10}'.format(len(line), views, copies))
+        if current >= size:
+            break
+        current = min(size, current * 4)
+
+
+if __name__ == '__main__':
+    main()
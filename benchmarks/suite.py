@@ -0,0 +1,274 @@
+"""
+Benchmark suite of representative workloads. For every workload it
+reports the parse time, execution time, peak memory and operations
+per second, and can save the results as a JSON baseline and flag
+regressions against a baseline or between two backends.
+
+Usage:
+    python benchmarks/suite.py [--backend tree] [--save results.json]
+    python benchmarks/suite.py --baseline results.json [--threshold 10]
+    python benchmarks/suite.py --backends tree,closure
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+# Differences in time below this many seconds are never flagged,
+# since they are within the noise of the measurements.
+MIN_TIME_CHANGE = 0.002
+
+BENCHMARKS = os.path.dirname(os.path.abspath(__file__))
+FIXTURES = os.path.join(BENCHMARKS, 'fixtures')
+sys.path.insert(0, os.path.join(BENCHMARKS, '..'))
+
+import parser_rd  # noqa: E402
+from interpreter import BACKENDS, PARSERS, parse_source, run_program  # noqa: E402
+from loop_throughput import ARITHMETIC_LOOP  # noqa: E402
+from parser_throughput import generate  # noqa: E402
+
+STRING_LOOP = '''
+i := 0;
+s := "";
+hits := 0;
+while i < {n} do
+begin
+s := concatenate(s, substring("abcdefghij", i % 10 + 1, i % 10 + 3));
+if length(s) > 200 then s := substring(s, 100, length(s));
+if position(s, "cde") > 0 then hits := hits + 1;
+i := i + 1
+end;
+print(hits);
+print(length(s))
+'''
+
+NESTED_IF_LOOP = '''
+i := 0;
+a := 0;
+b := 0;
+c := 0;
+while i < {n} do
+begin
+if i % 2 = 0 then
+  if i % 3 = 0 then
+    if i % 5 = 0 then
+      if i % 7 = 0 then a := a + 1 else b := b + 1
+    else c := c + 1
+  else
+    if i % 5 = 1 then b := b + 2 else c := c + 2
+else
+  if i % 3 = 1 then
+    if i % 5 = 2 then a := a + 3 else b := b + 3
+  else c := c + 3;
+i := i + 1
+end;
+print(a);
+print(b);
+print(c)
+'''
+
+READINT_LOOP = '''
+n := readint;
+i := 0;
+total := 0;
+while i < n do
+begin
+total := total + readint;
+print(total);
+i := i + 1
+end
+'''
+
+RECORDS_LOOP = '''
+n := readint;
+i := 0;
+best := 0;
+name := "";
+while i < n do
+begin
+s := readstr;
+v := readint;
+if v > best then
+begin
+best := v;
+name := s
+end;
+print(concatenate(s, " ok"));
+i := i + 1
+end;
+print(name);
+print(best)
+'''
+
+
+class Workload:
+    def __init__(self, name, source, ops, stdin=None, run=True):
+        """
+        Initializes a benchmark workload.
+        :param name: Name of the workload.
+        :param source: Source of the program.
+        :param ops: Number of operations done by the workload, e.g.
+        loop iterations, to compute the operations per second.
+        :param stdin: Name of the file in ''fixtures'' recorded as
+        the standard input of the program, if any.
+        :param run: Whether the program is run, or only parsed.
+        """
+        self.name = name
+        self.source = source
+        self.ops = ops
+        self.stdin = stdin
+        self.run = run
+
+
+def workloads():
+    """
+    :return: List of the ''Workload'' objects of the suite.
+    """
+    large_source = generate(1024 * 1024)
+    return [
+        Workload('arithmetic', ARITHMETIC_LOOP.format(n=50000), 50000),
+        Workload('strings', STRING_LOOP.format(n=10000), 10000),
+        Workload('nested_if', NESTED_IF_LOOP.format(n=20000), 20000),
+        Workload('io_readint', READINT_LOOP, 20000, stdin='ints.txt'),
+        Workload('io_records', RECORDS_LOOP, 5000, stdin='records.txt'),
+        Workload('parse_large', large_source, len(parser_rd.tokenize(large_source)), run=False),
+    ]
+
+
+@contextlib.contextmanager
+def redirected(stdin):
+    """
+    Redirects standard input to the fixture ''stdin'', if any, and
+    standard output to the null device.
+    """
+    old_stdin, old_stdout = sys.stdin, sys.stdout
+    with contextlib.ExitStack() as stack:
+        if stdin is not None:
+            sys.stdin = stack.enter_context(open(os.path.join(FIXTURES, stdin)))
+        sys.stdout = stack.enter_context(open(os.devnull, 'w'))
+        try:
+            yield
+        finally:
+            sys.stdin, sys.stdout = old_stdin, old_stdout
+
+
+def measure(workload, backend, parser, repeat):
+    """
+    Runs a workload ''repeat'' times, keeping the fastest times.
+    Peak memory is measured in one more run, since tracing memory
+    allocations slows execution down.
+    :return: Dictionary of the measurements.
+    """
+    parse_time = exec_time = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        program = parse_source(workload.source, parser=parser)
+        parse_time = min(parse_time, time.perf_counter() - start)
+        if workload.run:
+            with redirected(workload.stdin):
+                start = time.perf_counter()
+                run_program(program, backend)
+                exec_time = min(exec_time, time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        program = parse_source(workload.source, parser=parser)
+        if workload.run:
+            with redirected(workload.stdin):
+                run_program(program, backend)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    if not workload.run:
+        exec_time = 0.0
+    return {'parse_time': parse_time, 'exec_time': exec_time, 'peak_memory': peak_memory,
+            'ops_per_sec': workload.ops / (exec_time if workload.run else parse_time)}
+
+
+def run_suite(backend, parser, repeat, only=None):
+    """
+    :return: Dictionary of the results of the suite.
+    """
+    # The first parse of a process also loads the parser tables.
+    parse_source('x := 0', parser=parser)
+    results = {}
+    for workload in workloads():
+        if only and workload.name not in only:
+            continue
+        results[workload.name] = measure(workload, backend, parser, repeat)
+        print_result(workload.name, results[workload.name])
+    return {'backend': backend, 'parser': parser, 'python': platform.python_version(),
+            'results': results}
+
+
+def print_result(name, result):
+    print('{:<12} parse {:>8.4f}s  exec {:>8.4f}s  peak {:>8.1f} KB {:>12.0f} ops/s'.format(
+        name, result['parse_time'], result['exec_time'], result['peak_memory'] / 1024,
+        result['ops_per_sec']))
+
+
+def compare(base, current, threshold):
+    """
+    Compares two suite results and prints every metric that got
+    worse by more than ''threshold'' percent.
+    :return: Number of regressions.
+    """
+    print('{} ({}) -> {} ({})'.format(base['backend'], base['python'],
+                                      current['backend'], current['python']))
+    print('{:<12} {:<12} {:>12} {:>12} {:>8}'.format('workload', 'metric', 'base', 'current', 'change'))
+    regressions = 0
+    for name, result in current['results'].items():
+        base_result = base['results'].get(name)
+        if base_result is None:
+            continue
+        for metric in ('parse_time', 'exec_time', 'peak_memory'):
+            before, after = base_result[metric], result[metric]
+            if not before:
+                continue
+            change = (after / before - 1) * 100
+            flag = ''
+            noise = metric != 'peak_memory' and after - before < MIN_TIME_CHANGE
+            if change > threshold and not noise:
+                flag = 'REGRESSION'
+                regressions += 1
+            print('{:<12} {:<12} {:>12.4g} {:>12.4g} {:>+7.1f}%  {}'.format(
+                name, metric, before, after, change, flag))
+    return regressions
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Runs the benchmark suite.')
+    arg_parser.add_argument('--backend', choices=BACKENDS, default='tree')
+    arg_parser.add_argument('--backends', help='Two comma separated backends to compare.')
+    arg_parser.add_argument('--parser', choices=PARSERS, default='ply')
+    arg_parser.add_argument('--repeat', type=int, default=3, help='Runs of every workload (default: 3).')
+    arg_parser.add_argument('--only', help='Comma separated workloads to run.')
+    arg_parser.add_argument('--save', help='File to save the results to, as JSON.')
+    arg_parser.add_argument('--baseline', help='JSON results to compare against.')
+    arg_parser.add_argument('--threshold', type=float, default=10.0,
+                            help='Change in percent flagged as a regression (default: 10).')
+    args = arg_parser.parse_args()
+    only = set(args.only.split(',')) if args.only else None
+
+    if args.backends:
+        base_backend, backend = args.backends.split(',')
+        base = run_suite(base_backend, args.parser, args.repeat, only)
+        current = run_suite(backend, args.parser, args.repeat, only)
+    else:
+        base = None
+        if args.baseline:
+            with open(args.baseline) as f:
+                base = json.load(f)
+        current = run_suite(args.backend, args.parser, args.repeat, only)
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(current, f, indent=2)
+    if base is not None and compare(base, current, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Compares variable-heavy loops with name lookups in an
+''Environment'' against resolved slots in a ''SlotEnvironment''.
+
+Usage: python benchmarks/variable_access.py [iterations]
+"""
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from interpreter import Interpreter  # noqa: E402
+from environment import Environment, SlotEnvironment  # noqa: E402
+
+VARIABLE_LOOP = '''
+i := 0;
+a := 1;
+b := 2;
+c := 3;
+d := 0;
+while i < {n} do
+begin
+d := a + b + c + d % 1000;
+a := b;
+b := c;
+c := d % 7;
+i := i + 1
+end;
+print(d)
+'''
+
+
+def bench_interpreter(n, resolve):
+    out = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(out):
+        Interpreter(VARIABLE_LOOP.format(n=n), resolve=resolve)
+    return time.perf_counter() - start, out.getvalue().strip()
+
+
+def bench_environment(environment, key, n):
+    start = time.perf_counter()
+    environment.assign(key, 0)
+    for i in range(n):
+        environment.assign(key, environment.get(key) + 1)
+    return time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    by_name, output = bench_interpreter(n, resolve=False)
+    by_slot, _ = bench_interpreter(n, resolve=True)
+    print('loop, names  {:>8.3f}s {:>12.0f} iter/s  output={}'.format(by_name, n / by_name, output))
+    print('loop, slots  {:>8.3f}s {:>12.0f} iter/s  {:.2f}x'.format(by_slot, n / by_slot, by_name / by_slot))
+
+    by_name = bench_environment(Environment(), 'counter', n * 10)
+    by_slot = bench_environment(SlotEnvironment(1), 0, n * 10)
+    print('get+assign, names {:>8.3f}s'.format(by_name))
+    print('get+assign, slots {:>8.3f}s  {:.2f}x'.format(by_slot, by_name / by_slot))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,150 @@
+import operator
+
+# Opcodes. Every instruction occupies two slots in the code list:
+# the opcode followed by its argument (0 for opcodes that take none).
+
+LOAD_CONST = 0
+LOAD_NAME = 1
+STORE_NAME = 2
+BINARY_OP = 3
+COMPARE_NUM = 4
+COMPARE_STR = 5
+JUMP = 6
+JUMP_IF_FALSE = 7
+JUMP_IF_TRUE = 8
+CHECK_BOOL = 9
+POP_TOP = 10
+NEGATE = 11
+NOT = 12
+BOOL_OP = 13
+LENGTH = 14
+POSITION = 15
+CONCAT = 16
+SUBSTR = 17
+READINT = 18
+READSTR = 19
+PRINT = 20
+EXIT = 21
+
+opnames = {
+    LOAD_CONST: 'LOAD_CONST',
+    LOAD_NAME: 'LOAD_NAME',
+    STORE_NAME: 'STORE_NAME',
+    BINARY_OP: 'BINARY_OP',
+    COMPARE_NUM: 'COMPARE_NUM',
+    COMPARE_STR: 'COMPARE_STR',
+    JUMP: 'JUMP',
+    JUMP_IF_FALSE: 'JUMP_IF_FALSE',
+    JUMP_IF_TRUE: 'JUMP_IF_TRUE',
+    CHECK_BOOL: 'CHECK_BOOL',
+    POP_TOP: 'POP_TOP',
+    NEGATE: 'NEGATE',
+    NOT: 'NOT',
+    BOOL_OP: 'BOOL_OP',
+    LENGTH: 'LENGTH',
+    POSITION: 'POSITION',
+    CONCAT: 'CONCAT',
+    SUBSTR: 'SUBSTR',
+    READINT: 'READINT',
+    READSTR: 'READSTR',
+    PRINT: 'PRINT',
+    EXIT: 'EXIT'
+}
+
+# Operator tables indexed by the argument of BINARY_OP, COMPARE_NUM,
+# COMPARE_STR and BOOL_OP. The symbols are kept for error messages.
+
+binary_ops = ('+', '-', '*', '/', '%')
+binary_fns = (operator.add, operator.sub, operator.mul,
+              operator.truediv, operator.mod)
+
+num_rels = ('=', '<', '<=', '>', '>=', '<>')
+num_rel_fns = (operator.eq, operator.lt, operator.le,
+               operator.gt, operator.ge, operator.ne)
+
+str_rels = ('==', '!=')
+str_rel_fns = (operator.eq, operator.ne)
+
+bool_ops = ('and', 'or')
+
+# Messages for CHECK_BOOL, indexed by its argument.
+
+check_bool_msgs = ('If clause condition must be a boolean expression.',
+                   'While loop condition must be a boolean expression.')
+CHECK_IF = 0
+CHECK_WHILE = 1
+
+
+class CodeObject:
+    def __init__(self):
+        self.code = []
+        self.consts = []
+        self.names = []
+
+    def emit(self, op, arg=0):
+        """
+        Appends an instruction to the code.
+        :param op: Opcode of the instruction.
+        :param arg: Argument of the instruction.
+        :return: Index of the instruction's argument slot, which can
+        later be passed to ''patch''.
+        """
+        self.code.append(op)
+        self.code.append(arg)
+        return len(self.code) - 1
+
+    def patch(self, slot, arg):
+        """
+        Replaces the argument stored at ''slot'', e.g. to resolve
+        a forward jump once its target is known.
+        """
+        self.code[slot] = arg
+
+    def here(self):
+        """
+        :return: Offset of the next instruction to be emitted.
+        """
+        return len(self.code)
+
+    def add_const(self, value):
+        """
+        Adds ''value'' to the constant pool unless an equal constant
+        of the same type is already there.
+        :return: Index of the constant in the pool.
+        """
+        for i, const in enumerate(self.consts):
+            if type(const) is type(value) and const == value:
+                return i
+        self.consts.append(value)
+        return len(self.consts) - 1
+
+    def add_name(self, name):
+        """
+        :return: Index of ''name'' in the name pool.
+        """
+        if name not in self.names:
+            self.names.append(name)
+        return self.names.index(name)
+
+    def disassemble(self):
+        """
+        :return: Human readable listing of the code.
+        """
+        lines = []
+        for offset in range(0, len(self.code), 2):
+            op, arg = self.code[offset], self.code[offset + 1]
+            line = '{:>6} {:<14} {}'.format(offset, opnames[op], arg)
+            if op == LOAD_CONST:
+                line += ' ({!r})'.format(self.consts[arg])
+            elif op in (LOAD_NAME, STORE_NAME):
+                line += ' ({})'.format(self.names[arg])
+            elif op == BINARY_OP:
+                line += ' ({})'.format(binary_ops[arg])
+            elif op == COMPARE_NUM:
+                line += ' ({})'.format(num_rels[arg])
+            elif op == COMPARE_STR:
+                line += ' ({})'.format(str_rels[arg])
+            elif op == BOOL_OP:
+                line += ' ({})'.format(bool_ops[arg])
+            lines.append(line)
+        return '\n'.join(lines)
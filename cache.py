@@ -0,0 +1,116 @@
+from collections import OrderedDict
+import hashlib
+import sys
+import threading
+
+import ast
+from parser_prim import parse
+from optimizer import PassManager
+from resolver import Resolver
+from typechecker import TypeChecker
+from fusion import Fuser
+from closed_form import LoopAnalyzer
+
+
+def estimate_size(program):
+    """
+    Estimates the memory held by an AST.
+    :param program: Root of the AST.
+    :return: Approximate size in bytes.
+    """
+    size = 0
+    for node in ast.walk(program):
+        size += sys.getsizeof(node) + sys.getsizeof(node.__dict__)
+        for value in node.__dict__.values():
+            if isinstance(value, list):
+                size += sys.getsizeof(value)
+            elif not isinstance(value, ast.Node):
+                size += sys.getsizeof(value)
+    return size
+
+
+class ProgramCache:
+    def __init__(self, max_entries=128, max_bytes=64 * 1024 * 1024):
+        """
+        Initializes an LRU cache of parsed programs, keyed by the hash
+        of their source and the optimization passes run over them.
+        :param max_entries: Maximum number of cached programs.
+        :param max_bytes: Maximum estimated memory held by all cached
+        programs. Programs larger than that are never cached.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def key(input_str, pass_names):
+        digest = hashlib.sha256(input_str.encode('utf-8')).hexdigest()
+        return digest, tuple(pass_names)
+
+    def get_program(self, input_str, pass_names=(), parse=parse):
+        """
+        Returns the finished AST of a program: parsed, optimized by
+        ''pass_names'' and resolved. The tree is shared by all callers,
+        so it must be treated as read-only; none of the execution
+        backends modify a resolved tree.
+        :param input_str: Source of the program.
+        :param pass_names: Names of the optimization passes to run.
+        :param parse: Function parsing the source on a cache miss.
+        All parsers produce the same trees, so it is not part of the key.
+        :return: Root of the AST, or None if the input ended unexpectedly.
+        """
+        key = self.key(input_str, pass_names)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        program = parse(input_str)
+        if program is None:
+            return None
+        program = PassManager(pass_names).run(program)
+        Resolver().resolve(program)
+        TypeChecker().check(program)
+        Fuser().fuse(program)
+        LoopAnalyzer().analyze(program)
+        self.put(key, program)
+        return program
+
+    def put(self, key, program):
+        """
+        Stores ''program'' under ''key'', evicting the least recently
+        used entries until the cache fits in its bounds again.
+        """
+        size = estimate_size(program)
+        if size > self.max_bytes or self.max_entries < 1:
+            return
+        with self.lock:
+            if key in self.entries:
+                return
+            self.entries[key] = (program, size)
+            self.bytes += size
+            while len(self.entries) > self.max_entries or self.bytes > self.max_bytes:
+                _, (_, evicted_size) = self.entries.popitem(last=False)
+                self.bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.bytes = 0
+
+    def stats(self):
+        """
+        :return: Dictionary of the cache counters.
+        """
+        with self.lock:
+            return {'entries': len(self.entries), 'bytes': self.bytes, 'hits': self.hits,
+                    'misses': self.misses, 'evictions': self.evictions}
@@ -0,0 +1,261 @@
+import ast
+from fusion import RELOPS
+
+# Relation between the operands of a comparison once they are swapped.
+SWAPPED_RELS = {'=': '=', '<>': '<>', '<': '>', '<=': '>=', '>': '<', '>=': '<='}
+ARITHMETIC = (ast.Ident, ast.Literal, ast.UnaryExpr, ast.BinopExpr, ast.GroupingExpr)
+
+
+class NotProvable(Exception):
+    """
+    Raised when running a loop in closed form is not certain to have
+    the same result as running it, e.g. because one of its statements
+    would fail.
+    """
+
+
+def body_statements(node):
+    """
+    :return: List of the statements run by the body ''node'' of a
+    loop, if they are all assignments, None otherwise.
+    """
+    if isinstance(node, ast.AssignStmt):
+        return [node]
+    if isinstance(node, ast.InstrBlock):
+        return body_statements(node.instr)
+    if isinstance(node, ast.Instr):
+        statements = []
+        for simple_instr in node.simple_instr_list:
+            inner = body_statements(simple_instr)
+            if inner is None:
+                return None
+            statements += inner
+        return statements
+    return None
+
+
+def trip_count(num_rel, start, step, bound):
+    """
+    :return: Number of iterations of a loop whose condition is
+    ''i num_rel bound'', where ''i'' is ''start'' in the first
+    iteration and grows by ''step'' in every one, or None if the
+    loop never ends.
+    """
+    if not RELOPS[num_rel](start, bound):
+        return 0
+    if num_rel == '=':
+        return None if step == 0 else 1
+    if num_rel == '<>':
+        if step == 0 or (bound - start) % step or (bound - start) // step < 0:
+            return None
+        return (bound - start) // step
+    if num_rel in ('<', '<='):
+        if step <= 0:
+            return None
+        limit = bound if num_rel == '<' else bound + 1
+        return -((start - limit) // step)
+    if step >= 0:
+        return None
+    limit = bound if num_rel == '>' else bound - 1
+    return -((limit - start) // -step)
+
+
+def evaluate(expr, values):
+    """
+    Evaluates an arithmetic expression like the interpreter does.
+    :param values: Values of the variables, by slot.
+    :return: Value of the expression.
+    :raise NotProvable: If evaluating it would fail.
+    """
+    if isinstance(expr, ast.Ident):
+        value = values[expr.slot]
+        if value is None:
+            raise NotProvable()
+        return value
+    if isinstance(expr, ast.Literal):
+        return expr.value
+    if isinstance(expr, ast.GroupingExpr):
+        return evaluate(expr.num_expr, values)
+    if isinstance(expr, ast.UnaryExpr):
+        value = evaluate(expr.num_expr, values)
+        if value.__class__ not in (int, float):
+            raise NotProvable()
+        return -value
+    left = evaluate(expr.num_expr0, values)
+    right = evaluate(expr.num_expr1, values)
+    if left.__class__ is not int or right.__class__ is not int:
+        raise NotProvable()
+    op = expr.op
+    if op == '+':
+        return left + right
+    elif op == '-':
+        return left - right
+    elif op == '*':
+        return left * right
+    if right == 0:
+        raise NotProvable()
+    if op == '/':
+        return left / right
+    return left % right
+
+
+class ClosedForm:
+    def __init__(self, statements, variables, constants, induction, num_rel, bound):
+        """
+        Initializes the closed form of a loop whose body only assigns
+        variables with arithmetic. In every iteration, its induction
+        variables grow by the same amount, and its accumulators by an
+        amount which grows by the same amount, so that after ''n''
+        iterations they are polynomials in ''n'' of degree 1 and 2.
+        Its constants are assigned the same value in every iteration.
+        :param statements: The assignments of the body, in order.
+        :param variables: Slots of the induction variables and
+        accumulators.
+        :param constants: Slots of the constants.
+        :param induction: Slot of the induction variable compared by
+        the condition of the loop.
+        :param num_rel: Relation between it and ''bound''.
+        :param bound: Expression it is compared with, which the loop
+        does not change.
+        """
+        self.statements = statements
+        self.variables = variables
+        self.constants = constants
+        self.induction = induction
+        self.num_rel = num_rel
+        self.bound = bound
+
+    def step(self, values):
+        """
+        Runs one iteration of the body on a copy of ''values''.
+        :return: Values of the variables after the iteration.
+        :raise NotProvable: If one of the statements would fail.
+        """
+        values = list(values)
+        for assign_stmt in self.statements:
+            value = evaluate(assign_stmt.expr, values)
+            old_value = values[assign_stmt.slot]
+            if old_value is not None and value.__class__ is not old_value.__class__:
+                raise NotProvable()
+            values[assign_stmt.slot] = value
+        return values
+
+    def run(self, values, do_while):
+        """
+        Computes the values of the variables once the loop has run,
+        starting from ''values'', without running its iterations.
+        :param do_while: Whether the body runs before the condition
+        is checked.
+        :return: Number of times the body runs, and dictionary mapping
+        the slots assigned by the loop to their final values.
+        :raise NotProvable: If the loop never ends, or one of its
+        statements would fail.
+        """
+        bound = evaluate(self.bound, values)
+        start = values[self.induction]
+        if start.__class__ is not int or bound.__class__ is not int:
+            raise NotProvable()
+        first = self.step(values)
+        step = first[self.induction] - start
+        if do_while:
+            iterations = trip_count(self.num_rel, start + step, step, bound)
+            iterations = None if iterations is None else iterations + 1
+        else:
+            iterations = trip_count(self.num_rel, start, step, bound)
+        if iterations is None:
+            raise NotProvable()
+        if iterations == 0:
+            return 0, {}
+        second = self.step(first)
+        final = {slot: first[slot] for slot in self.constants}
+        for slot in self.variables:
+            # Newton's forward differences of the values after 0, 1
+            # and 2 iterations.
+            difference = first[slot] - values[slot]
+            second_difference = second[slot] - 2 * first[slot] + values[slot]
+            final[slot] = (values[slot] + iterations * difference
+                           + iterations * (iterations - 1) // 2 * second_difference)
+        return iterations, final
+
+
+class LoopAnalyzer:
+    def __init__(self):
+        """
+        Initializes a pass which finds the loops of a resolved program
+        which can be run in closed form, and stores their ''ClosedForm''
+        in their ''closed_form'' attribute.
+        """
+        self.loops = 0
+
+    def analyze(self, program):
+        """
+        :param program: Root of the resolved AST.
+        :return: Number of loops which can be run in closed form.
+        """
+        for node in ast.walk(program):
+            if isinstance(node, ast.WhileStmt):
+                node.closed_form = self.closed_form(node)
+                if node.closed_form is not None:
+                    self.loops += 1
+        return self.loops
+
+    def closed_form(self, while_stmt):
+        """
+        :return: ''ClosedForm'' of ''while_stmt'', or None if it does
+        not have one.
+        """
+        statements = body_statements(while_stmt.simple_instr)
+        if not statements:
+            return None
+        assigned = {assign_stmt.slot for assign_stmt in statements}
+        if len(assigned) != len(statements):
+            return None
+
+        def invariant(expr):
+            return all(isinstance(node, ARITHMETIC) and not (isinstance(node, ast.Ident) and node.slot in assigned)
+                       for node in ast.walk(expr))
+
+        induction = set()
+        accumulators = []
+        constants = []
+        for assign_stmt in statements:
+            expr = assign_stmt.expr
+            if isinstance(expr, ast.BinopExpr) and expr.op in ('+', '-') and isinstance(expr.num_expr0, ast.Ident) \
+                    and expr.num_expr0.slot == assign_stmt.slot:
+                if invariant(expr.num_expr1):
+                    induction.add(assign_stmt.slot)
+                else:
+                    accumulators.append(assign_stmt)
+            elif invariant(expr):
+                constants.append(assign_stmt.slot)
+            else:
+                return None
+
+        def affine(expr):
+            if invariant(expr):
+                return True
+            if isinstance(expr, ast.Ident):
+                return expr.slot in induction
+            if isinstance(expr, (ast.GroupingExpr, ast.UnaryExpr)):
+                return affine(expr.num_expr)
+            if isinstance(expr, ast.BinopExpr):
+                if expr.op in ('+', '-'):
+                    return affine(expr.num_expr0) and affine(expr.num_expr1)
+                if expr.op == '*':
+                    return (invariant(expr.num_expr0) and affine(expr.num_expr1)) \
+                        or (affine(expr.num_expr0) and invariant(expr.num_expr1))
+            return False
+
+        if not all(affine(assign_stmt.expr.num_expr1) for assign_stmt in accumulators):
+            return None
+
+        cond = while_stmt.cond
+        if not isinstance(cond, ast.NumRelopExpr):
+            return None
+        left, num_rel, right = cond.num_expr0, cond.num_rel, cond.num_expr1
+        if not (isinstance(left, ast.Ident) and left.slot in induction):
+            left, num_rel, right = right, SWAPPED_RELS.get(num_rel), left
+        if not (isinstance(left, ast.Ident) and left.slot in induction and num_rel in RELOPS and invariant(right)):
+            return None
+        variables = sorted(induction) + [assign_stmt.slot for assign_stmt in accumulators]
+        return ClosedForm(statements, variables, constants, left.slot, num_rel, right)
@@ -0,0 +1,292 @@
+from visitor import Visitor
+from errors import error
+from bytecode import (binary_ops, binary_fns, num_rels, num_rel_fns,
+                      str_rels, str_rel_fns)
+
+binary_op_fns = dict(zip(binary_ops, binary_fns))
+num_rel_op_fns = dict(zip(num_rels, num_rel_fns))
+str_rel_op_fns = dict(zip(str_rels, str_rel_fns))
+
+
+class ClosureCompiler(Visitor):
+    """
+    Walks the AST once and turns every node into a Python closure
+    taking an ''Environment''. Statements return None when called,
+    expressions return their value. All operator dispatch happens
+    here, at compile time, so running the closures performs no
+    ''accept'' calls and no operator string comparisons.
+    """
+
+    def compile(self, program):
+        """
+        Compiles a whole ''program''.
+        :param program: Root of the AST.
+        :return: Closure running the program in a given ''Environment''.
+        """
+        return program.accept(self)
+
+    def visit_program(self, program):
+        return program.instr.accept(self)
+
+    def visit_instr(self, instr):
+        stmts = tuple(simple_instr.accept(self) for simple_instr in instr.simple_instr_list)
+        if len(stmts) == 1:
+            return stmts[0]
+
+        def run_instr(env):
+            for stmt in stmts:
+                stmt(env)
+        return run_instr
+
+    def visit_instr_block(self, instr_block):
+        return instr_block.instr.accept(self)
+
+    def visit_exit_stmt(self, exit_stmt):
+        def run_exit(env):
+            exit()
+        return run_exit
+
+    def visit_assign_stmt(self, assign_stmt):
+        """
+        Inlines the checks of ''Environment.assign'' so that
+        an assignment costs a single closure call.
+        """
+        name = assign_stmt.ident
+        expr = assign_stmt.expr.accept(self)
+
+        def run_assign(env):
+            value = expr(env)
+            values = env.values
+            existing_value = values.get(name)
+            if existing_value is not None and not isinstance(value, type(existing_value)):
+                error('', 'Variable type does not match.')
+            values[name] = value
+        return run_assign
+
+    def visit_ident(self, ident):
+        name = ident.name
+
+        def eval_ident(env):
+            value = env.values.get(name)
+            if value is None:
+                error('', 'Variable not declared.')
+            return value
+        return eval_ident
+
+    def visit_literal(self, literal):
+        value = literal.value
+        return lambda env: value
+
+    def visit_readint_expr(self, readint_expr):
+        def eval_readint(env):
+            i = input()
+            try:
+                i = int(i)
+            except ValueError:
+                error('', 'Input to readint must be of type NUM.')
+            return i
+        return eval_readint
+
+    def visit_unary_expr(self, unary_expr):
+        num_expr = unary_expr.num_expr.accept(self)
+        return lambda env: -num_expr(env)
+
+    def visit_binop_expr(self, binop_expr):
+        left_expr = binop_expr.num_expr0.accept(self)
+        right_expr = binop_expr.num_expr1.accept(self)
+        op = binop_expr.op
+        fn = binary_op_fns[op]
+
+        def eval_binop(env):
+            left = left_expr(env)
+            right = right_expr(env)
+            if not (isinstance(left, int) and isinstance(right, int)):
+                error('', f'Binary operator {op} can only be applied to arguments of type NUM.')
+            return fn(left, right)
+        return eval_binop
+
+    def visit_grouping_expr(self, grouping_expr):
+        return grouping_expr.num_expr.accept(self)
+
+    def visit_len_expr(self, len_expr):
+        str_expr = len_expr.str_expr.accept(self)
+
+        def eval_len(env):
+            value = str_expr(env)
+            if not isinstance(value, str):
+                error('', 'Argument passed to length() must be of type STRING.')
+            return len(value)
+        return eval_len
+
+    def visit_pos_expr(self, pos_expr):
+        str_expr0 = pos_expr.str_expr0.accept(self)
+        str_expr1 = pos_expr.str_expr1.accept(self)
+
+        def eval_pos(env):
+            string = str_expr0(env)
+            sub = str_expr1(env)
+            if not (isinstance(string, str) and isinstance(sub, str)):
+                error('', 'Arguments passed to position() must be of type STRING.')
+            pos = string.find(sub)
+            return 0 if pos == -1 else pos
+        return eval_pos
+
+    def visit_readstr_expr(self, readstr_expr):
+        return lambda env: input()
+
+    def visit_concat_expr(self, concat_expr):
+        str_expr0 = concat_expr.str_expr0.accept(self)
+        str_expr1 = concat_expr.str_expr1.accept(self)
+
+        def eval_concat(env):
+            left = str_expr0(env)
+            right = str_expr1(env)
+            if not (isinstance(left, str) and isinstance(right, str)):
+                error('', 'Arguments passed to concatenate() must be of type STRING.')
+            return ''.join([left, right])
+        return eval_concat
+
+    def visit_substr_expr(self, substr_expr):
+        str_expr = substr_expr.str_expr.accept(self)
+        num_expr0 = substr_expr.num_expr0.accept(self)
+        num_expr1 = substr_expr.num_expr1.accept(self)
+
+        def eval_substr(env):
+            string = str_expr(env)
+            start = num_expr0(env)
+            end = num_expr1(env)
+            if not (isinstance(string, str) and isinstance(start, int) and isinstance(end, int)):
+                error('', 'Arguments passed to substring() must be of appropriate types.')
+            if start < 1 or end < 0:
+                return ''
+            return string[start-1:end]
+        return eval_substr
+
+    def visit_if_stmt(self, if_stmt):
+        cond = if_stmt.cond.accept(self)
+        true_branch = if_stmt.true_simple_instr.accept(self)
+        else_branch = None
+        if if_stmt.else_simple_instr is not None:
+            else_branch = if_stmt.else_simple_instr.accept(self)
+
+        def run_if(env):
+            condition = cond(env)
+            if not isinstance(condition, bool):
+                error('', 'If clause condition must be a boolean expression.')
+            if condition:
+                true_branch(env)
+            elif else_branch is not None:
+                else_branch(env)
+        return run_if
+
+    def visit_while_stmt(self, while_stmt):
+        """
+        Like the tree-walking interpreter, the condition is
+        evaluated and type checked once before the loop starts.
+        """
+        cond = while_stmt.cond.accept(self)
+        body = while_stmt.simple_instr.accept(self)
+
+        if while_stmt.do_while:
+            def run_while(env):
+                if not isinstance(cond(env), bool):
+                    error('', 'While loop condition must be a boolean expression.')
+                while True:
+                    body(env)
+                    if not cond(env):
+                        break
+        else:
+            def run_while(env):
+                if not isinstance(cond(env), bool):
+                    error('', 'While loop condition must be a boolean expression.')
+                while cond(env):
+                    body(env)
+        return run_while
+
+    def visit_not_expr(self, not_expr):
+        bool_expr = not_expr.bool_expr.accept(self)
+
+        def eval_not(env):
+            value = bool_expr(env)
+            if not isinstance(value, bool):
+                error('', '\'not\' keyword can only be used with a boolean expression.')
+            return not value
+        return eval_not
+
+    def visit_boolop_expr(self, boolop_expr):
+        bool_expr0 = boolop_expr.bool_expr0.accept(self)
+        bool_expr1 = boolop_expr.bool_expr1.accept(self)
+
+        # Both operands are always evaluated, as in the tree-walking interpreter.
+        if boolop_expr.bool_op == 'and':
+            def eval_boolop(env):
+                left = bool_expr0(env)
+                right = bool_expr1(env)
+                if not (isinstance(left, bool) and isinstance(right, bool)):
+                    error('', 'Boolean operators can only be used with boolean expressions.')
+                return left and right
+        else:
+            def eval_boolop(env):
+                left = bool_expr0(env)
+                right = bool_expr1(env)
+                if not (isinstance(left, bool) and isinstance(right, bool)):
+                    error('', 'Boolean operators can only be used with boolean expressions.')
+                return left or right
+        return eval_boolop
+
+    def visit_num_relop_expr(self, num_relop_expr):
+        num_expr0 = num_relop_expr.num_expr0.accept(self)
+        num_expr1 = num_relop_expr.num_expr1.accept(self)
+        num_rel = num_relop_expr.num_rel
+        fn = num_rel_op_fns.get(num_rel)
+        if fn is None:
+            error('', f'Relational operator \'{num_rel}\' not supported for type NUM.')
+
+        def eval_num_relop(env):
+            left = num_expr0(env)
+            right = num_expr1(env)
+            if not (isinstance(left, int) and isinstance(right, int)):
+                error('', f'Relational operator \'{num_rel}\' can only be used with type NUM')
+            return fn(left, right)
+        return eval_num_relop
+
+    def visit_str_relop_expr(self, str_relop_expr):
+        str_expr0 = str_relop_expr.str_expr0.accept(self)
+        str_expr1 = str_relop_expr.str_expr1.accept(self)
+        str_rel = str_relop_expr.str_rel
+        fn = str_rel_op_fns[str_rel]
+
+        def eval_str_relop(env):
+            left = str_expr0(env)
+            right = str_expr1(env)
+            if not (isinstance(left, str) and isinstance(right, str)):
+                error('', f'Relational operator \'{str_rel}\' can only be used with type STRING.')
+            return fn(left, right)
+        return eval_str_relop
+
+    def visit_print_stmt(self, print_stmt):
+        expr = print_stmt.expr.accept(self)
+
+        def run_print(env):
+            print(expr(env))
+        return run_print
+
+    # ARRAY values are only supported by the tree-walking interpreter.
+
+    def visit_index_assign_stmt(self, index_assign_stmt):
+        self.array_unsupported(index_assign_stmt)
+
+    def visit_index_expr(self, index_expr):
+        self.array_unsupported(index_expr)
+
+    def visit_reduction_expr(self, reduction_expr):
+        self.array_unsupported(reduction_expr)
+
+    def visit_array_expr(self, array_expr):
+        self.array_unsupported(array_expr)
+
+    def visit_readarray_expr(self, readarray_expr):
+        self.array_unsupported(readarray_expr)
+
+    def array_unsupported(self, node):
+        error(node.lineno, 'ARRAY values are only supported by the tree backend.')
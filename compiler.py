@@ -0,0 +1,205 @@
+from visitor import Visitor
+from errors import error
+from bytecode import (CodeObject, LOAD_CONST, LOAD_NAME, STORE_NAME, BINARY_OP,
+                      COMPARE_NUM, COMPARE_STR, JUMP, JUMP_IF_FALSE, JUMP_IF_TRUE,
+                      CHECK_BOOL, POP_TOP, NEGATE, NOT, BOOL_OP, LENGTH, POSITION,
+                      CONCAT, SUBSTR, READINT, READSTR, PRINT, EXIT,
+                      binary_ops, num_rels, str_rels, bool_ops, CHECK_IF, CHECK_WHILE)
+
+
+class Compiler(Visitor):
+    def __init__(self):
+        """
+        Initializes the compiler, which lowers an AST into a flat
+        ''CodeObject'' runnable by the VM.
+        """
+        self.code_object = None
+
+    def compile(self, program):
+        """
+        Compiles a whole ''program''.
+        :param program: Root of the AST.
+        :return: The resulting ''CodeObject''.
+        """
+        self.code_object = CodeObject()
+        self.emit_node(program)
+        return self.code_object
+
+    def emit_node(self, node):
+        """
+        Emits the code of a single node.
+        :param node: Statement or expression to compile.
+        """
+        node.accept(self)
+
+    def emit(self, op, arg=0):
+        return self.code_object.emit(op, arg)
+
+    def visit_program(self, program):
+        """
+        Compiles the ''instr'' of a ''program''.
+        """
+        self.emit_node(program.instr)
+
+    def visit_instr(self, instr):
+        """
+        Compiles all ''simple_instr'' statements in an ''instr'' statement.
+        """
+        for simple_instr in instr.simple_instr_list:
+            self.emit_node(simple_instr)
+
+    def visit_instr_block(self, instr_block):
+        """
+        Compiles the ''instr'' of an ''instr_block''.
+        """
+        self.emit_node(instr_block.instr)
+
+    def visit_exit_stmt(self, exit_stmt):
+        self.emit(EXIT)
+
+    def visit_assign_stmt(self, assign_stmt):
+        """
+        Compiles the expression of ''assign_stmt'' followed by
+        a store into its identifier.
+        """
+        self.emit_node(assign_stmt.expr)
+        self.emit(STORE_NAME, self.code_object.add_name(assign_stmt.ident))
+
+    def visit_ident(self, ident):
+        self.emit(LOAD_NAME, self.code_object.add_name(ident.name))
+
+    def visit_literal(self, literal):
+        self.emit(LOAD_CONST, self.code_object.add_const(literal.value))
+
+    def visit_readint_expr(self, readint_expr):
+        self.emit(READINT)
+
+    def visit_unary_expr(self, unary_expr):
+        self.emit_node(unary_expr.num_expr)
+        self.emit(NEGATE)
+
+    def visit_binop_expr(self, binop_expr):
+        self.emit_node(binop_expr.num_expr0)
+        self.emit_node(binop_expr.num_expr1)
+        self.emit(BINARY_OP, binary_ops.index(binop_expr.op))
+
+    def visit_grouping_expr(self, grouping_expr):
+        self.emit_node(grouping_expr.num_expr)
+
+    def visit_len_expr(self, len_expr):
+        self.emit_node(len_expr.str_expr)
+        self.emit(LENGTH)
+
+    def visit_pos_expr(self, pos_expr):
+        self.emit_node(pos_expr.str_expr0)
+        self.emit_node(pos_expr.str_expr1)
+        self.emit(POSITION)
+
+    def visit_readstr_expr(self, readstr_expr):
+        self.emit(READSTR)
+
+    def visit_concat_expr(self, concat_expr):
+        self.emit_node(concat_expr.str_expr0)
+        self.emit_node(concat_expr.str_expr1)
+        self.emit(CONCAT)
+
+    def visit_substr_expr(self, substr_expr):
+        self.emit_node(substr_expr.str_expr)
+        self.emit_node(substr_expr.num_expr0)
+        self.emit_node(substr_expr.num_expr1)
+        self.emit(SUBSTR)
+
+    def visit_if_stmt(self, if_stmt):
+        """
+        Compiles an ''if_stmt'' into a conditional jump over
+        the true branch, and an unconditional jump over the
+        else branch if there is one.
+        """
+        self.emit_node(if_stmt.cond)
+        self.emit(CHECK_BOOL, CHECK_IF)
+        to_else = self.emit(JUMP_IF_FALSE)
+        self.emit_node(if_stmt.true_simple_instr)
+        if if_stmt.else_simple_instr is not None:
+            to_end = self.emit(JUMP)
+            self.code_object.patch(to_else, self.code_object.here())
+            self.emit_node(if_stmt.else_simple_instr)
+            self.code_object.patch(to_end, self.code_object.here())
+        else:
+            self.code_object.patch(to_else, self.code_object.here())
+
+    def visit_while_stmt(self, while_stmt):
+        """
+        Compiles a ''while_stmt''. Just like the tree-walking
+        interpreter, the condition is evaluated and type checked
+        once before the loop itself starts.
+        """
+        self.emit_node(while_stmt.cond)
+        self.emit(CHECK_BOOL, CHECK_WHILE)
+        self.emit(POP_TOP)
+
+        start = self.code_object.here()
+        if while_stmt.do_while:
+            self.emit_node(while_stmt.simple_instr)
+            self.emit_node(while_stmt.cond)
+            self.emit(JUMP_IF_TRUE, start)
+        else:
+            self.emit_node(while_stmt.cond)
+            to_end = self.emit(JUMP_IF_FALSE)
+            self.emit_node(while_stmt.simple_instr)
+            self.emit(JUMP, start)
+            self.code_object.patch(to_end, self.code_object.here())
+
+    def visit_not_expr(self, not_expr):
+        self.emit_node(not_expr.bool_expr)
+        self.emit(NOT)
+
+    def visit_boolop_expr(self, boolop_expr):
+        self.emit_node(boolop_expr.bool_expr0)
+        self.emit_node(boolop_expr.bool_expr1)
+        self.emit(BOOL_OP, bool_ops.index(boolop_expr.bool_op))
+
+    def visit_num_relop_expr(self, num_relop_expr):
+        num_rel = num_relop_expr.num_rel
+        if num_rel not in num_rels:
+            error('', f'Relational operator \'{num_rel}\' not supported for type NUM.')
+        self.emit_node(num_relop_expr.num_expr0)
+        self.emit_node(num_relop_expr.num_expr1)
+        self.emit(COMPARE_NUM, num_rels.index(num_rel))
+
+    def visit_str_relop_expr(self, str_relop_expr):
+        self.emit_node(str_relop_expr.str_expr0)
+        self.emit_node(str_relop_expr.str_expr1)
+        self.emit(COMPARE_STR, str_rels.index(str_relop_expr.str_rel))
+
+    def visit_print_stmt(self, print_stmt):
+        self.emit_node(print_stmt.expr)
+        self.emit(PRINT)
+
+    # ARRAY values are only supported by the tree-walking interpreter.
+
+    def visit_index_assign_stmt(self, index_assign_stmt):
+        self.array_unsupported(index_assign_stmt)
+
+    def visit_index_expr(self, index_expr):
+        self.array_unsupported(index_expr)
+
+    def visit_reduction_expr(self, reduction_expr):
+        self.array_unsupported(reduction_expr)
+
+    def visit_array_expr(self, array_expr):
+        self.array_unsupported(array_expr)
+
+    def visit_readarray_expr(self, readarray_expr):
+        self.array_unsupported(readarray_expr)
+
+    def array_unsupported(self, node):
+        error(node.lineno, 'ARRAY values are only supported by the tree backend.')
+
+
+def compile_program(program):
+    """
+    Compiles a parsed ''program'' into bytecode.
+    :param program: Root of the AST.
+    :return: The resulting ''CodeObject''.
+    """
+    return Compiler().compile(program)
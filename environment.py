@@ -1,4 +1,5 @@
 from errors import error
+from rope import STRING, lock_type
 
 
 class Environment:
@@ -17,7 +18,7 @@ class Environment:
         existing_value = self.values.get(name)
         if existing_value is not None:
             try:
-                assert isinstance(value, type(existing_value))
+                assert isinstance(value, lock_type(existing_value))
             except AssertionError:
                 error('', 'Variable type does not match.')
         self.values[name] = value
@@ -33,3 +34,66 @@ class Environment:
         if value is None:
             error('', 'Variable not declared.')
         return value
+
+
+class SlotEnvironment:
+    def __init__(self, size):
+        """
+        Initializes an environment holding the variables of a program
+        resolved by the ''Resolver'', indexed by their slots.
+        :param size: Number of slots.
+        """
+        self.values = [None] * size
+        self.types = [None] * size
+
+    def assign(self, slot, value):
+        """
+        Assigns the ''value'' to the given ''slot''. The type of the
+        first value assigned to a slot is recorded, and every
+        following assignment must match it, otherwise an error
+        is thrown.
+        :param slot: Slot of the variable.
+        :param value: Value of the variable.
+        """
+        locked_type = self.types[slot]
+        if locked_type is None:
+            self.types[slot] = lock_type(value)
+        elif value.__class__ is not locked_type and not isinstance(value, locked_type):
+            error('', 'Variable type does not match.')
+        self.values[slot] = value
+
+    def get(self, slot):
+        """
+        Returns the value held by the ''slot'', if it has been
+        previously assigned. Throws an error otherwise.
+        :param slot: Slot of the variable to retrieve.
+        :return: Value of that variable.
+        """
+        value = self.values[slot]
+        if value is None:
+            error('', 'Variable not declared.')
+        return value
+
+
+class GovernedSlotEnvironment(SlotEnvironment):
+    def __init__(self, size, governor):
+        """
+        Initializes a ''SlotEnvironment'' which accounts for the
+        length of the STRING values held by its variables in the
+        ''governor'', failing once it exceeds its limit.
+        :param size: Number of slots.
+        :param governor: ''Governor'' of the run.
+        """
+        super().__init__(size)
+        self.governor = governor
+
+    def assign(self, slot, value):
+        locked_type = self.types[slot]
+        if locked_type is None:
+            self.types[slot] = lock_type(value)
+        elif value.__class__ is not locked_type and not isinstance(value, locked_type):
+            error('', 'Variable type does not match.')
+        if value.__class__ in STRING:
+            old_value = self.values[slot]
+            self.governor.add_string_bytes(len(value) - (0 if old_value is None else len(old_value)))
+        self.values[slot] = value
@@ -1,7 +1,20 @@
 import sys
 
+# Output of the running program, which is flushed before an error
+# is reported, so that the error follows everything printed before it.
+output = None
+
 
 def error(lineno, msg):
+    if output is not None:
+        output.flush()
+    err = f'\nLine {lineno}: {msg}\n'
+    sys.stderr.write(err)
+    exit(1)
+
+
+def warning(lineno, msg):
+    if output is not None:
+        output.flush()
     err = f'\nLine {lineno}: {msg}\n'
     sys.stderr.write(err)
-    exit()
@@ -0,0 +1,123 @@
+from collections import Counter
+import operator
+
+import ast
+
+RELOPS = {'=': operator.eq, '<': operator.lt, '<=': operator.le, '>': operator.gt, '>=': operator.ge,
+          '<>': operator.ne}
+
+
+# Fused nodes. The ''Fuser'' turns nodes matching common idioms into
+# these, by changing their class and recording what the interpreter
+# needs to run them without visiting their children. They keep all
+# their children, and visitors other than the interpreter visit them
+# as the nodes they were made from.
+
+class IncrementStmt(ast.AssignStmt):
+    """
+    ''x := x + k'' or ''x := x - k'', where ''k'' is a NUM literal
+    or a variable.
+    """
+
+    def accept(self, visitor):
+        return visitor.visit_increment_stmt(self)
+
+
+class CountedWhileStmt(ast.WhileStmt):
+    """
+    ''while'' loop whose condition compares a variable with a NUM
+    literal or another variable, e.g. ''while i < n do''.
+    """
+
+    def accept(self, visitor):
+        return visitor.visit_counted_while_stmt(self)
+
+
+class CompareBranchStmt(ast.IfStmt):
+    """
+    ''if'' statement whose condition compares a variable with a NUM
+    literal or another variable, e.g. ''if a = b then''.
+    """
+
+    def accept(self, visitor):
+        return visitor.visit_compare_branch_stmt(self)
+
+
+def is_int_literal(node):
+    return isinstance(node, ast.Literal) and node.value.__class__ is int
+
+
+def variable_operand(node):
+    """
+    :return: (slot, value) of a variable or NUM literal operand,
+    where only one of them is not None, or None for other operands.
+    """
+    if isinstance(node, ast.Ident):
+        return node.slot, None
+    if is_int_literal(node):
+        return None, node.value
+    return None
+
+
+class Fuser:
+    def __init__(self):
+        """
+        Initializes a pass which fuses the statements of a resolved
+        program matching common idioms into single nodes, which the
+        interpreter runs without visiting their children.
+        """
+        # Number of fused statements of every kind.
+        self.fused = Counter()
+
+    def fuse(self, program):
+        """
+        Fuses the statements of ''program'' in place.
+        :param program: Root of the resolved AST.
+        :return: ''Counter'' of the fused statements of every kind.
+        """
+        for node in ast.walk(program):
+            cls = node.__class__
+            if cls is ast.AssignStmt:
+                self.fuse_increment(node)
+            elif cls is ast.WhileStmt:
+                if self.fuse_comparison(node):
+                    node.__class__ = CountedWhileStmt
+                    self.fused['CountedWhileStmt'] += 1
+            elif cls is ast.IfStmt:
+                if self.fuse_comparison(node):
+                    node.__class__ = CompareBranchStmt
+                    self.fused['CompareBranchStmt'] += 1
+        return self.fused
+
+    def fuse_increment(self, assign_stmt):
+        expr = assign_stmt.expr
+        if not (isinstance(expr, ast.BinopExpr) and expr.op in ('+', '-')):
+            return
+        if not (isinstance(expr.num_expr0, ast.Ident) and expr.num_expr0.name == assign_stmt.ident):
+            return
+        step = variable_operand(expr.num_expr1)
+        if step is None:
+            return
+        assign_stmt.step_slot, assign_stmt.step = step
+        assign_stmt.add = expr.op == '+'
+        assign_stmt.__class__ = IncrementStmt
+        self.fused['IncrementStmt'] += 1
+
+    def fuse_comparison(self, stmt):
+        """
+        Records the operands of the condition of an ''if'' or ''while''
+        statement comparing a variable with a NUM literal or another
+        variable in ''stmt''.
+        :return: Whether the condition matched.
+        """
+        cond = stmt.cond
+        if not (cond.__class__ is ast.NumRelopExpr and isinstance(cond.num_expr0, ast.Ident)
+                and cond.num_rel in RELOPS):
+            return False
+        right = variable_operand(cond.num_expr1)
+        if right is None:
+            return False
+        stmt.left_slot = cond.num_expr0.slot
+        stmt.right_slot, stmt.right = right
+        stmt.operate = RELOPS[cond.num_rel]
+        return True
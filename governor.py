@@ -0,0 +1,78 @@
+import time
+
+# Number of loop iterations between two checks of the clock.
+CHECK_INTERVAL = 1024
+
+
+class LimitExceeded(Exception):
+    def __init__(self, limit, maximum):
+        """
+        Raised when a run exceeds one of the limits of its ''Governor''.
+        :param limit: Name of the limit: 'steps', 'time' or 'string_bytes'.
+        :param maximum: Value of the limit.
+        """
+        super().__init__(f'Resource limit exceeded: {limit} (maximum {maximum}).')
+        self.limit = limit
+        self.maximum = maximum
+
+
+class Governor:
+    def __init__(self, max_steps=None, max_time=None, max_string_bytes=None):
+        """
+        Initializes the limits of a run. Steps are loop iterations,
+        counted where a loop jumps back to its condition, so that
+        statements outside of loops, which run at most once, cost
+        nothing to check.
+        :param max_steps: Maximum number of loop iterations.
+        :param max_time: Maximum wall-clock time in seconds, checked
+        every ''CHECK_INTERVAL'' loop iterations.
+        :param max_string_bytes: Maximum total length of the STRING
+        values held by the variables.
+        """
+        self.max_steps = max_steps
+        self.max_time = max_time
+        self.max_string_bytes = max_string_bytes
+        self.start()
+
+    def start(self):
+        """
+        Resets the counters and starts the clock for a new run.
+        """
+        self.steps = 0
+        self.string_bytes = 0
+        self.deadline = None if self.max_time is None else time.perf_counter() + self.max_time
+        self.batch = self.next_batch()
+        # Decremented by the interpreter on every loop iteration,
+        # ''check'' is called once it drops to zero.
+        self.countdown = self.batch
+
+    def next_batch(self):
+        """
+        :return: Number of loop iterations until the next check.
+        """
+        if self.max_steps is None:
+            return CHECK_INTERVAL
+        return max(1, min(CHECK_INTERVAL, self.max_steps + 1 - self.steps))
+
+    def check(self):
+        """
+        Accounts for the loop iterations since the last check and
+        checks the limits on steps and time. The countdown may have
+        run past zero, e.g. for a loop run in closed form.
+        """
+        self.steps += self.batch - self.countdown
+        if self.max_steps is not None and self.steps > self.max_steps:
+            raise LimitExceeded('steps', self.max_steps)
+        if self.deadline is not None and time.perf_counter() > self.deadline:
+            raise LimitExceeded('time', self.max_time)
+        self.batch = self.next_batch()
+        self.countdown = self.batch
+
+    def add_string_bytes(self, size):
+        """
+        Accounts for a change of ''size'' of the STRING values held
+        by the variables, and checks the limit on their total.
+        """
+        self.string_bytes += size
+        if self.max_string_bytes is not None and self.string_bytes > self.max_string_bytes:
+            raise LimitExceeded('string_bytes', self.max_string_bytes)
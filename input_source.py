@@ -0,0 +1,142 @@
+from abc import ABC, abstractmethod
+import io
+import sys
+
+from errors import error
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class InputSource(ABC):
+    """
+    Source of the lines read by ''readint'' and ''readstr''. Like
+    ''input()'', reading past the end of the input raises ''EOFError''.
+    """
+
+    @abstractmethod
+    def read_line(self):
+        pass
+
+    def read_int(self):
+        line = self.read_line()
+        try:
+            return int(line)
+        except ValueError:
+            error('', 'Input to readint must be of type NUM.')
+
+
+class ConsoleInput(InputSource):
+    """
+    Reads every line with ''input()'', e.g. for interactive use.
+    """
+
+    def read_line(self):
+        return input()
+
+
+class BufferedInput(InputSource):
+    def __init__(self, stream=None, chunk_size=DEFAULT_CHUNK_SIZE, encoding=None):
+        """
+        Initializes an input reading a binary stream in large chunks
+        and splitting each of them into lines at once.
+        :param stream: Binary stream to read from, e.g. a file opened
+        in binary mode, standard input by default.
+        :param chunk_size: Maximum number of bytes read at once.
+        :param encoding: Encoding of the lines read by ''readstr'',
+        the one of standard input by default, with the same handling
+        of invalid bytes.
+        """
+        self.stream = sys.stdin.buffer if stream is None else stream
+        self.chunk_size = chunk_size
+        if encoding is None:
+            encoding = getattr(sys.stdin, 'encoding', None) or 'utf-8'
+            self.errors = getattr(sys.stdin, 'errors', None) or 'strict'
+        else:
+            self.errors = 'strict'
+        self.encoding = encoding
+        # Unlike read, read1 does not wait for a whole chunk to arrive.
+        self.read = getattr(self.stream, 'read1', self.stream.read)
+        self.lines = []
+        self.index = 0
+        self.partial = b''
+
+    def fill(self):
+        """
+        Reads chunks until at least one more line is complete, and
+        splits them into lines.
+        :return: Bytes of the next line, without the trailing newline.
+        """
+        while True:
+            chunk = self.read(self.chunk_size)
+            if not chunk:
+                if not self.partial:
+                    raise EOFError('EOF when reading a line')
+                # The last line does not end with a newline.
+                line = self.partial
+                self.partial = b''
+                return line
+            # Only the incomplete last line of a chunk is copied again.
+            lines = (self.partial + chunk).split(b'\n') if self.partial else chunk.split(b'\n')
+            self.partial = lines.pop()
+            if lines:
+                self.lines = lines
+                self.index = 1
+                return lines[0]
+
+    def next_line(self):
+        """
+        :return: Bytes of the next line, without the trailing newline.
+        """
+        index = self.index
+        if index < len(self.lines):
+            self.index = index + 1
+            return self.lines[index]
+        return self.fill()
+
+    def read_line(self):
+        return self.next_line().decode(self.encoding, self.errors)
+
+    def read_int(self):
+        # Same as next_line, inlined since readint is the most
+        # frequently called one.
+        index = self.index
+        if index < len(self.lines):
+            self.index = index + 1
+            line = self.lines[index]
+        else:
+            line = self.fill()
+        try:
+            return int(line)
+        except ValueError:
+            pass
+        # int() of bytes only accepts ASCII digits, unlike int() of str.
+        try:
+            return int(line.decode(self.encoding, self.errors))
+        except ValueError:
+            error('', 'Input to readint must be of type NUM.')
+
+
+class StringInput(BufferedInput):
+    def __init__(self, text):
+        """
+        Initializes an input reading the lines of ''text'', e.g. for
+        tests or when embedding the interpreter.
+        """
+        super().__init__(io.BytesIO(text.encode('utf-8')), encoding='utf-8')
+
+
+def make_input(mode='auto'):
+    """
+    Creates an input reading from standard input.
+    :param mode: 'buffered' for a ''BufferedInput'', 'console' for
+    a ''ConsoleInput'', or 'auto' to use the former unless standard
+    input is a terminal.
+    :return: The new ''InputSource''.
+    """
+    if mode == 'auto':
+        isatty = getattr(sys.stdin, 'isatty', None)
+        buffered = getattr(sys.stdin, 'buffer', None) is not None
+        mode = 'console' if not buffered or isatty is not None and isatty() else 'buffered'
+    if mode == 'console':
+        return ConsoleInput()
+    return BufferedInput()
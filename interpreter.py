@@ -1,21 +1,157 @@
+import argparse
+import importlib
 import sys
 
 from visitor import Visitor
-from parser_prim import make_parser
-from errors import error
-from environment import Environment
+import parser_prim
+import parser_rd
+from errors import error, warning
+from environment import Environment, SlotEnvironment, GovernedSlotEnvironment
+from resolver import Resolver
+from typechecker import TypeChecker
+from fusion import Fuser
+from closed_form import LoopAnalyzer, NotProvable
+from tracing import HOT_LOOP_THRESHOLD, MAX_TRACES, TracingJit
+from optimizer import PassManager, passes
+from output import OUTPUTS, Output, BufferedOutput, make_output
+from input_source import InputSource, BufferedInput, StringInput, make_input
+from governor import Governor, LimitExceeded
+from search_index import SearchIndex
+from quickening import Quickening, INT_BINOPS, INT_RELOPS, FLAT_STR_RELOPS
+from rope import MIN_VIEW_LENGTH, STRING, concatenate, find, flatten, slice_string
+
+BACKENDS = ('tree', 'vm', 'closure', 'python')
+PARSERS = {'ply': parser_prim.parse, 'rd': parser_rd.parse}
+
+# The ''arrays'' module, which imports NumPy. It is only loaded once a
+# program creates an ARRAY, so that other programs start as fast.
+arrays = None
+
+
+def load_arrays():
+    """
+    :return: The ''arrays'' module, imported on the first call.
+    """
+    global arrays
+    if arrays is None:
+        arrays = importlib.import_module('arrays')
+    return arrays
+
+
+def is_array(value):
+    """
+    :return: Whether ''value'' is an ARRAY, which no value can be
+    before ''arrays'' has been loaded.
+    """
+    return arrays is not None and value.__class__ is arrays.ARRAY
 
 
 class Interpreter(Visitor):
-    def __init__(self, input_str):
+    # Whether hot loops are handed over to the tracing JIT.
+    tracing = True
+    # Whether loops are run in closed form when they have one.
+    closed_forms = True
+
+    def __init__(self, input_str=None, resolve=True, program=None, output=None, input_source=None,
+                 environment=None, governor=None, quickening=None, jit=None):
         """
         Initializes the interpreter and starts interpretation.
         :param input_str: Program to interpret.
+        :param resolve: Whether to resolve variables to slots of
+        a ''SlotEnvironment'' before execution, instead of looking
+        them up by name.
+        :param program: Already parsed program, interpreted
+        instead of ''input_str''. If it has already been resolved,
+        it is not modified in any way.
+        :param output: ''Output'' receiving the printed values,
+        by default one created by ''make_output''.
+        :param input_source: ''InputSource'' read by ''readint'' and
+        ''readstr'', by default one created by ''make_input''.
+        :param environment: Environment to run in, a ''SlotEnvironment''
+        large enough for the resolved program or an ''Environment'' if
+        ''resolve'' is not set. A new one is created by default. The
+        variables it already holds must have the types the program
+        assigns to them, which the ''TypeChecker'' relies on.
+        :param governor: ''Governor'' limiting the run, which raises
+        ''LimitExceeded'' when one of its limits is exceeded. STRING
+        lengths are only accounted in a ''GovernedSlotEnvironment'',
+        which is created by default.
+        :param quickening: ''Quickening'' holding the nodes specialized
+        to the values they see during the run, a new one by default.
+        It is emptied at the end of the run, keeping its counters.
+        :param jit: ''TracingJit'' compiling the hot loops of the run,
+        a new one by default. Loops are only traced in a
+        ''SlotEnvironment''.
+        """
+        ast = program
+        if ast is None:
+            ast = parser_prim.parse(input_str)
+        if resolve:
+            slot_count = ast.slot_count
+            if slot_count is None:
+                slot_count = Resolver().resolve(ast)
+                TypeChecker().check(ast)
+                Fuser().fuse(ast)
+                LoopAnalyzer().analyze(ast)
+            if environment is None:
+                if governor is None:
+                    environment = SlotEnvironment(slot_count)
+                else:
+                    environment = GovernedSlotEnvironment(slot_count, governor)
+        else:
+            environment = Environment() if environment is None else environment
+        self.start_run(environment, output, input_source, governor, quickening, jit)
+        with self.output:
+            try:
+                ast.accept(self)
+            finally:
+                self.quickening.clear()
+
+    def start_run(self, environment, output=None, input_source=None, governor=None, quickening=None,
+                  jit=None):
         """
-        parser = make_parser()
-        ast = parser.parse(input_str)
-        self.environment = Environment()
-        ast.accept(self)
+        Sets up the state of a run, shared by every way of starting
+        one, and starts the ''governor''.
+        :param environment: Environment to run in.
+        :param output: ''Output'' receiving the printed values,
+        by default one created by ''make_output''.
+        :param input_source: ''InputSource'' read by ''readint'' and
+        ''readstr'', by default one created by ''make_input''.
+        :param governor: ''Governor'' limiting the run, if any.
+        :param quickening: ''Quickening'' holding the specialized
+        nodes, a new one by default.
+        :param jit: ''TracingJit'' compiling the hot loops of the run,
+        a new one by default. Loops are only traced in a
+        ''SlotEnvironment''.
+        """
+        self.environment = environment
+        # Values of a ''SlotEnvironment'', which specialized variables
+        # are read from directly.
+        self.slot_values = None
+        if isinstance(environment, SlotEnvironment):
+            self.slot_values = environment.values
+        # Values of a ''SlotEnvironment'' without a governor, which
+        # assignments proven to match the type of their variable
+        # store into directly.
+        self.assign_values = None
+        if environment.__class__ is SlotEnvironment:
+            self.assign_values = environment.values
+        self.output = make_output() if output is None else output
+        self.input_source = make_input() if input_source is None else input_source
+        self.governor = governor
+        if governor is not None:
+            governor.start()
+        # Indexes of the strings searched repeatedly by ''position''.
+        self.search_index = SearchIndex()
+        self.quickening = Quickening() if quickening is None else quickening
+        self.operators = self.quickening.operators
+        # Value of the condition of every ''if'' statement run by the
+        # iteration the tracing JIT records, if any.
+        self.branches = None
+        self.jit = None
+        if self.tracing and self.slot_values is not None:
+            self.jit = TracingJit() if jit is None else jit
+        self.closed_form_loops = self.closed_forms and self.slot_values is not None
 
     def evaluate(self, expr):
         """
@@ -63,7 +199,47 @@ class Interpreter(Visitor):
         assigns it to its identifier.
         """
         value = self.evaluate(assign_stmt.expr)
-        self.environment.assign(assign_stmt.ident, value)
+        if assign_stmt.type_safe and self.assign_values is not None:
+            self.assign_values[assign_stmt.slot] = value
+        else:
+            self.environment.assign(assign_stmt.slot, value)
+
+    def visit_index_assign_stmt(self, index_assign_stmt):
+        """
+        Evaluates the index and the expression of ''index_assign_stmt''
+        and assigns the value to that element of its ARRAY in place.
+        """
+        array = self.evaluate(index_assign_stmt.ident)
+        index = self.evaluate(index_assign_stmt.num_expr)
+        value = self.evaluate(index_assign_stmt.expr)
+        if not index_assign_stmt.type_safe:
+            try:
+                assert is_array(array)
+                assert isinstance(index, int)
+                assert isinstance(value, int)
+            except AssertionError:
+                error('', 'Array element assignment requires an ARRAY, a NUM index and a NUM value.')
+        arrays.set_element(array, index, value)
+
+    def visit_increment_stmt(self, increment_stmt):
+        """
+        Adds or subtracts the step of ''increment_stmt'' from its
+        variable in place, falling back to the generic assignment
+        unless both are NUM. NUM values are stored straight into the
+        slot, also in a ''GovernedSlotEnvironment'', which only
+        accounts for STRING values.
+        """
+        values = self.slot_values
+        if values is not None:
+            slot = increment_stmt.slot
+            value = values[slot]
+            step = increment_stmt.step
+            if increment_stmt.step_slot is not None:
+                step = values[increment_stmt.step_slot]
+            if value.__class__ is int and step.__class__ is int:
+                values[slot] = value + step if increment_stmt.add else value - step
+                return
+        self.visit_assign_stmt(increment_stmt)
 
     def visit_ident(self, ident):
         """
@@ -71,7 +247,13 @@ class Interpreter(Visitor):
         returns it.
         :return: Value assigned to ''ident''.
         """
-        return self.environment.get(ident.name)
+        values = self.slot_values
+        if values is not None:
+            # Read straight from the slot, unless it is undeclared.
+            value = values[ident.slot]
+            if value is not None:
+                return value
+        return self.environment.get(ident.slot)
 
     def visit_literal(self, literal):
         """
@@ -82,15 +264,10 @@ class Interpreter(Visitor):
     def visit_readint_expr(self, readint_expr):
         """
         Evaluates a ''readint_expr'' by reading a NUM
-        from standard input.
+        from the input source.
         :return: Value of the ''readint_expr'' expression.
         """
-        i = input()
-        try:
-            i = int(i)
-        except ValueError:
-            error('', 'Input to readint must be of type NUM.')
-        return i
+        return self.input_source.read_int()
 
     def visit_unary_expr(self, unary_expr):
         """
@@ -104,17 +281,37 @@ class Interpreter(Visitor):
         """
         Evaluates ''binop_expr'' on both sides of the binary
         operator and applies the operator to the resulting
-        values.
+        values. Once it has NUM operands, it is specialized to its
+        operator in the side table of the ''quickening'', until its
+        operands are not NUM.
         :return: Value of the expression.
         """
         left = self.evaluate(binop_expr.num_expr0)
         right = self.evaluate(binop_expr.num_expr1)
+        if left.__class__ is int and right.__class__ is int:
+            operate = self.operators.get(binop_expr)
+            if operate is not None:
+                return operate(left, right)
+            self.quickening.quicken(binop_expr, INT_BINOPS[binop_expr.op])
+        elif binop_expr in self.operators:
+            self.quickening.deoptimize(binop_expr)
+        return self.binop(binop_expr, left, right)
+
+    def binop(self, binop_expr, left, right):
+        """
+        Applies the operator of ''binop_expr'' to the values of its
+        operands.
+        :return: Value of the expression.
+        """
         op = binop_expr.op
-        try:
-            assert isinstance(left, int)
-            assert isinstance(right, int)
-        except AssertionError:
-            error('', f'Binary operator {op} can only be applied to arguments of type NUM.')
+        if not binop_expr.type_safe:
+            try:
+                assert isinstance(left, int)
+                assert isinstance(right, int)
+            except AssertionError:
+                if is_array(left) or is_array(right):
+                    return arrays.elementwise(op, left, right)
+                error('', f'Binary operator {op} can only be applied to arguments of type NUM.')
 
         if op == '+':
             return left + right
@@ -137,14 +334,16 @@ class Interpreter(Visitor):
     def visit_len_expr(self, len_expr):
         """
         Evaluates a ''str_expr'' passed into ''len_expr'' and
-        computes its length.
+        computes its length, or the number of elements of an ARRAY.
         :return: Length of the ''str_expr''.
         """
         value = self.evaluate(len_expr.str_expr)
-        try:
-            assert isinstance(value, str)
-        except AssertionError:
-            error('', 'Argument passed to length() must be of type STRING.')
+        if not len_expr.type_safe:
+            try:
+                assert isinstance(value, STRING)
+            except AssertionError:
+                if not is_array(value):
+                    error('', 'Argument passed to length() must be of type STRING.')
         return len(value)
 
     def visit_pos_expr(self, pos_expr):
@@ -157,23 +356,53 @@ class Interpreter(Visitor):
         """
         str_expr0 = self.evaluate(pos_expr.str_expr0)
         str_expr1 = self.evaluate(pos_expr.str_expr1)
-        try:
-            assert isinstance(str_expr0, str)
-            assert isinstance(str_expr1, str)
-        except AssertionError:
-            error('', 'Arguments passed to position() must be of type STRING.')
+        if not pos_expr.type_safe:
+            try:
+                assert isinstance(str_expr0, STRING)
+                assert isinstance(str_expr1, STRING)
+            except AssertionError:
+                error('', 'Arguments passed to position() must be of type STRING.')
 
-        pos = str_expr0.find(str_expr1)
+        pos = find(str_expr0, str_expr1, self.search_index)
         return 0 if pos == -1 else pos
 
+    def visit_index_expr(self, index_expr):
+        """
+        Evaluates the ARRAY and the ''num_expr'' of ''index_expr''.
+        :return: Element of the ARRAY at the 1-based index.
+        """
+        array = self.evaluate(index_expr.ident)
+        index = self.evaluate(index_expr.num_expr)
+        if not index_expr.type_safe:
+            try:
+                assert is_array(array)
+                assert isinstance(index, int)
+            except AssertionError:
+                error('', 'Only an ARRAY can be indexed, with a NUM index.')
+        return arrays.get_element(array, index)
+
+    def visit_reduction_expr(self, reduction_expr):
+        """
+        Evaluates the ARRAY passed into ''reduction_expr'' and reduces
+        its elements in a single NumPy operation.
+        :return: Sum, minimum or maximum of the elements.
+        """
+        reduction = reduction_expr.reduction
+        array = self.evaluate(reduction_expr.array_expr)
+        if not reduction_expr.type_safe:
+            try:
+                assert is_array(array)
+            except AssertionError:
+                error('', f'Argument passed to {reduction}() must be of type ARRAY.')
+        return arrays.reduce(reduction, array)
+
     def visit_readstr_expr(self, readstr_expr):
         """
         Evaluates a ''readstr_expr'' by reading a STRING from
-        the standard input.
-        :return: STRING read from the standard input.
+        the input source.
+        :return: STRING read from the input source.
         """
-        i = input()
-        return i
+        return self.input_source.read_line()
 
     def visit_concat_expr(self, concat_expr):
         """
@@ -183,13 +412,14 @@ class Interpreter(Visitor):
         """
         str_expr0 = self.evaluate(concat_expr.str_expr0)
         str_expr1 = self.evaluate(concat_expr.str_expr1)
-        try:
-            assert isinstance(str_expr0, str)
-            assert isinstance(str_expr1, str)
-        except AssertionError:
-            error('', 'Arguments passed to concatenate() must be of type STRING.')
+        if not concat_expr.type_safe:
+            try:
+                assert isinstance(str_expr0, STRING)
+                assert isinstance(str_expr1, STRING)
+            except AssertionError:
+                error('', 'Arguments passed to concatenate() must be of type STRING.')
 
-        return ''.join([str_expr0, str_expr1])
+        return concatenate(str_expr0, str_expr1)
 
     def visit_substr_expr(self, substr_expr):
         """
@@ -203,36 +433,95 @@ class Interpreter(Visitor):
         string = self.evaluate(substr_expr.str_expr)
         start = self.evaluate(substr_expr.num_expr0)
         end = self.evaluate(substr_expr.num_expr1)
-        try:
-            assert isinstance(string, str)
-            assert isinstance(start, int)
-            assert isinstance(end, int)
-        except AssertionError:
-            error('', 'Arguments passed to substring() must be of appropriate types.')
+        if not substr_expr.type_safe:
+            try:
+                assert isinstance(string, STRING)
+                assert isinstance(start, int)
+                assert isinstance(end, int)
+            except AssertionError:
+                error('', 'Arguments passed to substring() must be of appropriate types.')
 
         if start < 1 or end < 0:
             return ''
-        return string[start-1:end]
+        if string.__class__ is str and end - start < MIN_VIEW_LENGTH:
+            return string[start-1:end]
+        return slice_string(string, start - 1, end)
+
+    def visit_array_expr(self, array_expr):
+        """
+        Evaluates the ''num_expr'' passed into ''array_expr''.
+        :return: ARRAY of that many zeros.
+        """
+        length = self.evaluate(array_expr.num_expr)
+        if not array_expr.type_safe:
+            try:
+                assert isinstance(length, int)
+            except AssertionError:
+                error('', 'Argument passed to array() must be of type NUM.')
+        return load_arrays().make_array(length)
+
+    def visit_readarray_expr(self, readarray_expr):
+        """
+        Evaluates a ''readarray_expr'' by reading a line of NUM
+        values from the input source.
+        :return: ARRAY of the values.
+        """
+        return load_arrays().parse_array(self.input_source.read_line())
 
     def visit_if_stmt(self, if_stmt):
         """
         Evaluates the ''if_stmt'' condition and executes
         one of the branching statements based on that
-        evaluation.
+        evaluation. While the tracing JIT records an iteration,
+        the value of the condition is recorded.
         """
         condition = self.evaluate(if_stmt.cond)
+        if self.branches is not None:
+            self.branches[if_stmt] = condition
+        self.branch(if_stmt, condition)
+
+    def branch(self, if_stmt, condition):
+        """
+        Executes one of the branching statements of ''if_stmt'' based
+        on the value of its condition.
+        """
         true_branch = if_stmt.true_simple_instr
         else_branch = if_stmt.else_simple_instr
-        try:
-            assert isinstance(condition, bool)
-        except AssertionError:
-            error('', 'If clause condition must be a boolean expression.')
+        if not if_stmt.type_safe:
+            try:
+                assert isinstance(condition, bool)
+            except AssertionError:
+                error('', 'If clause condition must be a boolean expression.')
         if condition:
             self.execute(true_branch)
         else:
             if else_branch is not None:
                 self.execute(else_branch)
 
+    def visit_compare_branch_stmt(self, if_stmt):
+        """
+        Compares the variable in the condition of ''if_stmt'' straight
+        from its slot and executes one of the branching statements,
+        falling back to the generic ''if_stmt'' unless both operands
+        are NUM.
+        """
+        values = self.slot_values
+        if values is not None:
+            left = values[if_stmt.left_slot]
+            right = if_stmt.right
+            if if_stmt.right_slot is not None:
+                right = values[if_stmt.right_slot]
+            if left.__class__ is int and right.__class__ is int:
+                condition = if_stmt.operate(left, right)
+                if self.branches is not None:
+                    self.branches[if_stmt] = condition
+                if condition:
+                    self.execute(if_stmt.true_simple_instr)
+                elif if_stmt.else_simple_instr is not None:
+                    self.execute(if_stmt.else_simple_instr)
+                return
+        self.visit_if_stmt(if_stmt)
+
     def visit_while_stmt(self, while_stmt):
         """
         Evaluates the ''while_stmt'' condition in a while
@@ -245,8 +534,29 @@ class Interpreter(Visitor):
             assert isinstance(self.evaluate(condition), bool)
         except AssertionError:
             error('', 'While loop condition must be a boolean expression.')
+        if while_stmt.closed_form is not None and self.closed_form_loops and self.run_closed_form(while_stmt):
+            return
 
-        if while_stmt.do_while:
+        governor = self.governor
+        if self.jit is not None:
+            self.traced_loop(while_stmt)
+        elif governor is not None:
+            # Limits are checked on every jump back to the condition.
+            if while_stmt.do_while:
+                while True:
+                    self.execute(simple_instr)
+                    if not self.evaluate(condition):
+                        break
+                    governor.countdown -= 1
+                    if governor.countdown <= 0:
+                        governor.check()
+            else:
+                while self.evaluate(condition):
+                    self.execute(simple_instr)
+                    governor.countdown -= 1
+                    if governor.countdown <= 0:
+                        governor.check()
+        elif while_stmt.do_while:
             while True:
                 self.execute(simple_instr)
                 if not self.evaluate(condition):
@@ -255,16 +565,136 @@ class Interpreter(Visitor):
             while self.evaluate(condition):
                 self.execute(simple_instr)
 
+    def run_closed_form(self, while_stmt):
+        """
+        Runs ''while_stmt'' in closed form, assigning its variables
+        their final values without running its iterations, unless
+        that is not certain to have the same result. The governor, if
+        any, counts its back-edges and checks its limits first.
+        :return: Whether the loop has been run.
+        """
+        try:
+            iterations, values = while_stmt.closed_form.run(self.slot_values, while_stmt.do_while)
+        except NotProvable:
+            return False
+        governor = self.governor
+        if governor is not None and iterations > 0:
+            # The first iteration of a ''do ... while'' loop does not
+            # jump back.
+            governor.countdown -= iterations - 1 if while_stmt.do_while else iterations
+            governor.check()
+        for slot, value in values.items():
+            self.environment.assign(slot, value)
+        return True
+
+    def traced_loop(self, while_stmt):
+        """
+        Runs ''while_stmt'' once its condition has been checked,
+        counting its back-edges, and hands it over to the tracing JIT
+        once it is hot. Back-edges are counted by the governor, if
+        any, at the same points as in a generic ''while_stmt''.
+        """
+        condition = while_stmt.cond
+        simple_instr = while_stmt.simple_instr
+        jit = self.jit
+        governor = self.governor
+        count_before = governor is not None and while_stmt.do_while
+        count_after = governor is not None and not while_stmt.do_while
+        if while_stmt.do_while:
+            self.execute(simple_instr)
+        countdown = jit.countdown(while_stmt)
+        back_edges = 0
+        while True:
+            if back_edges == countdown:
+                if jit.run(while_stmt, self):
+                    return
+                countdown = -1
+            if not self.evaluate(condition):
+                break
+            if count_before:
+                governor.countdown -= 1
+                if governor.countdown <= 0:
+                    governor.check()
+            self.execute(simple_instr)
+            back_edges += 1
+            if count_after:
+                governor.countdown -= 1
+                if governor.countdown <= 0:
+                    governor.check()
+        jit.leave(while_stmt, back_edges)
+
+    def visit_counted_while_stmt(self, while_stmt):
+        """
+        Runs a ''while_stmt'' whose condition compares a variable,
+        reading its operands straight from their slots on every
+        iteration. The condition is evaluated as a node whenever they
+        are not both NUM. Back-edges are counted by the governor, if
+        any, at the same points as in a generic ''while_stmt''.
+        """
+        values = self.slot_values
+        if values is None:
+            self.visit_while_stmt(while_stmt)
+            return
+        condition = while_stmt.cond
+        simple_instr = while_stmt.simple_instr
+        try:
+            assert isinstance(self.evaluate(condition), bool)
+        except AssertionError:
+            error('', 'While loop condition must be a boolean expression.')
+        if while_stmt.closed_form is not None and self.closed_form_loops and self.run_closed_form(while_stmt):
+            return
+
+        left_slot = while_stmt.left_slot
+        right_slot = while_stmt.right_slot
+        right = while_stmt.right
+        operate = while_stmt.operate
+        jit = self.jit
+        governor = self.governor
+        # A ''do ... while'' loop jumps back after its condition, a
+        # ''while'' loop after its body.
+        count_before = governor is not None and while_stmt.do_while
+        count_after = governor is not None and not while_stmt.do_while
+        if while_stmt.do_while:
+            self.execute(simple_instr)
+        countdown = -1 if jit is None else jit.countdown(while_stmt)
+        back_edges = 0
+        while True:
+            if back_edges == countdown:
+                if jit.run(while_stmt, self):
+                    return
+                countdown = -1
+            left = values[left_slot]
+            if right_slot is not None:
+                right = values[right_slot]
+            if left.__class__ is int and right.__class__ is int:
+                if not operate(left, right):
+                    break
+            elif not self.evaluate(condition):
+                break
+            if count_before:
+                governor.countdown -= 1
+                if governor.countdown <= 0:
+                    governor.check()
+            self.execute(simple_instr)
+            back_edges += 1
+            if count_after:
+                governor.countdown -= 1
+                if governor.countdown <= 0:
+                    governor.check()
+        if jit is not None:
+            jit.leave(while_stmt, back_edges)
+
     def visit_not_expr(self, not_expr):
         """
         Evaluates a ''bool_expr'' and negates it.
         :return: Negated ''bool_expr''.
         """
         value = self.evaluate(not_expr.bool_expr)
-        try:
-            assert isinstance(value, bool)
-        except AssertionError:
-            error('', '\'not\' keyword can only be used with a boolean expression.')
+        if not not_expr.type_safe:
+            try:
+                assert isinstance(value, bool)
+            except AssertionError:
+                error('', '\'not\' keyword can only be used with a boolean expression.')
         return not value
 
     def visit_boolop_expr(self, boolop_expr):
@@ -276,11 +706,12 @@ class Interpreter(Visitor):
         bool_expr0 = self.evaluate(boolop_expr.bool_expr0)
         bool_expr1 = self.evaluate(boolop_expr.bool_expr1)
         bool_op = boolop_expr.bool_op
-        try:
-            assert isinstance(bool_expr0, bool)
-            assert isinstance(bool_expr1, bool)
-        except AssertionError:
-            error('', 'Boolean operators can only be used with boolean expressions.')
+        if not boolop_expr.type_safe:
+            try:
+                assert isinstance(bool_expr0, bool)
+                assert isinstance(bool_expr1, bool)
+            except AssertionError:
+                error('', 'Boolean operators can only be used with boolean expressions.')
 
         if bool_op == 'and':
             return bool_expr0 and bool_expr1
@@ -290,17 +721,34 @@ class Interpreter(Visitor):
     def visit_num_relop_expr(self, num_relop_expr):
         """
         Evaluates both ''num_expr'' and applies a
-        relational operator to the resulting values.
+        relational operator to the resulting values, specialized
+        like in ''visit_binop_expr''.
         :return: Value of the expression.
         """
         num_expr0 = self.evaluate(num_relop_expr.num_expr0)
         num_expr1 = self.evaluate(num_relop_expr.num_expr1)
+        if num_expr0.__class__ is int and num_expr1.__class__ is int:
+            operate = self.operators.get(num_relop_expr)
+            if operate is not None:
+                return operate(num_expr0, num_expr1)
+            self.quickening.quicken(num_relop_expr, INT_RELOPS[num_relop_expr.num_rel])
+        elif num_relop_expr in self.operators:
+            self.quickening.deoptimize(num_relop_expr)
+        return self.num_relop(num_relop_expr, num_expr0, num_expr1)
+
+    def num_relop(self, num_relop_expr, num_expr0, num_expr1):
+        """
+        Applies the relational operator of ''num_relop_expr'' to the
+        values of its operands.
+        :return: Value of the expression.
+        """
         num_rel = num_relop_expr.num_rel
-        try:
-            assert isinstance(num_expr0, int)
-            assert isinstance(num_expr1, int)
-        except AssertionError:
-            error('', f'Relational operator \'{num_rel}\' can only be used with type NUM')
+        if not num_relop_expr.type_safe:
+            try:
+                assert isinstance(num_expr0, int)
+                assert isinstance(num_expr1, int)
+            except AssertionError:
+                error('', f'Relational operator \'{num_rel}\' can only be used with type NUM')
         if num_rel == '=':
             return num_expr0 == num_expr1
         elif num_rel == '<':
@@ -319,17 +767,36 @@ class Interpreter(Visitor):
     def visit_str_relop_expr(self, str_relop_expr):
         """
         Evaluates both ''str_expr'' and applies a
-        relational operator to the resulting values.
+        relational operator to the resulting values, specialized
+        like in ''visit_binop_expr'' once both are ''str'' values.
         :return: Value of the expression.
         """
         str_expr0 = self.evaluate(str_relop_expr.str_expr0)
         str_expr1 = self.evaluate(str_relop_expr.str_expr1)
+        if str_expr0.__class__ is str and str_expr1.__class__ is str:
+            operate = self.operators.get(str_relop_expr)
+            if operate is not None:
+                return operate(str_expr0, str_expr1)
+            self.quickening.quicken(str_relop_expr, FLAT_STR_RELOPS[str_relop_expr.str_rel])
+        elif str_relop_expr in self.operators:
+            self.quickening.deoptimize(str_relop_expr)
+        return self.str_relop(str_relop_expr, str_expr0, str_expr1)
+
+    def str_relop(self, str_relop_expr, str_expr0, str_expr1):
+        """
+        Applies the relational operator of ''str_relop_expr'' to the
+        values of its operands.
+        :return: Value of the expression.
+        """
         str_rel = str_relop_expr.str_rel
-        try:
-            assert isinstance(str_expr0, str)
-            assert isinstance(str_expr1, str)
-        except AssertionError:
-            error('', f'Relational operator \'{str_rel}\' can only be used with type STRING.')
+        if not str_relop_expr.type_safe:
+            try:
+                assert isinstance(str_expr0, STRING)
+                assert isinstance(str_expr1, STRING)
+            except AssertionError:
+                error('', f'Relational operator \'{str_rel}\' can only be used with type STRING.')
+        str_expr0 = flatten(str_expr0)
+        str_expr1 = flatten(str_expr1)
         if str_rel == '==':
             return str_expr0 == str_expr1
         elif str_rel == '!=':
@@ -341,9 +808,307 @@ class Interpreter(Visitor):
         and prints it to standard output.
         """
         value = self.evaluate(print_stmt.expr)
-        print(value)
+        if value.__class__ is not str and value.__class__ is not int:
+            if value.__class__ in STRING:
+                value = value.flatten()
+            elif is_array(value):
+                value = arrays.format_array(value)
+        self.output.write_line(value)
+
+
+def parse_source(input_str, pass_manager=None, parser='ply'):
+    """
+    Parses a program and runs the optimization passes over it.
+    :param input_str: Program to parse.
+    :param pass_manager: ''PassManager'' to run, if any.
+    :param parser: One of ''PARSERS'': 'ply' for the PLY based
+    parser, 'rd' for the hand-written recursive descent parser.
+    :return: Root of the AST.
+    """
+    program = PARSERS[parser](input_str)
+    if pass_manager is not None:
+        program = pass_manager.run(program)
+    return program
+
+
+def run_program(program, backend='tree', output=None, input_source=None):
+    """
+    Runs a parsed program using the selected execution backend.
+    :param program: Root of the AST.
+    :param backend: One of ''BACKENDS'': 'tree' walks the AST,
+    'vm' compiles it to bytecode and runs it on the VM,
+    'closure' compiles it into nested Python closures,
+    'python' translates it to Python source run by CPython.
+    :param output: ''Output'' used by the 'tree' backend, the other
+    backends print directly to standard output.
+    :param input_source: ''InputSource'' used by the 'tree' backend,
+    the other backends read directly from standard input.
+    """
+    # The other backends are only imported when selected, to keep
+    # the start up of the default one fast.
+    if backend == 'tree':
+        Interpreter(program=program, output=output, input_source=input_source)
+    elif backend == 'vm':
+        from compiler import compile_program
+        from vm import VM
+        VM().run(compile_program(program))
+    elif backend == 'closure':
+        from closure_compiler import ClosureCompiler
+        ClosureCompiler().compile(program)(Environment())
+    elif backend == 'python':
+        from transpiler import to_python, run_python
+        run_python(to_python(program))
+    else:
+        raise ValueError(f'Unknown backend {backend!r}')
+
+
+def run_source(input_str, backend='tree', pass_names=(), cache=None, parser='ply'):
+    """
+    Parses, optimizes and runs a program.
+    :param input_str: Program to run.
+    :param backend: One of ''BACKENDS''.
+    :param pass_names: Names of the optimization passes to run.
+    :param cache: ''ProgramCache'' to take the parsed program from, if any.
+    :param parser: One of ''PARSERS''.
+    """
+    if cache is not None:
+        program = cache.get_program(input_str, pass_names, PARSERS[parser])
+    else:
+        program = parse_source(input_str, PassManager(pass_names), parser)
+    run_program(program, backend)
+
+
+class CompiledProgram:
+    def __init__(self, program, slots, pass_report=''):
+        """
+        Initializes a parsed, optimized and resolved program, which
+        can be run any number of times by the tree-walking
+        interpreter. Runs never modify it, so it can be shared.
+        :param program: Root of the resolved AST.
+        :param slots: Dictionary mapping the names of the variables
+        to their slots.
+        :param pass_report: Report of the optimization passes run
+        over the program.
+        """
+        self.program = program
+        self.slots = slots
+        self.pass_report = pass_report
+
+    def new_environment(self, governor=None):
+        """
+        :param governor: ''Governor'' of the run, if any.
+        :return: Empty ''SlotEnvironment'' for running the program.
+        """
+        if governor is None:
+            return SlotEnvironment(self.program.slot_count)
+        return GovernedSlotEnvironment(self.program.slot_count, governor)
+
+    def run(self, stdin=None, stdout=None, env=None, governor=None, profile=None, quickening=None, jit=None):
+        """
+        Runs the program.
+        :param stdin: ''InputSource'', STRING, or file to read the
+        input from, standard input by default.
+        :param stdout: ''Output'' or text stream to print to,
+        standard output by default.
+        :param env: ''SlotEnvironment'' to run in, a new one by
+        default. Values of variables can be looked up in it after
+        the run, through ''slots''.
+        :param governor: ''Governor'' limiting the run, if any. When
+        one of its limits is exceeded, ''LimitExceeded'' is raised.
+        :param profile: ''Profile'' to record the execution counts and
+        times of the nodes into, if any.
+        :param quickening: ''Quickening'' to hold and count the
+        specialized nodes in, if any.
+        :param jit: ''TracingJit'' compiling the hot loops of the run,
+        if any. Profiled runs never trace loops.
+        :return: Environment the program was run in.
+        """
+        if stdin is None:
+            input_source = make_input()
+        elif isinstance(stdin, InputSource):
+            input_source = stdin
+        elif isinstance(stdin, str):
+            input_source = StringInput(stdin)
+        elif hasattr(stdin, 'buffer'):
+            input_source = BufferedInput(stdin.buffer, encoding=stdin.encoding)
+        else:
+            input_source = BufferedInput(stdin)
+        if stdout is None:
+            output = make_output()
+        elif isinstance(stdout, Output):
+            output = stdout
+        else:
+            output = BufferedOutput(stdout)
+        if env is None:
+            env = self.new_environment(governor)
+        if profile is None:
+            Interpreter(program=self.program, output=output, input_source=input_source, environment=env,
+                        governor=governor, quickening=quickening, jit=jit)
+        else:
+            from profiler import ProfilingInterpreter
+            ProfilingInterpreter(profile, program=self.program, output=output, input_source=input_source,
+                                 environment=env, governor=governor, quickening=quickening)
+        return env
+
+
+def compile(source, pass_names=(), parser='ply'):
+    """
+    Parses, optimizes and resolves a program once, so that it can
+    be run many times. Like the parsers, exits on syntax errors.
+    :param source: Program to compile.
+    :param pass_names: Names of the optimization passes to run.
+    :param parser: One of ''PARSERS''.
+    :return: The ''CompiledProgram''.
+    """
+    pass_manager = PassManager(pass_names)
+    program = parse_source(source, pass_manager, parser)
+    if program is None:
+        exit(1)
+    resolver = Resolver()
+    resolver.resolve(program)
+    TypeChecker().check(program)
+    Fuser().fuse(program)
+    LoopAnalyzer().analyze(program)
+    return CompiledProgram(program, resolver.slots, pass_manager.format_report())
+
+
+def check_source(input_str):
+    """
+    Reports errors that can be detected without running the program.
+    """
+    program = parser_prim.parse(input_str)
+    if program is None:
+        return
+    resolver = Resolver()
+    resolver.resolve(program)
+    for name in resolver.undeclared:
+        warning('', f'Variable {name} is never declared.')
+    for lineno, msg in TypeChecker().check(program):
+        warning(lineno, msg)
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description='Runs a program.')
+    arg_parser.add_argument('filename', help="Program to run, or '-' to read it from standard input.")
+    arg_parser.add_argument('--backend', choices=BACKENDS, default='tree',
+                            help='Execution backend (default: tree).')
+    arg_parser.add_argument('--parser', choices=PARSERS, default='ply',
+                            help='Parser (default: ply).')
+    arg_parser.add_argument('--emit-python', action='store_true',
+                            help='Print the program translated to Python instead of running it.')
+    arg_parser.add_argument('--check', action='store_true',
+                            help='Report statically detectable errors instead of running the program.')
+    arg_parser.add_argument('--passes', default='',
+                            help='Comma separated optimization passes to run before execution, '
+                                 f'from: {", ".join(passes)}.')
+    arg_parser.add_argument('--pass-report', action='store_true',
+                            help='Print the number of nodes removed by each pass to standard error.')
+    arg_parser.add_argument('--stream', action='store_true',
+                            help='Execute every top-level statement as soon as it has been read '
+                                 '(tree backend only).')
+    arg_parser.add_argument('--output', choices=('auto',) + tuple(OUTPUTS), default='auto',
+                            help='Output of the tree backend: buffered in memory, line buffered, '
+                                 'or written to the file descriptor in bulk (default: auto, '
+                                 'line buffered on a terminal, buffered otherwise).')
+    arg_parser.add_argument('--max-steps', type=int,
+                            help='Maximum number of loop iterations (tree backend only).')
+    arg_parser.add_argument('--max-time', type=float,
+                            help='Maximum run time in seconds (tree backend only).')
+    arg_parser.add_argument('--max-string-bytes', type=int,
+                            help='Maximum total length of the STRING values held by the variables '
+                                 '(tree backend only).')
+    arg_parser.add_argument('--profile', action='store_true',
+                            help='Print the time spent per line, loop and node to standard error '
+                                 '(tree backend only).')
+    arg_parser.add_argument('--profile-collapsed', metavar='FILENAME',
+                            help='Write the profile as collapsed stacks for flamegraph tools '
+                                 '(tree backend only).')
+    arg_parser.add_argument('--quickening-stats', action='store_true',
+                            help='Print the number of nodes specialized and deoptimized to standard '
+                                 'error (tree backend only).')
+    arg_parser.add_argument('--no-jit', action='store_true',
+                            help='Run every loop in the interpreter, instead of compiling hot loops '
+                                 '(tree backend only).')
+    arg_parser.add_argument('--jit-threshold', type=int, default=HOT_LOOP_THRESHOLD,
+                            help='Number of iterations after which a loop is compiled '
+                                 f'(default: {HOT_LOOP_THRESHOLD}).')
+    arg_parser.add_argument('--jit-max-traces', type=int, default=MAX_TRACES,
+                            help=f'Maximum number of compiled loops kept (default: {MAX_TRACES}).')
+    arg_parser.add_argument('--dump-traces', action='store_true',
+                            help='Print the source of every compiled loop, and how often it ran, '
+                                 'to standard error (tree backend only).')
+    args = arg_parser.parse_args(argv)
+    try:
+        pass_manager = PassManager([name for name in args.passes.split(',') if name])
+    except ValueError as e:
+        arg_parser.error(str(e))
+    limits = (args.max_steps, args.max_time, args.max_string_bytes)
+    if limits != (None, None, None) and (args.backend != 'tree' or args.stream):
+        arg_parser.error('resource limits only support the tree backend without --stream')
+    profiling = args.profile or args.profile_collapsed is not None
+    if profiling and (args.backend != 'tree' or args.stream):
+        arg_parser.error('profiling only supports the tree backend without --stream')
+    if args.quickening_stats and (args.backend != 'tree' or args.stream):
+        arg_parser.error('--quickening-stats only supports the tree backend without --stream')
+    if args.dump_traces and (args.backend != 'tree' or args.stream):
+        arg_parser.error('--dump-traces only supports the tree backend without --stream')
+    if args.stream:
+        if args.backend != 'tree' or args.emit_python or args.check:
+            arg_parser.error('--stream only supports the tree backend')
+        from streaming import StreamingInterpreter
+        if args.filename == '-':
+            # The program itself is read from standard input, so the
+            # input of the program must not be read ahead of it.
+            interpreter = StreamingInterpreter(args.parser, pass_manager, make_output(args.output),
+                                               make_input('console'))
+            interpreter.run(sys.stdin)
+        else:
+            interpreter = StreamingInterpreter(args.parser, pass_manager, make_output(args.output))
+            with open(args.filename) as f:
+                interpreter.run(f)
+        return
+    if args.filename == '-':
+        input_str = sys.stdin.read()
+    else:
+        with open(args.filename) as f:
+            input_str = f.read()
+    if args.check:
+        check_source(input_str)
+        return
+    compiled = compile(input_str, pass_manager.pass_names, args.parser)
+    if args.pass_report:
+        sys.stderr.write(compiled.pass_report + '\n')
+    if args.emit_python:
+        from transpiler import to_python
+        print(to_python(compiled.program), end='')
+    elif args.backend == 'tree':
+        governor = None if limits == (None, None, None) else Governor(*limits)
+        profile = None
+        if profiling:
+            from profiler import Profile
+            profile = Profile()
+        quickening = Quickening() if args.quickening_stats else None
+        jit = TracingJit(None if args.no_jit else args.jit_threshold, args.jit_max_traces,
+                         sys.stderr if args.dump_traces else None)
+        try:
+            compiled.run(stdout=make_output(args.output), governor=governor, profile=profile,
+                         quickening=quickening, jit=jit)
+        except LimitExceeded as e:
+            error('', str(e))
+        finally:
+            # Also reported when the program exits or fails.
+            if args.profile:
+                sys.stderr.write(profile.format(input_str) + '\n')
+            if args.profile_collapsed is not None:
+                with open(args.profile_collapsed, 'w') as f:
+                    f.write(profile.collapsed_stacks())
+            if quickening is not None:
+                sys.stderr.write(quickening.format() + '\n')
+            if args.dump_traces:
+                sys.stderr.write(jit.format() + '\n')
+    else:
+        run_program(compiled.program, args.backend)
 
 
 if __name__ == '__main__':
-    with open(sys.argv[1]) as f:
-        Interpreter(f.read())
+    main()
@@ -1,3 +1,7 @@
+import hashlib
+import os
+import sys
+
 import ply.lex as lex
 
 from errors import error
@@ -29,10 +33,10 @@ reserved = {
 tokens = ['PLUS', 'MINUS', 'TIMES', 'DIVIDE', 'MOD',
           'EQUALS', 'LT', 'LE', 'GT', 'GE', 'NE',
           'STREQ', 'STRNOTEQ',
-          'LPAREN', 'RPAREN', 'SEMI', 'COMMA',
+          'LPAREN', 'RPAREN', 'LBRACKET', 'RBRACKET', 'SEMI', 'COMMA',
           'ASSIGN',
           'NUM', 'IDENT', 'STRING'
-          ] + list(set(reserved.values()))
+          ] + sorted(set(reserved.values()))
 
 t_PLUS = r'\+'
 t_MINUS = r'\-'
@@ -49,6 +53,8 @@ t_STREQ = r'=='
 t_STRNOTEQ = r'!='
 t_LPAREN = r'\('
 t_RPAREN = r'\)'
+t_LBRACKET = r'\['
+t_RBRACKET = r'\]'
 t_SEMI = r';'
 t_COMMA = r','
 t_ASSIGN = r':='
@@ -94,4 +100,61 @@ def t_error(t):
     t.lexer.skip(1)
 
 
-lex.lex()
+def signature():
+    """
+    :return: Hash of the token list and all token rules, stored
+    in the pregenerated ''lextab'' to detect stale tables.
+    """
+    module = sys.modules[__name__]
+    rules = []
+    for name in sorted(dir(module)):
+        if name.startswith('t_'):
+            rule = getattr(module, name)
+            rules.append(name + '=' + (rule.__doc__ or '' if callable(rule) else str(rule)))
+    text = ' '.join(tokens) + ' ' + repr(sorted(reserved.items())) + ' ' + ' '.join(rules)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def load_lextab():
+    """
+    :return: The pregenerated ''lextab'' module if it was built
+    for this version of PLY and these token rules, None otherwise.
+    """
+    try:
+        import lextab
+    except ImportError:
+        return None
+    if getattr(lextab, '_tabversion', None) != lex.__tabversion__ \
+            or getattr(lextab, '_lexsignature', None) != signature():
+        return None
+    return lextab
+
+
+lexer = None
+
+
+def make_lexer():
+    """
+    Builds the lexer once per process. Pregenerated tables are loaded
+    from ''lextab'' when they are up to date, otherwise the lexer is
+    built from the rules in this module. No files are ever written.
+    :return: The lexer. Use a ''clone()'' of it for each input.
+    """
+    global lexer
+    if lexer is None:
+        lextab = load_lextab()
+        module = sys.modules[__name__]
+        if lextab is not None:
+            lexer = lex.lex(module=module, optimize=True, lextab=lextab)
+        else:
+            lexer = lex.lex(module=module)
+    return lexer
+
+
+def write_lextab(outputdir):
+    """
+    Regenerates ''lextab.py'' in ''outputdir''.
+    """
+    lex.lex(module=sys.modules[__name__]).writetab('lextab', outputdir)
+    with open(os.path.join(outputdir, 'lextab.py'), 'a') as f:
+        f.write('_lexsignature = %r\n' % signature())
@@ -0,0 +1,11 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AND', 'ASSIGN', 'BEGIN', 'BOOL', 'COMMA', 'CONCAT', 'DIVIDE', 'DO', 'ELSE', 'END', 'EQUALS', 'EXIT', 'GE', 'GT', 'IDENT', 'IF', 'LBRACKET', 'LE', 'LEN', 'LPAREN', 'LT', 'MINUS', 'MOD', 'NE', 'NOT', 'NUM', 'OR', 'PLUS', 'POS', 'PRINT', 'RBRACKET', 'READINT', 'READSTR', 'RPAREN', 'SEMI', 'STREQ', 'STRING', 'STRNOTEQ', 'SUBSTR', 'THEN', 'TIMES', 'WHILE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_NUM>[0-9]+)|(?P<t_STRING>\\".*?\\")|(?P<t_BOOL>true|false)|(?P<t_IDENT>[_A-Za-z][_A-Za-z0-9]*)|(?P<t_newline>\\n)|(?P<t_ASSIGN>:=)|(?P<t_GE>>=)|(?P<t_LBRACKET>\\[)|(?P<t_LE><=)|(?P<t_LPAREN>\\()|(?P<t_MINUS>\\-)|(?P<t_NE><>)|(?P<t_PLUS>\\+)|(?P<t_RBRACKET>\\])|(?P<t_RPAREN>\\))|(?P<t_STREQ>==)|(?P<t_STRNOTEQ>!=)|(?P<t_TIMES>\\*)|(?P<t_COMMA>,)|(?P<t_DIVIDE>/)|(?P<t_EQUALS>=)|(?P<t_GT>>)|(?P<t_LT><)|(?P<t_MOD>%)|(?P<t_SEMI>;)', [None, ('t_NUM', 'NUM'), ('t_STRING', 'STRING'), ('t_BOOL', 'BOOL'), ('t_IDENT', 'IDENT'), ('t_newline', 'newline'), (None, 'ASSIGN'), (None, 'GE'), (None, 'LBRACKET'), (None, 'LE'), (None, 'LPAREN'), (None, 'MINUS'), (None, 'NE'), (None, 'PLUS'), (None, 'RBRACKET'), (None, 'RPAREN'), (None, 'STREQ'), (None, 'STRNOTEQ'), (None, 'TIMES'), (None, 'COMMA'), (None, 'DIVIDE'), (None, 'EQUALS'), (None, 'GT'), (None, 'LT'), (None, 'MOD'), (None, 'SEMI')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {'INITIAL': 't_eof'}
+_lexsignature = '54fa86c2aef634f206012a007ebb42153fa312403c5ecad7ffe0e6804c61171b'
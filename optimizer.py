@@ -0,0 +1,228 @@
+import ast
+from visitor import Transformer
+
+
+def is_num(node):
+    return isinstance(node, ast.Literal) and isinstance(node.value, int) \
+        and not isinstance(node.value, bool)
+
+
+def is_str(node):
+    return isinstance(node, ast.Literal) and isinstance(node.value, str)
+
+
+def is_bool(node):
+    return isinstance(node, ast.Literal) and isinstance(node.value, bool)
+
+
+def empty_block():
+    """
+    :return: A statement that does nothing.
+    """
+    return ast.InstrBlock(ast.Instr([]))
+
+
+def is_empty_block(node):
+    return isinstance(node, ast.InstrBlock) and not node.instr.simple_instr_list
+
+
+def count_nodes(node):
+    return sum(1 for _ in ast.walk(node))
+
+
+class ConstantFolder(Transformer):
+    """
+    Evaluates expressions whose operands are all literals. Only
+    expressions that the interpreter would evaluate without an
+    error are folded, so errors which are certain to happen (like
+    applying '/' to a STRING) are still reported at run time.
+    """
+
+    def visit_unary_expr(self, unary_expr):
+        num_expr = self.transform(unary_expr.num_expr)
+        if isinstance(num_expr, ast.Literal) and type(num_expr.value) in (int, float):
+            return ast.Literal(-num_expr.value)
+        return ast.UnaryExpr(num_expr)
+
+    def visit_binop_expr(self, binop_expr):
+        left = self.transform(binop_expr.num_expr0)
+        right = self.transform(binop_expr.num_expr1)
+        op = binop_expr.op
+        if is_num(left) and is_num(right) and not (op in ('/', '%') and right.value == 0):
+            if op == '+':
+                return ast.Literal(left.value + right.value)
+            elif op == '-':
+                return ast.Literal(left.value - right.value)
+            elif op == '*':
+                return ast.Literal(left.value * right.value)
+            elif op == '/':
+                return ast.Literal(left.value / right.value)
+            else:
+                return ast.Literal(left.value % right.value)
+        return ast.BinopExpr(left, op, right)
+
+    def visit_grouping_expr(self, grouping_expr):
+        num_expr = self.transform(grouping_expr.num_expr)
+        if isinstance(num_expr, ast.Literal):
+            return num_expr
+        return ast.GroupingExpr(num_expr)
+
+    def visit_len_expr(self, len_expr):
+        str_expr = self.transform(len_expr.str_expr)
+        if is_str(str_expr):
+            return ast.Literal(len(str_expr.value))
+        return ast.LenExpr(str_expr)
+
+    def visit_pos_expr(self, pos_expr):
+        str_expr0 = self.transform(pos_expr.str_expr0)
+        str_expr1 = self.transform(pos_expr.str_expr1)
+        if is_str(str_expr0) and is_str(str_expr1):
+            pos = str_expr0.value.find(str_expr1.value)
+            return ast.Literal(0 if pos == -1 else pos)
+        return ast.PosExpr(str_expr0, str_expr1)
+
+    def visit_concat_expr(self, concat_expr):
+        str_expr0 = self.transform(concat_expr.str_expr0)
+        str_expr1 = self.transform(concat_expr.str_expr1)
+        if is_str(str_expr0) and is_str(str_expr1):
+            return ast.Literal(str_expr0.value + str_expr1.value)
+        return ast.ConcatExpr(str_expr0, str_expr1)
+
+    def visit_substr_expr(self, substr_expr):
+        str_expr = self.transform(substr_expr.str_expr)
+        num_expr0 = self.transform(substr_expr.num_expr0)
+        num_expr1 = self.transform(substr_expr.num_expr1)
+        if is_str(str_expr) and is_num(num_expr0) and is_num(num_expr1):
+            start, end = num_expr0.value, num_expr1.value
+            if start < 1 or end < 0:
+                return ast.Literal('')
+            return ast.Literal(str_expr.value[start-1:end])
+        return ast.SubstrExpr(str_expr, num_expr0, num_expr1)
+
+    def visit_not_expr(self, not_expr):
+        bool_expr = self.transform(not_expr.bool_expr)
+        if is_bool(bool_expr):
+            return ast.Literal(not bool_expr.value)
+        return ast.NotExpr(bool_expr)
+
+    def visit_boolop_expr(self, boolop_expr):
+        left = self.transform(boolop_expr.bool_expr0)
+        right = self.transform(boolop_expr.bool_expr1)
+        bool_op = boolop_expr.bool_op
+        if is_bool(left) and is_bool(right):
+            if bool_op == 'and':
+                return ast.Literal(left.value and right.value)
+            return ast.Literal(left.value or right.value)
+        return ast.BoolopExpr(left, bool_op, right)
+
+    def visit_num_relop_expr(self, num_relop_expr):
+        left = self.transform(num_relop_expr.num_expr0)
+        right = self.transform(num_relop_expr.num_expr1)
+        num_rel = num_relop_expr.num_rel
+        if is_num(left) and is_num(right):
+            if num_rel == '=':
+                return ast.Literal(left.value == right.value)
+            elif num_rel == '<':
+                return ast.Literal(left.value < right.value)
+            elif num_rel == '<=':
+                return ast.Literal(left.value <= right.value)
+            elif num_rel == '>':
+                return ast.Literal(left.value > right.value)
+            elif num_rel == '>=':
+                return ast.Literal(left.value >= right.value)
+            elif num_rel == '<>':
+                return ast.Literal(left.value != right.value)
+        return ast.NumRelopExpr(left, num_rel, right)
+
+    def visit_str_relop_expr(self, str_relop_expr):
+        left = self.transform(str_relop_expr.str_expr0)
+        right = self.transform(str_relop_expr.str_expr1)
+        str_rel = str_relop_expr.str_rel
+        if is_str(left) and is_str(right):
+            if str_rel == '==':
+                return ast.Literal(left.value == right.value)
+            return ast.Literal(left.value != right.value)
+        return ast.StrRelopExpr(left, str_rel, right)
+
+
+class DeadBranchEliminator(Transformer):
+    """
+    Removes ''if'' and ''while'' branches that can never run
+    because their condition is a boolean literal. Best run after
+    constant folding, which turns constant conditions into literals.
+    """
+
+    def visit_instr(self, instr):
+        simple_instr_list = [self.transform(simple_instr) for simple_instr in instr.simple_instr_list]
+        return ast.Instr([simple_instr for simple_instr in simple_instr_list
+                          if not is_empty_block(simple_instr)])
+
+    def visit_instr_block(self, instr_block):
+        instr = self.transform(instr_block.instr)
+        if len(instr.simple_instr_list) == 1:
+            return instr.simple_instr_list[0]
+        return ast.InstrBlock(instr)
+
+    def visit_if_stmt(self, if_stmt):
+        cond = self.transform(if_stmt.cond)
+        if is_bool(cond):
+            if cond.value:
+                return self.transform(if_stmt.true_simple_instr)
+            elif if_stmt.else_simple_instr is not None:
+                return self.transform(if_stmt.else_simple_instr)
+            return empty_block()
+        else_simple_instr = None
+        if if_stmt.else_simple_instr is not None:
+            else_simple_instr = self.transform(if_stmt.else_simple_instr)
+        return ast.IfStmt(cond, self.transform(if_stmt.true_simple_instr), else_simple_instr)
+
+    def visit_while_stmt(self, while_stmt):
+        cond = self.transform(while_stmt.cond)
+        if is_bool(cond) and not cond.value:
+            if while_stmt.do_while:
+                return self.transform(while_stmt.simple_instr)
+            return empty_block()
+        return ast.WhileStmt(cond, self.transform(while_stmt.simple_instr), while_stmt.do_while)
+
+
+passes = {
+    'fold': ConstantFolder,
+    'dead-branch': DeadBranchEliminator
+}
+
+
+class PassManager:
+    def __init__(self, pass_names):
+        """
+        Initializes a pipeline of AST-to-AST passes.
+        :param pass_names: Names of the passes from ''passes'',
+        in the order in which they should run.
+        """
+        for name in pass_names:
+            if name not in passes:
+                raise ValueError(f'Unknown pass {name!r}, expected one of: {", ".join(passes)}')
+        self.pass_names = list(pass_names)
+        self.report = []
+
+    def run(self, program):
+        """
+        Runs all passes over ''program'', recording the number of
+        nodes before and after each of them in ''report''.
+        :param program: Root of the AST, which is not modified.
+        :return: Root of the transformed AST.
+        """
+        self.report = []
+        for name in self.pass_names:
+            before = count_nodes(program)
+            program = passes[name]().transform(program)
+            self.report.append((name, before, count_nodes(program)))
+        return program
+
+    def format_report(self):
+        """
+        :return: Table with the number of nodes removed by each pass.
+        """
+        lines = ['{:<14} {:>8} {:>8} {:>8}'.format('pass', 'before', 'after', 'removed')]
+        for name, before, after in self.report:
+            lines.append('{:<14} {:>8} {:>8} {:>8}'.format(name, before, after, before - after))
+        return '\n'.join(lines)
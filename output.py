@@ -0,0 +1,135 @@
+from abc import ABC, abstractmethod
+import os
+import sys
+
+import errors
+
+DEFAULT_BUFFER_SIZE = 64 * 1024
+
+
+class Output(ABC):
+    """
+    Sink for the lines written by ''print'' statements. While a
+    program runs inside a ''with'' block of its output, the output
+    is flushed before any error is reported and when the block is
+    left, also through ''exit'' or an error.
+    """
+
+    @abstractmethod
+    def write_line(self, value):
+        pass
+
+    @abstractmethod
+    def flush(self):
+        pass
+
+    def __enter__(self):
+        self.previous = errors.output
+        errors.output = self
+        return self
+
+    def __exit__(self, *exc_info):
+        errors.output = self.previous
+        self.flush()
+
+
+class BufferedOutput(Output):
+    def __init__(self, stream=None, buffer_size=DEFAULT_BUFFER_SIZE):
+        """
+        Initializes an output collecting lines in memory and writing
+        them to ''stream'' at once when they reach ''buffer_size''
+        characters.
+        :param stream: Text stream to write to, standard output
+        by default.
+        :param buffer_size: Number of characters to buffer.
+        """
+        self.stream = sys.stdout if stream is None else stream
+        self.buffer_size = buffer_size
+        self.lines = []
+        self.free = buffer_size
+
+    def write_line(self, value):
+        # Values are only converted to text when flushed, so the
+        # length of a NUM or BOOL is not known yet and is estimated.
+        self.lines.append(value)
+        self.free -= len(value) + 1 if value.__class__ is str else 16
+        if self.free <= 0:
+            self.flush()
+
+    def text(self):
+        """
+        :return: Buffered lines as text, emptying the buffer.
+        """
+        text = '\n'.join(map(str, self.lines)) + '\n'
+        self.lines = []
+        self.free = self.buffer_size
+        return text
+
+    def flush(self):
+        if self.lines:
+            self.stream.write(self.text())
+        self.stream.flush()
+
+
+class LineBufferedOutput(Output):
+    def __init__(self, stream=None):
+        """
+        Initializes an output writing and flushing every line as soon
+        as it is printed, e.g. for interactive use.
+        :param stream: Text stream to write to, standard output
+        by default.
+        """
+        self.stream = sys.stdout if stream is None else stream
+
+    def write_line(self, value):
+        self.stream.write(f'{value}\n')
+        self.stream.flush()
+
+    def flush(self):
+        self.stream.flush()
+
+
+class FdOutput(BufferedOutput):
+    def __init__(self, fd=None, buffer_size=DEFAULT_BUFFER_SIZE, encoding=None):
+        """
+        Initializes an output collecting lines in memory and writing
+        them directly to a file descriptor, bypassing the Python
+        stream objects.
+        :param fd: File descriptor to write to, the one of standard
+        output by default.
+        :param buffer_size: Number of characters to buffer.
+        :param encoding: Encoding of the written text, the one of
+        standard output by default.
+        """
+        super().__init__(sys.stdout, buffer_size)
+        self.fd = sys.stdout.fileno() if fd is None else fd
+        self.encoding = encoding or getattr(sys.stdout, 'encoding', None) or 'utf-8'
+
+    def flush(self):
+        if not self.lines:
+            return
+        # Anything already written to standard output comes first.
+        self.stream.flush()
+        data = memoryview(self.text().encode(self.encoding))
+        while data:
+            data = data[os.write(self.fd, data):]
+
+
+OUTPUTS = {
+    'buffered': BufferedOutput,
+    'line': LineBufferedOutput,
+    'fd': FdOutput
+}
+
+
+def make_output(mode='auto'):
+    """
+    Creates an output writing to standard output.
+    :param mode: One of ''OUTPUTS'', or 'auto' to buffer lines
+    unless standard output is a terminal.
+    :return: The new ''Output''.
+    """
+    if mode == 'auto':
+        isatty = getattr(sys.stdout, 'isatty', None)
+        mode = 'line' if isatty is not None and isatty() else 'buffered'
+    return OUTPUTS[mode]()
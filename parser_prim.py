@@ -1,3 +1,6 @@
+import os
+import sys
+
 import ply.yacc as yacc
 
 import lexer_prim
@@ -25,6 +28,7 @@ precedence = (
 def p_program(p):
     '''program : instr'''
     p[0] = ast.Program(p[1])
+    p[0].lineno = p[1].lineno
 
 
 # Instructions
@@ -38,6 +42,7 @@ def p_instr_chain(p):
 def p_instr_single(p):
     '''instr : simple_instr'''
     p[0] = ast.Instr([p[1]])
+    p[0].lineno = p[1].lineno
 
 
 def p_simple_instr(p):
@@ -51,11 +56,13 @@ def p_simple_instr(p):
 def p_simple_instr_exit(p):
     '''simple_instr : EXIT'''
     p[0] = ast.ExitStmt()
+    p[0].lineno = p.lineno(1)
 
 
 def p_simple_instr_block(p):
     '''simple_instr : BEGIN instr END'''
     p[0] = ast.InstrBlock(p[2])
+    p[0].lineno = p.lineno(1)
 
 
 # Assign statement
@@ -63,19 +70,30 @@ def p_simple_instr_block(p):
 def p_assign_stmt(p):
     '''assign_stmt : IDENT ASSIGN expr'''
     p[0] = ast.AssignStmt(p[1], p[3])
+    p[0].lineno = p.lineno(1)
+
+
+def p_assign_stmt_index(p):
+    '''assign_stmt : IDENT LBRACKET expr RBRACKET ASSIGN expr'''
+    ident = ast.Ident(p[1])
+    ident.lineno = p.lineno(1)
+    p[0] = ast.IndexAssignStmt(ident, p[3], p[6])
+    p[0].lineno = p.lineno(1)
 
 
 # Expressions
 
 def p_expr(p):
     '''expr : num_expr
-            | str_expr'''
+            | str_expr
+            | call_expr'''
     p[0] = p[1]
 
 
 def p_expr_ident(p):
     '''expr : IDENT'''
     p[0] = ast.Ident(p[1])
+    p[0].lineno = p.lineno(1)
 
 
 # Num expressions
@@ -83,16 +101,19 @@ def p_expr_ident(p):
 def p_num_expr_literal(p):
     '''num_expr : NUM'''
     p[0] = ast.Literal(p[1])
+    p[0].lineno = p.lineno(1)
 
 
 def p_num_expr_readint(p):
     '''num_expr : READINT'''
     p[0] = ast.ReadintExpr()
+    p[0].lineno = p.lineno(1)
 
 
 def p_num_expr_unary(p):
     '''num_expr : MINUS expr %prec UMINUS'''
     p[0] = ast.UnaryExpr(p[2])
+    p[0].lineno = p.lineno(1)
 
 
 def p_num_expr_binop(p):
@@ -102,21 +123,33 @@ def p_num_expr_binop(p):
                 | expr DIVIDE expr
                 | expr MOD expr'''
     p[0] = ast.BinopExpr(p[1], p[2], p[3])
+    p[0].lineno = p[1].lineno
 
 
 def p_num_expr_group(p):
     '''num_expr : LPAREN expr RPAREN'''
     p[0] = ast.GroupingExpr(p[2])
+    p[0].lineno = p.lineno(1)
 
 
 def p_num_expr_len(p):
     '''num_expr : LEN LPAREN expr RPAREN'''
     p[0] = ast.LenExpr(p[3])
+    p[0].lineno = p.lineno(1)
 
 
 def p_num_expr_pos(p):
     '''num_expr : POS LPAREN expr COMMA expr RPAREN'''
     p[0] = ast.PosExpr(p[3], p[5])
+    p[0].lineno = p.lineno(1)
+
+
+def p_num_expr_index(p):
+    '''num_expr : IDENT LBRACKET expr RBRACKET'''
+    ident = ast.Ident(p[1])
+    ident.lineno = p.lineno(1)
+    p[0] = ast.IndexExpr(ident, p[3])
+    p[0].lineno = p.lineno(1)
 
 
 # String expressions
@@ -124,21 +157,36 @@ def p_num_expr_pos(p):
 def p_str_expr_literal(p):
     '''str_expr : STRING'''
     p[0] = ast.Literal(p[1])
+    p[0].lineno = p.lineno(1)
 
 
 def p_str_expr_readstr(p):
     '''str_expr : READSTR'''
     p[0] = ast.ReadstrExpr()
+    p[0].lineno = p.lineno(1)
 
 
 def p_str_expr_concat(p):
     '''str_expr : CONCAT LPAREN expr COMMA expr RPAREN'''
     p[0] = ast.ConcatExpr(p[3], p[5])
+    p[0].lineno = p.lineno(1)
 
 
 def p_str_expr_substr(p):
     '''str_expr : SUBSTR LPAREN expr COMMA expr COMMA expr RPAREN'''
     p[0] = ast.SubstrExpr(p[3], p[5], p[7])
+    p[0].lineno = p.lineno(1)
+
+
+# Builtin function calls
+
+def p_call_expr(p):
+    '''call_expr : IDENT LPAREN RPAREN
+                 | IDENT LPAREN expr RPAREN'''
+    p[0] = ast.builtin_call(p[1], p[3:-1])
+    if p[0] is None:
+        error(p.lineno(1), f'Syntax error at token \'{p[1]}\'')
+    p[0].lineno = p.lineno(1)
 
 
 # Control flow statements
@@ -146,21 +194,25 @@ def p_str_expr_substr(p):
 def p_if_stmt(p):
     '''if_stmt : IF bool_expr THEN simple_instr'''
     p[0] = ast.IfStmt(p[2], p[4])
+    p[0].lineno = p.lineno(1)
 
 
 def p_if_stmt_else(p):
     '''if_stmt : IF bool_expr THEN simple_instr ELSE simple_instr'''
     p[0] = ast.IfStmt(p[2], p[4], p[6])
+    p[0].lineno = p.lineno(1)
 
 
 def p_while_stmt(p):
     '''while_stmt : WHILE bool_expr DO simple_instr'''
     p[0] = ast.WhileStmt(p[2], p[4])
+    p[0].lineno = p.lineno(1)
 
 
 def p_while_stmt_do(p):
     '''while_stmt : DO simple_instr WHILE bool_expr'''
     p[0] = ast.WhileStmt(p[4], p[2], do_while=True)
+    p[0].lineno = p.lineno(1)
 
 
 # Boolean expressions
@@ -168,32 +220,38 @@ def p_while_stmt_do(p):
 def p_bool_expr_literal(p):
     '''bool_expr : BOOL'''
     p[0] = ast.Literal(p[1])
+    p[0].lineno = p.lineno(1)
 
 
 def p_bool_expr_group(p):
     '''bool_expr : LPAREN bool_expr RPAREN'''
     p[0] = ast.GroupingExpr(p[2])
+    p[0].lineno = p.lineno(1)
 
 
 def p_bool_expr_not(p):
     '''bool_expr : NOT bool_expr'''
     p[0] = ast.NotExpr(p[2])
+    p[0].lineno = p.lineno(1)
 
 
 def p_bool_expr_boolop(p):
     '''bool_expr : bool_expr AND bool_expr
                  | bool_expr OR bool_expr'''
     p[0] = ast.BoolopExpr(p[1], p[2], p[3])
+    p[0].lineno = p[1].lineno
 
 
 def p_bool_expr_num_relop(p):
     '''bool_expr : expr num_rel expr'''
     p[0] = ast.NumRelopExpr(p[1], p[2], p[3])
+    p[0].lineno = p[1].lineno
 
 
 def p_bool_expr_str_relop(p):
     '''bool_expr : expr str_rel expr'''
     p[0] = ast.StrRelopExpr(p[1], p[2], p[3])
+    p[0].lineno = p[1].lineno
 
 
 def p_num_rel(p):
@@ -217,6 +275,7 @@ def p_str_rel(p):
 def p_output_stmt(p):
     '''output_stmt : PRINT LPAREN expr RPAREN'''
     p[0] = ast.PrintStmt(p[3])
+    p[0].lineno = p.lineno(1)
 
 
 # Syntax error "handling"
@@ -227,6 +286,49 @@ def p_error(p):
         print('EOF - no more input')
 
 
+parser = None
+
+
 def make_parser():
-    parser = yacc.yacc()
+    """
+    Builds the parser once per process from the pregenerated tables
+    in ''parsetab''. If they do not match the grammar of this module,
+    the tables are rebuilt in memory. No files are ever written.
+    :return: The parser.
+    """
+    global parser
+    if parser is None:
+        parser = yacc.yacc(module=sys.modules[__name__], tabmodule='parsetab',
+                           debug=False, write_tables=False)
     return parser
+
+
+def parse(input_str, lineno=1):
+    """
+    Parses a program with a fresh copy of the lexer, so that
+    line numbers start from ''lineno'' on every call.
+    :param input_str: Program to parse.
+    :param lineno: Line number of the first line of ''input_str''.
+    :return: Root of the AST.
+    """
+    lexer = lexer_prim.make_lexer().clone()
+    lexer.lineno = lineno
+    return make_parser().parse(input_str, lexer=lexer)
+
+
+def build_tables(outputdir):
+    """
+    Regenerates the lexer and parser tables, ''lextab.py''
+    and ''parsetab.py'', in ''outputdir''.
+    """
+    lexer_prim.write_lextab(outputdir)
+    path = os.path.join(outputdir, 'parsetab.py')
+    if os.path.exists(path):
+        os.remove(path)
+    sys.modules.pop('parsetab', None)
+    yacc.yacc(module=sys.modules[__name__], tabmodule='parsetab',
+              outputdir=outputdir, debug=False)
+
+
+if __name__ == '__main__':
+    build_tables(os.path.dirname(os.path.abspath(__file__)))
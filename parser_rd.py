@@ -0,0 +1,382 @@
+import re
+
+import ast
+from errors import error
+from lexer_prim import reserved
+
+# Hand-written lexer and recursive descent parser producing the same
+# trees as the PLY parser in parser_prim.py.
+#
+# The token regex mirrors the rules of lexer_prim.py in the order PLY
+# tries them: function rules in definition order, then string rules
+# from the longest to the shortest regex. Like in PLY, 'true' and
+# 'false' are matched before identifiers, even as their prefixes.
+
+token_re = re.compile(r'''
+    (?P<ignore>[ \t]+)
+  | (?P<NUM>[0-9]+)
+  | (?P<STRING>\".*?\")
+  | (?P<BOOL>true|false)
+  | (?P<IDENT>[_A-Za-z][_A-Za-z0-9]*)
+  | (?P<newline>\n)
+  | (?P<STREQ>==) | (?P<STRNOTEQ>!=) | (?P<ASSIGN>:=)
+  | (?P<LE><=) | (?P<GE>>=) | (?P<NE><>)
+  | (?P<PLUS>\+) | (?P<MINUS>-) | (?P<TIMES>\*) | (?P<DIVIDE>/) | (?P<MOD>%)
+  | (?P<EQUALS>=) | (?P<LT><) | (?P<GT>>)
+  | (?P<LPAREN>\() | (?P<RPAREN>\)) | (?P<LBRACKET>\[) | (?P<RBRACKET>\])
+  | (?P<SEMI>;) | (?P<COMMA>,)
+  | (?P<error>[\s\S])
+''', re.VERBOSE)
+
+num_rels = {'EQUALS', 'LT', 'LE', 'GT', 'GE', 'NE'}
+str_rels = {'STREQ', 'STRNOTEQ'}
+
+# Binding powers of the binary operators. PLUS and MINUS are right
+# associative, so their right operand is parsed at their own level,
+# TIMES, DIVIDE and MOD are left associative.
+
+binary_ops = {'PLUS': (10, 10), 'MINUS': (10, 10),
+              'TIMES': (20, 21), 'DIVIDE': (20, 21), 'MOD': (20, 21)}
+
+
+def tokenize(input_str, lineno=1):
+    """
+    Splits ''input_str'' into tokens. An invalid character ends the
+    list with an 'error' token holding the rest of the input, so that
+    it is only reported once the parser reaches it, like in PLY.
+    :param input_str: Program to tokenize.
+    :param lineno: Line number of the first line of ''input_str''.
+    :return: List of (type, value, lineno) tuples.
+    """
+    tokens = []
+    append = tokens.append
+    for match in token_re.finditer(input_str):
+        kind = match.lastgroup
+        if kind == 'ignore':
+            continue
+        elif kind == 'newline':
+            lineno += 1
+        elif kind == 'IDENT':
+            value = match.group()
+            append((reserved.get(value, 'IDENT'), value, lineno))
+        elif kind == 'NUM':
+            append(('NUM', int(match.group()), lineno))
+        elif kind == 'STRING':
+            append(('STRING', match.group()[1:-1], lineno))
+        elif kind == 'BOOL':
+            append(('BOOL', match.group() == 'true', lineno))
+        elif kind == 'error':
+            append(('error', input_str[match.start():], lineno))
+            break
+        else:
+            append((kind, match.group(), lineno))
+    return tokens
+
+
+def at(node, lineno):
+    """
+    Sets the line number of ''node''.
+    :return: The ''node''.
+    """
+    node.lineno = lineno
+    return node
+
+
+class ParseError(Exception):
+    """
+    Raised when the end of the input is reached unexpectedly.
+    """
+
+
+class Parser:
+    def __init__(self, tokens):
+        """
+        Initializes a recursive descent parser over a list of tokens
+        produced by ''tokenize''.
+        """
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self):
+        """
+        :return: Type of the current token.
+        """
+        if self.pos < len(self.tokens):
+            kind = self.tokens[self.pos][0]
+            if kind == 'error':
+                _, value, lineno = self.tokens[self.pos]
+                error(lineno, f"Invalid character '{value}'")
+            return kind
+        return '$end'
+
+    def line(self):
+        """
+        :return: Line of the current token.
+        """
+        return self.tokens[self.pos][2]
+
+    def advance(self):
+        """
+        Consumes the current token.
+        :return: Value of the consumed token.
+        """
+        value = self.tokens[self.pos][1]
+        self.pos += 1
+        return value
+
+    def expect(self, kind):
+        """
+        Consumes the current token, which must be of type ''kind''.
+        :return: Value of the consumed token.
+        """
+        if self.peek() != kind:
+            self.syntax_error()
+        return self.advance()
+
+    def syntax_error(self):
+        """
+        Reports a syntax error at the current token, with the same
+        message as the PLY parser.
+        """
+        if self.peek() == '$end':
+            raise ParseError()
+        _, value, lineno = self.tokens[self.pos]
+        error(lineno, f'Syntax error at token \'{value}\'')
+
+    # Program
+
+    def parse_program(self):
+        instr = self.parse_instr()
+        program = at(ast.Program(instr), instr.lineno)
+        if self.peek() != '$end':
+            self.syntax_error()
+        return program
+
+    # Instructions
+
+    def parse_instr(self):
+        simple_instr_list = [self.parse_simple_instr()]
+        while self.peek() == 'SEMI':
+            self.advance()
+            simple_instr_list.append(self.parse_simple_instr())
+        return at(ast.Instr(simple_instr_list), simple_instr_list[0].lineno)
+
+    def parse_simple_instr(self):
+        kind = self.peek()
+        lineno = self.line() if kind != '$end' else None
+        if kind == 'IDENT':
+            name = self.advance()
+            if self.peek() == 'LBRACKET':
+                ident = at(ast.Ident(name), lineno)
+                num_expr = self.parse_index()
+                self.expect('ASSIGN')
+                return at(ast.IndexAssignStmt(ident, num_expr, self.parse_expr()), lineno)
+            self.expect('ASSIGN')
+            return at(ast.AssignStmt(name, self.parse_expr()), lineno)
+        elif kind == 'IF':
+            self.advance()
+            cond = self.parse_bool_expr()
+            self.expect('THEN')
+            true_simple_instr = self.parse_simple_instr()
+            # A dangling 'else' belongs to the innermost 'if'.
+            if self.peek() == 'ELSE':
+                self.advance()
+                return at(ast.IfStmt(cond, true_simple_instr, self.parse_simple_instr()), lineno)
+            return at(ast.IfStmt(cond, true_simple_instr), lineno)
+        elif kind == 'WHILE':
+            self.advance()
+            cond = self.parse_bool_expr()
+            self.expect('DO')
+            return at(ast.WhileStmt(cond, self.parse_simple_instr()), lineno)
+        elif kind == 'DO':
+            self.advance()
+            simple_instr = self.parse_simple_instr()
+            self.expect('WHILE')
+            return at(ast.WhileStmt(self.parse_bool_expr(), simple_instr, do_while=True), lineno)
+        elif kind == 'PRINT':
+            self.advance()
+            self.expect('LPAREN')
+            expr = self.parse_expr()
+            self.expect('RPAREN')
+            return at(ast.PrintStmt(expr), lineno)
+        elif kind == 'EXIT':
+            self.advance()
+            return at(ast.ExitStmt(), lineno)
+        elif kind == 'BEGIN':
+            self.advance()
+            instr = self.parse_instr()
+            self.expect('END')
+            return at(ast.InstrBlock(instr), lineno)
+        self.syntax_error()
+
+    # Expressions
+
+    def parse_expr(self, min_bp=0):
+        """
+        Parses a NUM, STRING or ARRAY expression with binary operators
+        binding at least as tightly as ''min_bp''.
+        """
+        return self.parse_binops(self.parse_operand(), min_bp)
+
+    def parse_binops(self, left, min_bp):
+        """
+        Parses the binary operators following an already parsed
+        left operand.
+        """
+        while True:
+            bp = binary_ops.get(self.peek())
+            if bp is None or bp[0] < min_bp:
+                return left
+            op = self.advance()
+            left = at(ast.BinopExpr(left, op, self.parse_expr(bp[1])), left.lineno)
+
+    def parse_operand(self):
+        kind = self.peek()
+        lineno = self.line() if kind != '$end' else None
+        if kind == 'IDENT':
+            ident = at(ast.Ident(self.advance()), lineno)
+            if self.peek() == 'LBRACKET':
+                return at(ast.IndexExpr(ident, self.parse_index()), lineno)
+            if self.peek() == 'LPAREN':
+                return at(self.parse_call(ident), lineno)
+            return ident
+        elif kind == 'NUM' or kind == 'STRING':
+            return at(ast.Literal(self.advance()), lineno)
+        elif kind == 'MINUS':
+            # Unary minus binds tighter than all binary operators.
+            self.advance()
+            return at(ast.UnaryExpr(self.parse_operand()), lineno)
+        elif kind == 'LPAREN':
+            self.advance()
+            expr = self.parse_expr()
+            self.expect('RPAREN')
+            return at(ast.GroupingExpr(expr), lineno)
+        elif kind == 'READINT':
+            self.advance()
+            return at(ast.ReadintExpr(), lineno)
+        elif kind == 'READSTR':
+            self.advance()
+            return at(ast.ReadstrExpr(), lineno)
+        elif kind == 'LEN':
+            self.advance()
+            return at(ast.LenExpr(*self.parse_args(1)), lineno)
+        elif kind == 'POS':
+            self.advance()
+            return at(ast.PosExpr(*self.parse_args(2)), lineno)
+        elif kind == 'CONCAT':
+            self.advance()
+            return at(ast.ConcatExpr(*self.parse_args(2)), lineno)
+        elif kind == 'SUBSTR':
+            self.advance()
+            return at(ast.SubstrExpr(*self.parse_args(3)), lineno)
+        self.syntax_error()
+
+    def parse_index(self):
+        """
+        Parses the bracketed index following the name of an ARRAY.
+        """
+        self.expect('LBRACKET')
+        num_expr = self.parse_expr()
+        self.expect('RBRACKET')
+        return num_expr
+
+    def parse_call(self, ident):
+        """
+        Parses the parenthesized arguments, none or one, of a call
+        of the builtin function named by ''ident''.
+        """
+        self.expect('LPAREN')
+        args = []
+        if self.peek() != 'RPAREN':
+            args.append(self.parse_expr())
+        self.expect('RPAREN')
+        call = ast.builtin_call(ident.name, args)
+        if call is None:
+            error(ident.lineno, f'Syntax error at token \'{ident.name}\'')
+        return call
+
+    def parse_args(self, count):
+        """
+        Parses a parenthesized list of ''count'' expressions.
+        """
+        self.expect('LPAREN')
+        args = [self.parse_expr()]
+        for _ in range(count - 1):
+            self.expect('COMMA')
+            args.append(self.parse_expr())
+        self.expect('RPAREN')
+        return args
+
+    # Boolean expressions
+
+    def parse_bool_expr(self):
+        return self.parse_or(allow_expr=False)[0]
+
+    def parse_or(self, allow_expr):
+        """
+        Parses a boolean expression, or a NUM or STRING expression
+        if ''allow_expr'' is set and no relational operator follows
+        it, which is only the case inside parentheses.
+        :return: Tuple of the parsed node and whether it is boolean.
+        """
+        left, is_bool = self.parse_and(allow_expr)
+        if not is_bool:
+            return left, False
+        while self.peek() == 'OR':
+            bool_op = self.advance()
+            left = at(ast.BoolopExpr(left, bool_op, self.parse_and(False)[0]), left.lineno)
+        return left, True
+
+    def parse_and(self, allow_expr):
+        left, is_bool = self.parse_relation(allow_expr)
+        if not is_bool:
+            return left, False
+        while self.peek() == 'AND':
+            bool_op = self.advance()
+            left = at(ast.BoolopExpr(left, bool_op, self.parse_relation(False)[0]), left.lineno)
+        return left, True
+
+    def parse_relation(self, allow_expr):
+        kind = self.peek()
+        lineno = self.line() if kind != '$end' else None
+        if kind == 'BOOL':
+            return at(ast.Literal(self.advance()), lineno), True
+        elif kind == 'NOT':
+            self.advance()
+            return at(ast.NotExpr(self.parse_relation(False)[0]), lineno), True
+        elif kind == 'LPAREN':
+            # Either a parenthesized boolean expression, or the start
+            # of a NUM or STRING expression, e.g. '(a + 1) * 2 > b'.
+            self.advance()
+            inner, is_bool = self.parse_or(allow_expr=True)
+            self.expect('RPAREN')
+            if is_bool:
+                return at(ast.GroupingExpr(inner), lineno), True
+            left = self.parse_binops(at(ast.GroupingExpr(inner), lineno), 0)
+        else:
+            left = self.parse_expr()
+
+        kind = self.peek()
+        if kind in num_rels:
+            num_rel = self.advance()
+            return at(ast.NumRelopExpr(left, num_rel, self.parse_expr()), left.lineno), True
+        elif kind in str_rels:
+            str_rel = self.advance()
+            return at(ast.StrRelopExpr(left, str_rel, self.parse_expr()), left.lineno), True
+        elif allow_expr:
+            return left, False
+        self.syntax_error()
+
+
+def parse(input_str, lineno=1):
+    """
+    Parses a program.
+    :param input_str: Program to parse.
+    :param lineno: Line number of the first line of ''input_str''.
+    :return: Root of the AST, or None if the input ended unexpectedly.
+    """
+    try:
+        return Parser(tokenize(input_str, lineno)).parse_program()
+    except ParseError:
+        print('EOF - no more input')
+        return None
@@ -0,0 +1,172 @@
+from collections import defaultdict
+import time
+
+import ast
+from interpreter import Interpreter
+
+
+class NodeStats:
+    def __init__(self):
+        """
+        Initializes the statistics of a single AST node.
+        """
+        self.count = 0
+        # Time spent in the node, including its children.
+        self.cumulative = 0.0
+        # Time spent in the node itself.
+        self.self_time = 0.0
+
+
+class Profile:
+    def __init__(self):
+        """
+        Initializes an empty profile, which is filled by a
+        ''ProfilingInterpreter''.
+        """
+        self.nodes = {}
+        # Self time of every stack of node labels, from the root.
+        self.stacks = defaultdict(float)
+
+    def stats(self, node):
+        """
+        :return: ''NodeStats'' of ''node'', created on first use.
+        """
+        stats = self.nodes.get(node)
+        if stats is None:
+            stats = self.nodes[node] = NodeStats()
+        return stats
+
+    def total_time(self):
+        return sum(stats.self_time for stats in self.nodes.values())
+
+    def by_line(self):
+        """
+        Aggregates the profile per source line.
+        :return: List of (lineno, executed nodes, self time) tuples,
+        from the most to the least expensive line.
+        """
+        lines = defaultdict(lambda: [0, 0.0])
+        for node, stats in self.nodes.items():
+            line = lines[node.lineno]
+            line[0] += stats.count
+            line[1] += stats.self_time
+        return sorted(((lineno, count, self_time) for lineno, (count, self_time) in lines.items()),
+                      key=lambda line: line[2], reverse=True)
+
+    def by_loop(self):
+        """
+        Aggregates the profile per ''while'' loop.
+        :return: List of (lineno, entries, iterations, cumulative time)
+        tuples, from the most to the least expensive loop.
+        """
+        loops = []
+        for node, stats in self.nodes.items():
+            if isinstance(node, ast.WhileStmt):
+                body = self.nodes.get(node.simple_instr)
+                iterations = 0 if body is None else body.count
+                loops.append((node.lineno, stats.count, iterations, stats.cumulative))
+        return sorted(loops, key=lambda loop: loop[3], reverse=True)
+
+    def format(self, source=None, limit=20):
+        """
+        :param source: Source of the program, to quote its lines.
+        :param limit: Maximum number of rows of every table.
+        :return: Text tables of the most expensive lines, loops and nodes.
+        """
+        total = self.total_time() or 1.0
+        source_lines = source.splitlines() if source is not None else []
+        lines = ['{:>6} {:>12} {:>10} {:>7}  {}'.format('line', 'nodes', 'self (s)', '%', 'source')]
+        for lineno, count, self_time in self.by_line()[:limit]:
+            text = ''
+            if lineno is not None and 0 < lineno <= len(source_lines):
+                text = source_lines[lineno - 1].strip()
+            lines.append('{:>6} {:>12} {:>10.4f} {:>6.1f}%  {}'.format(
+                str(lineno), count, self_time, self_time / total * 100, text))
+        lines.append('')
+        lines.append('{:>6} {:>12} {:>12} {:>10} {:>14}'.format(
+            'loop', 'entries', 'iterations', 'cum (s)', 'per iter (us)'))
+        for lineno, entries, iterations, cumulative in self.by_loop()[:limit]:
+            lines.append('{:>6} {:>12} {:>12} {:>10.4f} {:>14.2f}'.format(
+                str(lineno), entries, iterations, cumulative,
+                cumulative / iterations * 1e6 if iterations else 0.0))
+        lines.append('')
+        lines.append('{:<14} {:>6} {:>12} {:>10} {:>10}'.format('node', 'line', 'count', 'cum (s)', 'self (s)'))
+        nodes = sorted(self.nodes.items(), key=lambda item: item[1].self_time, reverse=True)
+        for node, stats in nodes[:limit]:
+            lines.append('{:<14} {:>6} {:>12} {:>10.4f} {:>10.4f}'.format(
+                node.__class__.__name__, str(node.lineno), stats.count, stats.cumulative, stats.self_time))
+        return '\n'.join(lines)
+
+    def collapsed_stacks(self):
+        """
+        :return: The profile in the collapsed stack format read by
+        flamegraph tools: one line per stack of nodes, with the self
+        time of its innermost node in microseconds.
+        """
+        lines = []
+        for stack, self_time in sorted(self.stacks.items()):
+            microseconds = round(self_time * 1e6)
+            if microseconds:
+                lines.append('{} {}'.format(';'.join(stack), microseconds))
+        return '\n'.join(lines) + '\n'
+
+
+class ProfilingInterpreter(Interpreter):
+    # Traces and loops run in closed form do not visit the nodes of
+    # the loops.
+    tracing = False
+    closed_forms = False
+
+    def __init__(self, profile, *args, **kwargs):
+        """
+        Initializes an interpreter which records the execution count
+        and time of every node into ''profile'', and starts
+        interpretation. Only this subclass pays for the measurements.
+        :param profile: ''Profile'' to fill, which is complete even
+        when the program exits or fails.
+        All other arguments are passed to ''Interpreter''.
+        """
+        self.profile = profile
+        # Stack of (labels of the nodes being run, time spent in the
+        # children of the innermost one).
+        self.stack = [((), 0.0)]
+        super().__init__(*args, **kwargs)
+
+    def run_node(self, node):
+        """
+        Runs ''node'' and records its statistics.
+        :return: Value of the node, if it is an expression.
+        """
+        stack = self.stack
+        labels = stack[-1][0] + (f'{node.__class__.__name__}:{node.lineno}',)
+        stack.append((labels, 0.0))
+        start = time.perf_counter()
+        try:
+            return node.accept(self)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = stack.pop()[1]
+            parent_labels, parent_children = stack[-1]
+            stack[-1] = (parent_labels, parent_children + elapsed)
+            stats = self.profile.stats(node)
+            stats.count += 1
+            stats.cumulative += elapsed
+            stats.self_time += elapsed - children
+            self.profile.stacks[labels] += elapsed - children
+
+    # Fused nodes run as the nodes they were made from, so that the
+    # nodes inside them are profiled too.
+    def visit_increment_stmt(self, increment_stmt):
+        self.visit_assign_stmt(increment_stmt)
+
+    def visit_counted_while_stmt(self, while_stmt):
+        self.visit_while_stmt(while_stmt)
+
+    def visit_compare_branch_stmt(self, if_stmt):
+        self.visit_if_stmt(if_stmt)
+
+    def evaluate(self, expr):
+        return self.run_node(expr)
+
+    def execute(self, stmt):
+        self.run_node(stmt)
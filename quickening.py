@@ -0,0 +1,77 @@
+from collections import Counter
+import operator
+
+# Number of times a node may be deoptimized in a run before it is
+# left generic for the rest of the run.
+MAX_DEOPTIMIZATIONS = 4
+
+# Operators of the nodes specialized to NUM operands, and to two
+# ''str'' operands, i.e. neither ropes nor views, by the operator
+# of the node.
+INT_BINOPS = {'+': operator.add, '-': operator.sub, '*': operator.mul, '/': operator.truediv,
+              '%': operator.mod}
+INT_RELOPS = {'=': operator.eq, '<': operator.lt, '<=': operator.le, '>': operator.gt, '>=': operator.ge,
+              '<>': operator.ne}
+FLAT_STR_RELOPS = {'==': operator.eq, '!=': operator.ne}
+
+
+def kind(node, operate):
+    """
+    :return: Name of the specialization of ''node'' to ''operate''.
+    """
+    return f'{node.__class__.__name__} {operate.__name__}'
+
+
+class Quickening:
+    def __init__(self):
+        """
+        Initializes the side table of the nodes specialized during a
+        run of the interpreter, with counters of the specializations
+        and deoptimizations of every kind. Nodes themselves are never
+        modified, so that the same tree can be run by several
+        interpreters at once; each run has its own ''Quickening''.
+        """
+        self.specializations = Counter()
+        self.deoptimizations = Counter()
+        # Operator every node specialized in the run is evaluated
+        # with, without checking its operator or its types.
+        self.operators = {}
+        # Number of deoptimizations of every node in the run.
+        self.deoptimized = {}
+
+    def quicken(self, node, operate):
+        """
+        Specializes ''node'' to be evaluated with ''operate'', unless
+        it has been deoptimized too often.
+        """
+        if self.deoptimized and self.deoptimized.get(node, 0) >= MAX_DEOPTIMIZATIONS:
+            return
+        self.operators[node] = operate
+        self.specializations[kind(node, operate)] += 1
+
+    def deoptimize(self, node):
+        """
+        Turns the specialized ''node'' back into a generic one, once
+        one of its guards has failed.
+        """
+        self.deoptimizations[kind(node, self.operators.pop(node))] += 1
+        self.deoptimized[node] = self.deoptimized.get(node, 0) + 1
+
+    def clear(self):
+        """
+        Forgets every node specialized in the run, so that the table
+        does not keep them alive, keeping the counters.
+        """
+        self.operators.clear()
+        self.deoptimized.clear()
+
+    def format(self):
+        """
+        :return: Text table of the specializations and deoptimizations
+        of every kind.
+        """
+        lines = ['{:<20} {:>12} {:>12}'.format('node', 'specialized', 'deoptimized')]
+        for name in sorted(set(self.specializations) | set(self.deoptimizations)):
+            lines.append('{:<20} {:>12} {:>12}'.format(
+                name, self.specializations[name], self.deoptimizations[name]))
+        return '\n'.join(lines)
@@ -0,0 +1,47 @@
+import ast
+
+
+class Resolver:
+    def __init__(self):
+        """
+        Initializes a name resolution pass, which gives every
+        variable of a program a fixed integer slot.
+        """
+        self.slots = {}
+        self.undeclared = []
+
+    def resolve(self, program):
+        """
+        Assigns a slot to every variable in ''program'' and stores it
+        in the ''slot'' attribute of its ''Ident'' and ''AssignStmt''
+        nodes, and the number of slots in ''program.slot_count''.
+        Names which are read but never assigned anywhere in the
+        program are collected in ''undeclared'': reading them is
+        certain to fail with 'Variable not declared.'.
+        :param program: Root of the AST.
+        :return: Number of slots used, i.e. the size of the
+        ''SlotEnvironment'' needed to run the program.
+        """
+        self.slots = {}
+        assigned = set()
+        read = []
+        for node in ast.walk(program):
+            if isinstance(node, ast.AssignStmt):
+                node.slot = self.slot(node.ident)
+                assigned.add(node.ident)
+            elif isinstance(node, ast.Ident):
+                node.slot = self.slot(node.name)
+                read.append(node.name)
+        self.undeclared = []
+        for name in read:
+            if name not in assigned and name not in self.undeclared:
+                self.undeclared.append(name)
+        program.slot_count = len(self.slots)
+        return program.slot_count
+
+    def slot(self, name):
+        """
+        :return: Slot of the variable ''name'', allocating a new
+        one on its first occurrence.
+        """
+        return self.slots.setdefault(name, len(self.slots))
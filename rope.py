@@ -0,0 +1,212 @@
+from bisect import bisect_right
+
+# Concatenations shorter than this are done directly.
+MIN_ROPE_LENGTH = 1024
+# A rope with more pieces than this is flattened instead of having
+# its pieces copied into a new rope.
+MAX_COPIED_PIECES = 256
+# Substrings shorter than this are copied, which is cheaper than
+# creating a view.
+MIN_VIEW_LENGTH = 256
+# Substrings of a string this many times longer than them are copied,
+# so that they do not keep it alive.
+MAX_VIEW_RATIO = 8
+
+
+class Rope:
+    """
+    STRING value built by ''concatenate'', holding its pieces
+    instead of their concatenation, so that appending to it does not
+    copy its contents. Ropes share their list of pieces: a rope is
+    the first ''count'' pieces of the list, and appending to the last
+    rope built on a list extends the list in place. Appending to any
+    other rope copies its pieces into a new list.
+    """
+    __slots__ = ('pieces', 'ends', 'count', 'flat')
+
+    def __init__(self, pieces, ends, count):
+        """
+        :param pieces: List of ''str'' pieces.
+        :param ends: List of the offsets at which every piece ends.
+        :param count: Number of pieces of the list in the rope.
+        """
+        self.pieces = pieces
+        self.ends = ends
+        self.count = count
+        # Concatenation of the pieces, once needed.
+        self.flat = None
+
+    def __len__(self):
+        return self.ends[self.count - 1]
+
+    def __str__(self):
+        return self.flatten()
+
+    def flatten(self):
+        """
+        :return: The rope as a ''str''.
+        """
+        if self.flat is None:
+            pieces = self.pieces
+            self.flat = ''.join(pieces if self.count == len(pieces) else pieces[:self.count])
+        return self.flat
+
+    def slice(self, start, end):
+        """
+        Same as ''str(self)[start:end]'', for 0 <= ''start'', joining
+        only the pieces overlapping the slice.
+        """
+        if self.flat is not None:
+            return self.flat[start:end]
+        ends = self.ends
+        end = min(end, ends[self.count - 1])
+        if start >= end:
+            return ''
+        first = bisect_right(ends, start, 0, self.count)
+        last = bisect_right(ends, end - 1, first, self.count)
+        pieces = self.pieces
+        offset = ends[first - 1] if first else 0
+        if first == last:
+            return pieces[first][start - offset:end - offset]
+        text = ''.join(pieces[first:last + 1])
+        return text[start - offset:end - offset]
+
+
+class StringView:
+    """
+    STRING value built by ''substring'', referring to the characters
+    of a ''str'' between ''start'' and ''end'' instead of copying them.
+    """
+    __slots__ = ('base', 'start', 'end')
+
+    def __init__(self, base, start, end):
+        """
+        :param base: ''str'' the view refers to.
+        :param start: Offset of the first character of the view.
+        :param end: Offset after the last character of the view.
+        """
+        self.base = base
+        self.start = start
+        self.end = end
+
+    def __len__(self):
+        return self.end - self.start
+
+    def __str__(self):
+        return self.flatten()
+
+    def flatten(self):
+        """
+        Copies the characters of the view, which then refers to the
+        copy instead of its base.
+        :return: The view as a ''str''.
+        """
+        if self.start or self.end != len(self.base):
+            self.base = self.base[self.start:self.end]
+            self.start = 0
+            self.end = len(self.base)
+        return self.base
+
+
+# Types of the STRING values.
+STRING = (str, Rope, StringView)
+
+
+def lock_type(value):
+    """
+    :return: Type, or tuple of types, of the values that may be
+    assigned to a variable after ''value''.
+    """
+    return STRING if value.__class__ in STRING else type(value)
+
+
+def flatten(value):
+    """
+    :return: ''value'' as a ''str'' if it is a ''Rope'' or a
+    ''StringView'', or unchanged.
+    """
+    return value if value.__class__ is str else value.flatten()
+
+
+def find(string, sub, index=None):
+    """
+    Same as ''str.find'' for STRING values, copying neither of them
+    if they are a ''str'' or a ''StringView''.
+    :param index: ''SearchIndex'' to search with, if any.
+    """
+    if sub.__class__ is not str:
+        sub = sub.flatten()
+    if string.__class__ is StringView:
+        base, start, end = string.base, string.start, string.end
+    else:
+        base = flatten(string)
+        start, end = 0, len(base)
+    pos = base.find(sub, start, end) if index is None else index.find(base, sub, start, end)
+    return pos if pos == -1 else pos - start
+
+
+def slice_string(string, start, end):
+    """
+    Same as ''str(string)[start:end]'' for STRING values, for
+    0 <= ''start'' and 0 <= ''end''.
+    :return: A ''StringView'' of long enough substrings of a ''str''
+    or a ''StringView'', a ''str'' otherwise.
+    """
+    if string.__class__ is Rope:
+        return string.slice(start, end)
+    if string.__class__ is StringView:
+        base = string.base
+        end = min(string.start + end, string.end)
+        start += string.start
+    else:
+        base = string
+        end = min(end, len(base))
+    length = end - start
+    if length < MIN_VIEW_LENGTH or length * MAX_VIEW_RATIO < len(base):
+        return base[start:end]
+    return StringView(base, start, end)
+
+
+def concatenate(left, right):
+    """
+    Concatenates two STRING values.
+    :return: A ''str'' for short results, a ''Rope'' otherwise.
+    """
+    left_length = len(left)
+    right_length = len(right)
+    if left_length + right_length < MIN_ROPE_LENGTH and left.__class__ is str and right.__class__ is str:
+        return left + right
+    if left.__class__ is StringView:
+        left = left.flatten()
+    if right.__class__ is StringView:
+        right = right.flatten()
+    if not right_length:
+        return left
+    if not left_length:
+        return right
+    if left_length + right_length < MIN_ROPE_LENGTH:
+        return flatten(left) + flatten(right)
+
+    if left.__class__ is Rope:
+        pieces, ends, count = left.pieces, left.ends, left.count
+        if count != len(pieces):
+            # The list has been extended by another rope already.
+            if count > MAX_COPIED_PIECES:
+                pieces, ends = [left.flatten()], [left_length]
+            else:
+                pieces, ends = pieces[:count], ends[:count]
+    else:
+        pieces, ends = [left], [left_length]
+
+    if right.__class__ is Rope:
+        if right.count > MAX_COPIED_PIECES or right.flat is not None:
+            pieces.append(right.flatten())
+            ends.append(left_length + right_length)
+        else:
+            for piece, end in zip(right.pieces[:right.count], right.ends[:right.count]):
+                pieces.append(piece)
+                ends.append(left_length + end)
+    else:
+        pieces.append(right)
+        ends.append(left_length + right_length)
+    return Rope(pieces, ends, len(pieces))
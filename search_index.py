@@ -0,0 +1,81 @@
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+
+# Strings shorter than this are searched directly.
+MIN_INDEXED_LENGTH = 4096
+# Maximum number of offsets held by all indexes.
+MAX_INDEX_ENTRIES = 1 << 20
+# Maximum number of (string, substring) pairs remembered.
+MAX_INDEXES = 256
+
+
+class SearchIndex:
+    def __init__(self, max_entries=MAX_INDEX_ENTRIES, max_indexes=MAX_INDEXES):
+        """
+        Initializes a cache of the offsets of every occurrence of a
+        substring in a string, built for the pairs of a long string
+        and a substring searched more than once, so that later searches
+        take logarithmic time. Least recently used indexes are evicted
+        once they hold more than ''max_entries'' offsets, or there are
+        more than ''max_indexes'' of them.
+        """
+        self.max_entries = max_entries
+        self.max_indexes = max_indexes
+        # (id of the string, substring) -> (string, offsets), where
+        # offsets is None for pairs searched only once so far, and
+        # False for pairs with too many occurrences to be indexed. The
+        # string is held so that its id is not reused.
+        self.indexes = OrderedDict()
+        self.entries = 0
+
+    def find(self, string, sub, start, end):
+        """
+        Same as ''string.find(sub, start, end)'', for
+        0 <= ''start'' <= ''end'' <= ''len(string)''.
+        """
+        if len(string) < MIN_INDEXED_LENGTH or not sub:
+            return string.find(sub, start, end)
+        key = (id(string), sub)
+        index = self.indexes.get(key)
+        if index is None:
+            self.add(key, string, None)
+            return string.find(sub, start, end)
+        self.indexes.move_to_end(key)
+        offsets = index[1]
+        if offsets is None:
+            offsets = self.build(string, sub)
+            self.entries -= 1
+            self.add(key, string, offsets)
+        if offsets is False:
+            return string.find(sub, start, end)
+        i = bisect_left(offsets, start)
+        if i < len(offsets) and offsets[i] + len(sub) <= end:
+            return offsets[i]
+        return -1
+
+    def build(self, string, sub):
+        """
+        :return: Array of the offsets of every occurrence of ''sub''
+        in ''string'', or False if they do not fit in ''max_entries''.
+        """
+        offsets = array('l')
+        find = string.find
+        pos = find(sub)
+        while pos != -1:
+            if len(offsets) + 1 == self.max_entries:
+                return False
+            offsets.append(pos)
+            pos = find(sub, pos + 1)
+        return offsets
+
+    def add(self, key, string, offsets):
+        """
+        Remembers ''offsets'' as the index of ''key'', evicting the
+        least recently used indexes to make room for it.
+        """
+        self.indexes[key] = (string, offsets)
+        self.entries += len(offsets) + 1 if offsets else 1
+        while self.entries > self.max_entries or len(self.indexes) > self.max_indexes:
+            _, (_, evicted) = self.indexes.popitem(last=False)
+            self.entries -= len(evicted) + 1 if evicted else 1
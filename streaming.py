@@ -0,0 +1,83 @@
+from environment import Environment
+from interpreter import Interpreter, PARSERS
+from lexer_prim import reserved
+from parser_rd import token_re
+
+
+def split_statements(lines):
+    """
+    Splits a program into its top-level ''simple_instr'' statements,
+    as it is being read. A ';' only separates statements outside of
+    ''begin'' ... ''end'' blocks and STRING literals. Once an invalid
+    character is found, the rest of the input is kept in one piece, so
+    that the lexer reports it the same way as for the whole program.
+    :param lines: Iterable of the lines of the program, e.g. a file.
+    :return: Generator of (lineno, source) tuples, where ''lineno''
+    is the line on which ''source'' starts.
+    """
+    lines = iter(lines)
+    parts = []
+    depth = 0
+    lineno = 1
+    start = 1
+    for line in lines:
+        pos = 0
+        for match in token_re.finditer(line):
+            kind = match.lastgroup
+            if kind == 'IDENT':
+                word = reserved.get(match.group())
+                if word == 'BEGIN':
+                    depth += 1
+                elif word == 'END':
+                    depth -= 1
+            elif kind == 'SEMI' and depth == 0:
+                parts.append(line[pos:match.start()])
+                yield start, ''.join(parts)
+                parts = []
+                pos = match.end()
+                start = lineno
+            elif kind == 'error':
+                parts.append(line[pos:])
+                parts.extend(lines)
+                yield start, ''.join(parts)
+                return
+        parts.append(line[pos:])
+        lineno += 1
+    yield start, ''.join(parts)
+
+
+class StreamingInterpreter(Interpreter):
+    def __init__(self, parser='ply', pass_manager=None, output=None, input_source=None):
+        """
+        Initializes an interpreter which executes every top-level
+        statement as soon as it has been read, instead of parsing the
+        whole program first. Only one statement is held in memory at
+        a time, but statements before a syntax error are executed.
+        :param parser: One of ''PARSERS''.
+        :param pass_manager: ''PassManager'' to run over every
+        statement, if any.
+        :param output: ''Output'' receiving the printed values,
+        by default one created by ''make_output''.
+        :param input_source: ''InputSource'' read by ''readint'' and
+        ''readstr'', by default one created by ''make_input''.
+        """
+        self.parse = PARSERS[parser]
+        self.pass_manager = pass_manager
+        self.start_run(Environment(), output, input_source)
+
+    def run(self, lines):
+        """
+        Interprets a program statement by statement.
+        :param lines: Iterable of the lines of the program.
+        """
+        with self.output:
+            for lineno, source in split_statements(lines):
+                program = self.parse(source, lineno)
+                if program is None:
+                    return
+                if self.pass_manager is not None:
+                    program = self.pass_manager.run(program)
+                self.execute(program)
+                # The statement is not run again, and the nodes its run
+                # specialized must not keep it alive.
+                self.quickening.clear()
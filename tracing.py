@@ -0,0 +1,456 @@
+from collections import OrderedDict
+
+import ast
+from visitor import Visitor
+from transpiler import num_rel_symbols, bool_op_symbols
+
+# Number of back-edges after which a loop is hot and traced.
+HOT_LOOP_THRESHOLD = 1000
+# Maximum number of compiled traces kept by a ''TracingJit''.
+MAX_TRACES = 64
+
+
+def assigned_slots(node):
+    """
+    :return: Set of the slots assigned anywhere inside ''node''.
+    """
+    return {n.slot for n in ast.walk(node) if isinstance(n, ast.AssignStmt)}
+
+
+class Trace:
+    def __init__(self, while_stmt, source, function, governed_function, nodes, exits):
+        """
+        Initializes a compiled trace of a loop.
+        :param while_stmt: The traced loop.
+        :param source: Python source of the trace.
+        :param function: Function running the loop from a back-edge to
+        its end, taking the values of the ''SlotEnvironment'' and the
+        ''execute'', ''write_line'' and ''read_int'' functions of the
+        interpreter. It returns False, without running anything, if
+        the variables do not have the types the trace was recorded
+        with, and True once it has run the loop to its end.
+        :param governed_function: Same as ''function'', also taking the
+        ''Governor'' of the run, which counts the back-edges.
+        :param nodes: Statements the trace hands back to the interpreter.
+        :param exits: One element list counting the side exits taken.
+        """
+        self.while_stmt = while_stmt
+        self.source = source
+        self.function = function
+        self.governed_function = governed_function
+        self.nodes = nodes
+        self.exits = exits
+        self.entries = 0
+
+
+class TraceCompiler(Visitor):
+    """
+    Generates the Python source of a trace of a loop. The recorded path
+    is compiled to Python code on NUM locals, one per slot, so that it
+    runs without visiting any node. Statements the trace does not
+    compile, and the branches the recorded iteration did not take,
+    are side exits: the trace stores its locals, has the interpreter
+    execute the statement, and reloads the locals it may have assigned.
+    Statements emit lines, expressions return a tuple of their Python
+    source and type, or None if they are not compiled.
+    """
+
+    def __init__(self, values, branches):
+        """
+        :param values: Values of the ''SlotEnvironment'' at the end of
+        the recorded iteration, whose types the trace specializes to.
+        :param branches: Dictionary mapping the ''if'' statements of
+        the loop to the value their condition had when recorded.
+        """
+        self.values = values
+        self.branches = branches
+        self.lines = []
+        self.indent = 0
+        # Slots read or assigned by the trace, and assigned by it.
+        self.used = set()
+        self.written = set()
+        self.nodes = []
+
+    def compile(self, while_stmt):
+        """
+        :return: Source of a module defining ''_trace()'', which runs
+        ''while_stmt'', and ''_governed_trace()'', which also counts
+        its back-edges, or None if its condition is not compiled.
+        """
+        cond = self.expr(while_stmt.cond)
+        if cond is None or cond[1] is not bool:
+            return None
+        self.indent = 3
+        # A ''do ... while'' loop jumps back after its condition, a
+        # ''while'' loop after its body.
+        if while_stmt.do_while:
+            self.lines.append((self.indent, 'back_edge', None))
+        self.block(while_stmt.simple_instr)
+        if not while_stmt.do_while:
+            self.lines.append((self.indent, 'back_edge', None))
+        return self.function('_trace', cond[0], False) + '\n\n' + self.function('_governed_trace', cond[0], True)
+
+    def function(self, name, cond, governed):
+        """
+        :return: Source of the function ''name'' running the generated
+        lines as long as ''cond'' holds. If ''governed'', it takes the
+        ''Governor'' of the run and counts the back-edges in a local,
+        which it hands over to the governor around every check and
+        side exit.
+        """
+        used = sorted(self.used)
+        lines = ['def {}(values, execute, write_line, read_int{}):'.format(name, ', governor' if governed else '')]
+        lines += ['    v{0} = values[{0}]'.format(slot) for slot in used]
+        if used:
+            lines.append('    if {}:'.format(' or '.join('v{}.__class__ is not int'.format(slot) for slot in used)))
+            lines.append('        return False')
+        if governed:
+            lines.append('    countdown = governor.countdown')
+        lines.append('    try:')
+        lines.append('        while {}:'.format(cond))
+        for line in self.lines:
+            if isinstance(line, str):
+                lines.append(line)
+                continue
+            # Locals stored before a side exit, or reloaded after it,
+            # known once the whole trace has been generated, and the
+            # back-edges.
+            indent, kind, slots = line
+            prefix = '    ' * indent
+            if kind == 'store':
+                lines += [prefix + 'values[{0}] = v{0}'.format(slot) for slot in sorted(self.written)]
+                if governed:
+                    lines.append(prefix + 'governor.countdown = countdown')
+            elif kind == 'reload':
+                lines += [prefix + 'v{0} = values[{0}]'.format(slot) for slot in sorted(slots & self.used)]
+                if governed:
+                    lines.append(prefix + 'countdown = governor.countdown')
+            elif governed:
+                lines.append(prefix + 'countdown -= 1')
+                lines.append(prefix + 'if countdown <= 0:')
+                lines.append(prefix + '    governor.countdown = countdown')
+                lines.append(prefix + '    governor.check()')
+                lines.append(prefix + '    countdown = governor.countdown')
+        lines.append('    finally:')
+        lines += ['        values[{0}] = v{0}'.format(slot) for slot in sorted(self.written)]
+        if governed:
+            lines.append('        governor.countdown = countdown')
+        elif not self.written:
+            lines.append('        pass')
+        lines.append('    return True')
+        return '\n'.join(lines) + '\n'
+
+    def emit(self, line):
+        self.lines.append('    ' * self.indent + line)
+
+    def expr(self, node):
+        return node.accept(self)
+
+    def block(self, node):
+        """
+        Emits ''node'' as an indented block.
+        """
+        start = len(self.lines)
+        node.accept(self)
+        if len(self.lines) == start:
+            self.emit('pass')
+
+    def is_num(self, slot):
+        return self.values[slot].__class__ is int
+
+    def side_exit(self, node):
+        """
+        Emits the code handing ''node'' over to the interpreter.
+        """
+        self.lines.append((self.indent, 'store', None))
+        self.emit('execute(nodes[{}])'.format(len(self.nodes)))
+        self.nodes.append(node)
+        self.lines.append((self.indent, 'reload', assigned_slots(node)))
+
+    def visit_program(self, program):
+        program.instr.accept(self)
+
+    def visit_instr(self, instr):
+        for simple_instr in instr.simple_instr_list:
+            simple_instr.accept(self)
+
+    def visit_instr_block(self, instr_block):
+        instr_block.instr.accept(self)
+
+    def visit_exit_stmt(self, exit_stmt):
+        self.side_exit(exit_stmt)
+
+    def visit_assign_stmt(self, assign_stmt):
+        value = self.expr(assign_stmt.expr)
+        slot = assign_stmt.slot
+        if value is None or value[1] is not int or not self.is_num(slot):
+            self.side_exit(assign_stmt)
+            return
+        self.used.add(slot)
+        self.written.add(slot)
+        self.emit('v{} = {}'.format(slot, value[0]))
+
+    def visit_index_assign_stmt(self, index_assign_stmt):
+        self.side_exit(index_assign_stmt)
+
+    def visit_ident(self, ident):
+        if not self.is_num(ident.slot):
+            return None
+        self.used.add(ident.slot)
+        return 'v{}'.format(ident.slot), int
+
+    def visit_literal(self, literal):
+        if literal.value.__class__ in (int, bool):
+            return repr(literal.value), literal.value.__class__
+        return None
+
+    def visit_readint_expr(self, readint_expr):
+        return 'read_int()', int
+
+    def visit_unary_expr(self, unary_expr):
+        value = self.expr(unary_expr.num_expr)
+        if value is None or value[1] is not int:
+            return None
+        return '(-{})'.format(value[0]), int
+
+    def visit_binop_expr(self, binop_expr):
+        left = self.expr(binop_expr.num_expr0)
+        right = self.expr(binop_expr.num_expr1)
+        # '/' produces a FLOAT, which the trace does not hold.
+        if left is None or right is None or left[1] is not int or right[1] is not int or binop_expr.op == '/':
+            return None
+        return '({} {} {})'.format(left[0], binop_expr.op, right[0]), int
+
+    def visit_grouping_expr(self, grouping_expr):
+        return self.expr(grouping_expr.num_expr)
+
+    def visit_len_expr(self, len_expr):
+        return None
+
+    def visit_pos_expr(self, pos_expr):
+        return None
+
+    def visit_index_expr(self, index_expr):
+        return None
+
+    def visit_reduction_expr(self, reduction_expr):
+        return None
+
+    def visit_readstr_expr(self, readstr_expr):
+        return None
+
+    def visit_concat_expr(self, concat_expr):
+        return None
+
+    def visit_substr_expr(self, substr_expr):
+        return None
+
+    def visit_array_expr(self, array_expr):
+        return None
+
+    def visit_readarray_expr(self, readarray_expr):
+        return None
+
+    def visit_if_stmt(self, if_stmt):
+        """
+        Emits the branch taken by ''if_stmt'' when recorded, and a side
+        exit to the other one.
+        """
+        cond = self.expr(if_stmt.cond)
+        taken = self.branches.get(if_stmt)
+        if cond is None or cond[1] is not bool or taken is None:
+            self.side_exit(if_stmt)
+            return
+        if not taken and if_stmt.else_simple_instr is None:
+            # Nothing runs on the recorded path.
+            self.emit('if {}:'.format(cond[0]))
+            self.indent += 1
+            self.emit('exits[0] += 1')
+            self.side_exit(if_stmt.true_simple_instr)
+            self.indent -= 1
+            return
+        if taken:
+            self.emit('if {}:'.format(cond[0]))
+            branch, other = if_stmt.true_simple_instr, if_stmt.else_simple_instr
+        else:
+            self.emit('if not {}:'.format(cond[0]))
+            branch, other = if_stmt.else_simple_instr, if_stmt.true_simple_instr
+        self.indent += 1
+        self.block(branch)
+        self.indent -= 1
+        if other is not None:
+            self.emit('else:')
+            self.indent += 1
+            self.emit('exits[0] += 1')
+            self.side_exit(other)
+            self.indent -= 1
+
+    def visit_while_stmt(self, while_stmt):
+        self.side_exit(while_stmt)
+
+    def visit_not_expr(self, not_expr):
+        value = self.expr(not_expr.bool_expr)
+        if value is None or value[1] is not bool:
+            return None
+        return '(not {})'.format(value[0]), bool
+
+    def visit_boolop_expr(self, boolop_expr):
+        # Both operands are always evaluated, as by the interpreter.
+        left = self.expr(boolop_expr.bool_expr0)
+        right = self.expr(boolop_expr.bool_expr1)
+        if left is None or right is None or left[1] is not bool or right[1] is not bool:
+            return None
+        return '({} {} {})'.format(left[0], bool_op_symbols[boolop_expr.bool_op], right[0]), bool
+
+    def visit_num_relop_expr(self, num_relop_expr):
+        left = self.expr(num_relop_expr.num_expr0)
+        right = self.expr(num_relop_expr.num_expr1)
+        if left is None or right is None or left[1] is not int or right[1] is not int:
+            return None
+        return '({} {} {})'.format(left[0], num_rel_symbols[num_relop_expr.num_rel], right[0]), bool
+
+    def visit_str_relop_expr(self, str_relop_expr):
+        return None
+
+    def visit_print_stmt(self, print_stmt):
+        value = self.expr(print_stmt.expr)
+        if value is None or value[1] is not int:
+            self.side_exit(print_stmt)
+            return
+        self.emit('write_line({})'.format(value[0]))
+
+
+class TracingJit:
+    def __init__(self, threshold=HOT_LOOP_THRESHOLD, max_traces=MAX_TRACES, dump=None):
+        """
+        Initializes a tracing JIT, which compiles the loops run by the
+        interpreter to Python functions once they are hot. A trace is
+        specialized to the branches taken by one recorded iteration,
+        and to the types the variables had then.
+        :param threshold: Number of back-edges after which a loop is
+        hot, or None to never trace loops.
+        :param max_traces: Maximum number of compiled traces kept. The
+        least recently used ones are evicted beyond that, and their
+        loops have to get hot again to be traced again.
+        :param dump: Text stream to write the source of every compiled
+        trace to, if any.
+        """
+        self.threshold = threshold
+        self.max_traces = max_traces
+        self.dump = dump
+        self.traces = OrderedDict()
+        # Number of back-edges of every loop which has no trace.
+        self.back_edges = {}
+        # Loops which cannot be traced.
+        self.failed = set()
+        self.compiled = 0
+        self.evicted = 0
+
+    def countdown(self, while_stmt):
+        """
+        :return: Number of back-edges ''while_stmt'' has to run before
+        it is hot, 0 if it is hot already, or -1 if it is never traced.
+        """
+        if while_stmt in self.traces:
+            return 0
+        if self.threshold is None or while_stmt in self.failed:
+            return -1
+        return max(self.threshold - self.back_edges.get(while_stmt, 0), 0)
+
+    def leave(self, while_stmt, back_edges):
+        """
+        Adds the ''back_edges'' run by the interpreter to the count of
+        ''while_stmt'', once it has ended.
+        """
+        self.back_edges[while_stmt] = self.back_edges.get(while_stmt, 0) + back_edges
+
+    def run(self, while_stmt, interpreter):
+        """
+        Runs the hot ''while_stmt'' from one of its back-edges, i.e.
+        from the evaluation of its condition, with its trace, which is
+        recorded and compiled first if needed.
+        :param interpreter: ''Interpreter'' running the loop.
+        :return: Whether the loop has been run to its end. Otherwise,
+        the interpreter goes on from a back-edge of the loop.
+        """
+        trace = self.traces.get(while_stmt)
+        if trace is None:
+            if not interpreter.evaluate(while_stmt.cond):
+                # Recorded the next time the loop runs.
+                self.back_edges[while_stmt] = self.threshold
+                return True
+            trace = self.record(while_stmt, interpreter)
+            if trace is None:
+                return False
+        else:
+            self.traces.move_to_end(while_stmt)
+        governor = interpreter.governor
+        if governor is None:
+            entered = trace.function(interpreter.slot_values, interpreter.execute, interpreter.output.write_line,
+                                     interpreter.input_source.read_int)
+        else:
+            entered = trace.governed_function(interpreter.slot_values, interpreter.execute,
+                                              interpreter.output.write_line, interpreter.input_source.read_int,
+                                              governor)
+        if not entered:
+            return False
+        trace.entries += 1
+        return True
+
+    def record(self, while_stmt, interpreter):
+        """
+        Has the interpreter run one iteration of the body of
+        ''while_stmt'', recording the branches it takes, and compiles
+        a trace of the loop.
+        :return: The ''Trace'', or None if the loop cannot be traced.
+        """
+        # Nested loops may get hot, and be recorded, meanwhile. The
+        # branches of their ''if'' statements are also recorded, and
+        # ignored, as nested loops are side exits.
+        outer_branches = interpreter.branches
+        branches = interpreter.branches = {}
+        governor = interpreter.governor
+        try:
+            # The recorded iteration is a back-edge of the loop.
+            if governor is not None and while_stmt.do_while:
+                governor.countdown -= 1
+                if governor.countdown <= 0:
+                    governor.check()
+            interpreter.execute(while_stmt.simple_instr)
+            if governor is not None and not while_stmt.do_while:
+                governor.countdown -= 1
+                if governor.countdown <= 0:
+                    governor.check()
+        finally:
+            interpreter.branches = outer_branches
+
+        compiler = TraceCompiler(interpreter.slot_values, branches)
+        source = compiler.compile(while_stmt)
+        if source is None:
+            self.failed.add(while_stmt)
+            return None
+        exits = [0]
+        namespace = {'nodes': compiler.nodes, 'exits': exits}
+        exec(compile(source, f'<trace of line {while_stmt.lineno}>', 'exec'), namespace)
+        trace = Trace(while_stmt, source, namespace['_trace'], namespace['_governed_trace'], compiler.nodes, exits)
+        self.compiled += 1
+        if self.dump is not None:
+            self.dump.write(f'# Trace of the loop on line {while_stmt.lineno}\n{source}\n')
+        self.traces[while_stmt] = trace
+        while len(self.traces) > self.max_traces:
+            evicted, _ = self.traces.popitem(last=False)
+            self.back_edges.pop(evicted, None)
+            self.evicted += 1
+        return trace
+
+    def format(self):
+        """
+        :return: Text table of the entries and side exits of every
+        trace kept, and the number of traces compiled and evicted.
+        """
+        lines = ['{:>6} {:>10} {:>12}'.format('loop', 'entries', 'side exits')]
+        for trace in self.traces.values():
+            lines.append('{:>6} {:>10} {:>12}'.format(str(trace.while_stmt.lineno), trace.entries, trace.exits[0]))
+        lines.append('{} traces compiled, {} evicted, {} loops not traced'.format(
+            self.compiled, self.evicted, len(self.failed)))
+        return '\n'.join(lines)
@@ -0,0 +1,416 @@
+from visitor import Visitor
+from errors import error
+import ast
+
+# Static types of expressions. None stands for a type that is not
+# known before the program runs.
+
+NUM = int
+FLOAT = float
+STRING = str
+BOOL = bool
+
+num_rel_symbols = {'=': '==', '<': '<', '<=': '<=', '>': '>', '>=': '>=', '<>': '!='}
+bool_op_symbols = {'and': '&', 'or': '|'}
+
+
+# Runtime helpers available to the generated code. They perform the
+# checks which could not be proven unnecessary at compile time and
+# report errors with the same messages as the tree-walking interpreter.
+
+def _undeclared():
+    error('', 'Variable not declared.')
+
+
+def _mismatch():
+    error('', 'Variable type does not match.')
+
+
+def _readint():
+    i = input()
+    try:
+        i = int(i)
+    except ValueError:
+        error('', 'Input to readint must be of type NUM.')
+    return i
+
+
+def _binop(op, left, right):
+    if not (isinstance(left, int) and isinstance(right, int)):
+        error('', f'Binary operator {op} can only be applied to arguments of type NUM.')
+    if op == '+':
+        return left + right
+    elif op == '-':
+        return left - right
+    elif op == '*':
+        return left * right
+    elif op == '/':
+        return left / right
+    else:
+        return left % right
+
+
+def _length(value):
+    if not isinstance(value, str):
+        error('', 'Argument passed to length() must be of type STRING.')
+    return len(value)
+
+
+def _position(string, sub):
+    if not (isinstance(string, str) and isinstance(sub, str)):
+        error('', 'Arguments passed to position() must be of type STRING.')
+    pos = string.find(sub)
+    return 0 if pos == -1 else pos
+
+
+def _concatenate(left, right):
+    if not (isinstance(left, str) and isinstance(right, str)):
+        error('', 'Arguments passed to concatenate() must be of type STRING.')
+    return ''.join([left, right])
+
+
+def _substring(string, start, end):
+    if not (isinstance(string, str) and isinstance(start, int) and isinstance(end, int)):
+        error('', 'Arguments passed to substring() must be of appropriate types.')
+    if start < 1 or end < 0:
+        return ''
+    return string[start-1:end]
+
+
+def _check_if(condition):
+    if not isinstance(condition, bool):
+        error('', 'If clause condition must be a boolean expression.')
+    return condition
+
+
+def _check_while(condition):
+    if not isinstance(condition, bool):
+        error('', 'While loop condition must be a boolean expression.')
+    return condition
+
+
+def _not(value):
+    if not isinstance(value, bool):
+        error('', '\'not\' keyword can only be used with a boolean expression.')
+    return not value
+
+
+def _boolop(op, left, right):
+    if not (isinstance(left, bool) and isinstance(right, bool)):
+        error('', 'Boolean operators can only be used with boolean expressions.')
+    return left and right if op == 'and' else left or right
+
+
+def _num_relop(rel, left, right):
+    if not (isinstance(left, int) and isinstance(right, int)):
+        error('', f'Relational operator \'{rel}\' can only be used with type NUM')
+    return {'=': left == right, '<': left < right, '<=': left <= right,
+            '>': left > right, '>=': left >= right, '<>': left != right}[rel]
+
+
+def _str_relop(rel, left, right):
+    if not (isinstance(left, str) and isinstance(right, str)):
+        error('', f'Relational operator \'{rel}\' can only be used with type STRING.')
+    return left == right if rel == '==' else left != right
+
+
+runtime = {fn.__name__: fn for fn in (_undeclared, _mismatch, _readint, _binop, _length,
+                                     _position, _concatenate, _substring, _check_if,
+                                     _check_while, _not, _boolop, _num_relop, _str_relop)}
+
+
+def assigned_names(node):
+    """
+    :return: Set of names assigned anywhere inside ''node''.
+    """
+    return {n.ident for n in ast.walk(node) if isinstance(n, ast.AssignStmt)}
+
+
+class State:
+    """
+    What is statically known about the variables at a point of
+    the program: ''assigned'' maps every definitely assigned name to
+    its type (or None if unknown), ''maybe'' holds all names that
+    might have been assigned. Since the type of a variable is locked
+    by its first assignment, known types never change afterwards.
+    """
+
+    def __init__(self, assigned=None, maybe=None):
+        self.assigned = dict(assigned or {})
+        self.maybe = set(maybe or ())
+
+    def copy(self):
+        return State(self.assigned, self.maybe)
+
+    def merge(self, other):
+        """
+        :return: State at the join point of two control flow paths.
+        """
+        assigned = {name: t if other.assigned[name] == t else None
+                    for name, t in self.assigned.items() if name in other.assigned}
+        return State(assigned, self.maybe | other.maybe)
+
+
+class PythonGenerator(Visitor):
+    """
+    Generates Python source equivalent to a program. Statements append
+    lines to the output, expressions return a tuple of their Python
+    source and static type. Variables become locals of a single
+    function, prefixed with 'v_' so that they can never clash with
+    Python keywords, builtins or the runtime helpers.
+    """
+
+    def __init__(self):
+        self.lines = []
+        self.indent = 1
+        self.state = State()
+
+    def generate(self, program):
+        """
+        Generates Python source for the whole ''program''.
+        :param program: Root of the AST.
+        :return: Source of a module defining ''_program()''.
+        """
+        self.lines = []
+        self.indent = 1
+        self.state = State()
+        program.accept(self)
+        names = sorted(assigned_names(program) | {n.name for n in ast.walk(program)
+                                                  if isinstance(n, ast.Ident)})
+        header = ['def _program():']
+        header += ['    v_{} = None'.format(name) for name in names]
+        body = self.lines or ['    pass']
+        return '\n'.join(header + body) + '\n'
+
+    def emit(self, line):
+        self.lines.append('    ' * self.indent + line)
+
+    def expr(self, node):
+        return node.accept(self)
+
+    def block(self, node):
+        """
+        Emits ''node'' as an indented block.
+        """
+        self.indent += 1
+        start = len(self.lines)
+        node.accept(self)
+        if len(self.lines) == start:
+            self.emit('pass')
+        self.indent -= 1
+
+    def visit_program(self, program):
+        program.instr.accept(self)
+
+    def visit_instr(self, instr):
+        for simple_instr in instr.simple_instr_list:
+            simple_instr.accept(self)
+
+    def visit_instr_block(self, instr_block):
+        instr_block.instr.accept(self)
+
+    def visit_exit_stmt(self, exit_stmt):
+        self.emit('exit()')
+
+    def visit_assign_stmt(self, assign_stmt):
+        """
+        Emits an assignment. The type check of ''Environment.assign''
+        is only emitted if the variable might already hold a value
+        of a different type.
+        """
+        name = assign_stmt.ident
+        var = 'v_' + name
+        source, t = self.expr(assign_stmt.expr)
+        state = self.state
+        if name not in state.maybe or (name in state.assigned and t is not None
+                                       and state.assigned[name] is t):
+            self.emit('{} = {}'.format(var, source))
+        else:
+            self.emit('_t = {}'.format(source))
+            self.emit('if {0} is not None and not isinstance(_t, type({0})):'.format(var))
+            self.emit('    _mismatch()')
+            self.emit('{} = _t'.format(var))
+        if t is not None or name not in state.assigned:
+            state.assigned[name] = t
+        state.maybe.add(name)
+
+    def visit_ident(self, ident):
+        var = 'v_' + ident.name
+        if ident.name in self.state.assigned:
+            return var, self.state.assigned[ident.name]
+        return '({0} if {0} is not None else _undeclared())'.format(var), None
+
+    def visit_literal(self, literal):
+        return repr(literal.value), type(literal.value)
+
+    def visit_readint_expr(self, readint_expr):
+        return '_readint()', NUM
+
+    def visit_unary_expr(self, unary_expr):
+        source, t = self.expr(unary_expr.num_expr)
+        return '(-{})'.format(source), t if t in (NUM, FLOAT) else None
+
+    def visit_binop_expr(self, binop_expr):
+        left, left_t = self.expr(binop_expr.num_expr0)
+        right, right_t = self.expr(binop_expr.num_expr1)
+        op = binop_expr.op
+        t = FLOAT if op == '/' else NUM
+        if left_t is NUM and right_t is NUM:
+            return '({} {} {})'.format(left, op, right), t
+        return '_binop({!r}, {}, {})'.format(op, left, right), t
+
+    def visit_grouping_expr(self, grouping_expr):
+        return self.expr(grouping_expr.num_expr)
+
+    def visit_len_expr(self, len_expr):
+        source, t = self.expr(len_expr.str_expr)
+        if t is STRING:
+            return 'len({})'.format(source), NUM
+        return '_length({})'.format(source), NUM
+
+    def visit_pos_expr(self, pos_expr):
+        string, string_t = self.expr(pos_expr.str_expr0)
+        sub, sub_t = self.expr(pos_expr.str_expr1)
+        if string_t is STRING and sub_t is STRING:
+            return 'max({}.find({}), 0)'.format(string, sub), NUM
+        return '_position({}, {})'.format(string, sub), NUM
+
+    def visit_readstr_expr(self, readstr_expr):
+        return 'input()', STRING
+
+    def visit_concat_expr(self, concat_expr):
+        left, left_t = self.expr(concat_expr.str_expr0)
+        right, right_t = self.expr(concat_expr.str_expr1)
+        if left_t is STRING and right_t is STRING:
+            return '({} + {})'.format(left, right), STRING
+        return '_concatenate({}, {})'.format(left, right), STRING
+
+    def visit_substr_expr(self, substr_expr):
+        string, _ = self.expr(substr_expr.str_expr)
+        start, _ = self.expr(substr_expr.num_expr0)
+        end, _ = self.expr(substr_expr.num_expr1)
+        return '_substring({}, {}, {})'.format(string, start, end), STRING
+
+    def condition(self, node, check):
+        """
+        :return: Source of a condition, wrapped in a ''check'' helper
+        unless it is statically known to be a boolean.
+        """
+        source, t = self.expr(node)
+        if t is BOOL:
+            return source
+        return '{}({})'.format(check, source)
+
+    def visit_if_stmt(self, if_stmt):
+        self.emit('if {}:'.format(self.condition(if_stmt.cond, '_check_if')))
+        entry = self.state
+        self.state = entry.copy()
+        self.block(if_stmt.true_simple_instr)
+        true_state = self.state
+        self.state = entry.copy()
+        if if_stmt.else_simple_instr is not None:
+            self.emit('else:')
+            self.block(if_stmt.else_simple_instr)
+        self.state = true_state.merge(self.state)
+
+    def visit_while_stmt(self, while_stmt):
+        """
+        Emits a loop. Like the tree-walking interpreter, the condition
+        is evaluated and type checked once before the loop starts.
+        """
+        self.emit(self.condition(while_stmt.cond, '_check_while'))
+        entry = self.state
+        self.state = State(entry.assigned, entry.maybe | assigned_names(while_stmt.simple_instr))
+        if while_stmt.do_while:
+            self.emit('while True:')
+            self.block(while_stmt.simple_instr)
+            cond, _ = self.expr(while_stmt.cond)
+            self.emit('    if not {}:'.format(cond))
+            self.emit('        break')
+        else:
+            cond, _ = self.expr(while_stmt.cond)
+            self.emit('while {}:'.format(cond))
+            self.block(while_stmt.simple_instr)
+            self.state = State(entry.assigned, self.state.maybe)
+
+    def visit_not_expr(self, not_expr):
+        source, t = self.expr(not_expr.bool_expr)
+        if t is BOOL:
+            return '(not {})'.format(source), BOOL
+        return '_not({})'.format(source), BOOL
+
+    def visit_boolop_expr(self, boolop_expr):
+        """
+        Both operands are always evaluated, so the non short-circuiting
+        bitwise operators are used for booleans.
+        """
+        left, left_t = self.expr(boolop_expr.bool_expr0)
+        right, right_t = self.expr(boolop_expr.bool_expr1)
+        bool_op = boolop_expr.bool_op
+        if left_t is BOOL and right_t is BOOL:
+            return '({} {} {})'.format(left, bool_op_symbols[bool_op], right), BOOL
+        return '_boolop({!r}, {}, {})'.format(bool_op, left, right), BOOL
+
+    def visit_num_relop_expr(self, num_relop_expr):
+        left, left_t = self.expr(num_relop_expr.num_expr0)
+        right, right_t = self.expr(num_relop_expr.num_expr1)
+        num_rel = num_relop_expr.num_rel
+        if num_rel not in num_rel_symbols:
+            error('', f'Relational operator \'{num_rel}\' not supported for type NUM.')
+        if left_t is NUM and right_t is NUM:
+            return '({} {} {})'.format(left, num_rel_symbols[num_rel], right), BOOL
+        return '_num_relop({!r}, {}, {})'.format(num_rel, left, right), BOOL
+
+    def visit_str_relop_expr(self, str_relop_expr):
+        left, left_t = self.expr(str_relop_expr.str_expr0)
+        right, right_t = self.expr(str_relop_expr.str_expr1)
+        str_rel = str_relop_expr.str_rel
+        if left_t is STRING and right_t is STRING:
+            return '({} {} {})'.format(left, str_rel, right), BOOL
+        return '_str_relop({!r}, {}, {})'.format(str_rel, left, right), BOOL
+
+    def visit_print_stmt(self, print_stmt):
+        source, _ = self.expr(print_stmt.expr)
+        self.emit('print({})'.format(source))
+
+    # ARRAY values are only supported by the tree-walking interpreter.
+
+    def visit_index_assign_stmt(self, index_assign_stmt):
+        self.array_unsupported(index_assign_stmt)
+
+    def visit_index_expr(self, index_expr):
+        self.array_unsupported(index_expr)
+
+    def visit_reduction_expr(self, reduction_expr):
+        self.array_unsupported(reduction_expr)
+
+    def visit_array_expr(self, array_expr):
+        self.array_unsupported(array_expr)
+
+    def visit_readarray_expr(self, readarray_expr):
+        self.array_unsupported(readarray_expr)
+
+    def array_unsupported(self, node):
+        error(node.lineno, 'ARRAY values are only supported by the tree backend.')
+
+
+def to_python(program):
+    """
+    :param program: Root of the AST.
+    :return: Python source equivalent to ''program''.
+    """
+    return PythonGenerator().generate(program)
+
+
+def run_python(source):
+    """
+    Compiles Python ''source'' produced by ''to_python'' with CPython's
+    compiler and runs it.
+    """
+    try:
+        code = compile(source, '<program>', 'exec')
+    except (SyntaxError, RecursionError):
+        error('', 'Program is too deeply nested to be compiled to Python.')
+    namespace = dict(runtime)
+    exec(code, namespace)
+    namespace['_program']()
@@ -0,0 +1,251 @@
+import ast
+from visitor import Visitor
+
+# Static types of the values of expressions. Expressions which never
+# produce a value, because evaluating them is certain to fail, have
+# the type None.
+NUM = 'NUM'
+# Results of '/', which the other operators do not accept as NUM.
+FLOAT = 'FLOAT'
+STRING = 'STRING'
+BOOL = 'BOOL'
+# ARRAY values of NUM elements. Results of '/' on them hold floats,
+# and are DYNAMIC.
+ARRAY = 'ARRAY'
+# Type of expressions whose values can be of any type.
+DYNAMIC = 'DYNAMIC'
+
+LITERAL_TYPES = {bool: BOOL, int: NUM, float: FLOAT, str: STRING}
+
+
+def join(type0, type1):
+    """
+    :return: Type of the values which are either of ''type0''
+    or of ''type1''.
+    """
+    if type0 is None:
+        return type1
+    if type1 is None or type0 == type1:
+        return type0
+    return DYNAMIC
+
+
+class TypeChecker(Visitor):
+    def __init__(self):
+        """
+        Initializes a type inference pass, which infers the static
+        type of every expression and variable of a program.
+        """
+        # Static type of every variable assigned by the program.
+        self.types = {}
+        self.errors = []
+
+    def check(self, program):
+        """
+        Infers the types of the expressions of ''program'' and stores
+        them in their ''static_type'' attribute. The type of a
+        variable is that of all values assigned to it, since they
+        must match. Nodes whose type checks are certain to pass get
+        their ''type_safe'' attribute set, so that the interpreter
+        skips them. Variables which are never assigned, or only
+        assigned expressions which never produce a value, can only
+        hold values set outside of the program, and are DYNAMIC.
+        :param program: Root of the AST.
+        :return: List of (lineno, message) tuples of the errors which
+        are certain to happen whenever their node is executed.
+        """
+        self.types = {node.ident: None for node in ast.walk(program) if isinstance(node, ast.AssignStmt)}
+        while True:
+            previous = dict(self.types)
+            self.errors = []
+            program.accept(self)
+            if self.types == previous:
+                if None not in self.types.values():
+                    return self.errors
+                self.types = {name: DYNAMIC if type_ is None else type_
+                              for name, type_ in self.types.items()}
+
+    def evaluate(self, expr):
+        """
+        :return: Static type of ''expr''.
+        """
+        expr.static_type = expr.accept(self)
+        return expr.static_type
+
+    def execute(self, stmt):
+        stmt.accept(self)
+
+    def check_operands(self, node, operands, message):
+        """
+        Infers the types of the operands of ''node'', whose type check
+        fails with ''message''.
+        :param operands: List of (operand, expected type) tuples.
+        :return: Whether ''node'' may produce a value.
+        """
+        return self.check_types(node, [(self.evaluate(operand), expected) for operand, expected in operands],
+                                message)
+
+    def check_types(self, node, types, message):
+        """
+        Checks the already inferred types of the operands of ''node'',
+        whose type check fails with ''message''.
+        :param types: List of (inferred type, expected type) tuples.
+        :return: Whether ''node'' may produce a value.
+        """
+        node.type_safe = all(type_ == expected for type_, expected in types)
+        if any(type_ is None for type_, _ in types):
+            return False
+        if any(type_ != DYNAMIC and type_ != expected for type_, expected in types):
+            self.errors.append((node.lineno, message))
+            return False
+        return True
+
+    def visit_program(self, program):
+        self.execute(program.instr)
+
+    def visit_instr(self, instr):
+        for simple_instr in instr.simple_instr_list:
+            self.execute(simple_instr)
+
+    def visit_instr_block(self, instr_block):
+        self.execute(instr_block.instr)
+
+    def visit_exit_stmt(self, exit_stmt):
+        pass
+
+    def visit_assign_stmt(self, assign_stmt):
+        name = assign_stmt.ident
+        self.types[name] = join(self.types[name], self.evaluate(assign_stmt.expr))
+        assign_stmt.type_safe = self.types[name] not in (None, DYNAMIC)
+
+    def visit_index_assign_stmt(self, index_assign_stmt):
+        self.check_operands(index_assign_stmt, [(index_assign_stmt.ident, ARRAY), (index_assign_stmt.num_expr, NUM),
+                                                (index_assign_stmt.expr, NUM)],
+                            'Array element assignment requires an ARRAY, a NUM index and a NUM value.')
+
+    def visit_ident(self, ident):
+        return self.types.get(ident.name, DYNAMIC)
+
+    def visit_literal(self, literal):
+        return LITERAL_TYPES.get(type(literal.value), DYNAMIC)
+
+    def visit_readint_expr(self, readint_expr):
+        return NUM
+
+    def visit_unary_expr(self, unary_expr):
+        type_ = self.evaluate(unary_expr.num_expr)
+        return type_ if type_ in (None, NUM, FLOAT, ARRAY) else DYNAMIC
+
+    def visit_binop_expr(self, binop_expr):
+        op = binop_expr.op
+        types = [self.evaluate(binop_expr.num_expr0), self.evaluate(binop_expr.num_expr1)]
+        if ARRAY in types:
+            # Applied to every element, with checks left to run time.
+            if not self.check_types(binop_expr, [(type_, ARRAY if type_ == ARRAY else NUM) for type_ in types],
+                                    f'Binary operator {op} can only be applied to arguments of type NUM or ARRAY.'):
+                return None
+            binop_expr.type_safe = False
+            return DYNAMIC if op == '/' or DYNAMIC in types else ARRAY
+        if not self.check_types(binop_expr, [(type_, NUM) for type_ in types],
+                                f'Binary operator {op} can only be applied to arguments of type NUM.'):
+            return None
+        if DYNAMIC in types:
+            # Either operand may be an ARRAY.
+            return DYNAMIC
+        return FLOAT if op == '/' else NUM
+
+    def visit_grouping_expr(self, grouping_expr):
+        return self.evaluate(grouping_expr.num_expr)
+
+    def visit_len_expr(self, len_expr):
+        type_ = self.evaluate(len_expr.str_expr)
+        if not self.check_types(len_expr, [(type_, ARRAY if type_ == ARRAY else STRING)],
+                                'Argument passed to length() must be of type STRING.'):
+            return None
+        return NUM
+
+    def visit_pos_expr(self, pos_expr):
+        if not self.check_operands(pos_expr, [(pos_expr.str_expr0, STRING), (pos_expr.str_expr1, STRING)],
+                                   'Arguments passed to position() must be of type STRING.'):
+            return None
+        return NUM
+
+    def visit_index_expr(self, index_expr):
+        if not self.check_operands(index_expr, [(index_expr.ident, ARRAY), (index_expr.num_expr, NUM)],
+                                   'Only an ARRAY can be indexed, with a NUM index.'):
+            return None
+        return NUM if index_expr.ident.static_type == ARRAY else DYNAMIC
+
+    def visit_reduction_expr(self, reduction_expr):
+        reduction = reduction_expr.reduction
+        if not self.check_operands(reduction_expr, [(reduction_expr.array_expr, ARRAY)],
+                                   f'Argument passed to {reduction}() must be of type ARRAY.'):
+            return None
+        return NUM if reduction_expr.array_expr.static_type == ARRAY else DYNAMIC
+
+    def visit_readstr_expr(self, readstr_expr):
+        return STRING
+
+    def visit_concat_expr(self, concat_expr):
+        if not self.check_operands(concat_expr, [(concat_expr.str_expr0, STRING), (concat_expr.str_expr1, STRING)],
+                                   'Arguments passed to concatenate() must be of type STRING.'):
+            return None
+        return STRING
+
+    def visit_substr_expr(self, substr_expr):
+        if not self.check_operands(substr_expr, [(substr_expr.str_expr, STRING), (substr_expr.num_expr0, NUM),
+                                                 (substr_expr.num_expr1, NUM)],
+                                   'Arguments passed to substring() must be of appropriate types.'):
+            return None
+        return STRING
+
+    def visit_array_expr(self, array_expr):
+        if not self.check_operands(array_expr, [(array_expr.num_expr, NUM)],
+                                   'Argument passed to array() must be of type NUM.'):
+            return None
+        return ARRAY
+
+    def visit_readarray_expr(self, readarray_expr):
+        return ARRAY
+
+    def visit_if_stmt(self, if_stmt):
+        self.check_operands(if_stmt, [(if_stmt.cond, BOOL)], 'If clause condition must be a boolean expression.')
+        self.execute(if_stmt.true_simple_instr)
+        if if_stmt.else_simple_instr is not None:
+            self.execute(if_stmt.else_simple_instr)
+
+    def visit_while_stmt(self, while_stmt):
+        self.check_operands(while_stmt, [(while_stmt.cond, BOOL)],
+                            'While loop condition must be a boolean expression.')
+        self.execute(while_stmt.simple_instr)
+
+    def visit_not_expr(self, not_expr):
+        if not self.check_operands(not_expr, [(not_expr.bool_expr, BOOL)],
+                                   '\'not\' keyword can only be used with a boolean expression.'):
+            return None
+        return BOOL
+
+    def visit_boolop_expr(self, boolop_expr):
+        if not self.check_operands(boolop_expr, [(boolop_expr.bool_expr0, BOOL), (boolop_expr.bool_expr1, BOOL)],
+                                   'Boolean operators can only be used with boolean expressions.'):
+            return None
+        return BOOL
+
+    def visit_num_relop_expr(self, num_relop_expr):
+        num_rel = num_relop_expr.num_rel
+        if not self.check_operands(num_relop_expr, [(num_relop_expr.num_expr0, NUM),
+                                                    (num_relop_expr.num_expr1, NUM)],
+                                   f'Relational operator \'{num_rel}\' can only be used with type NUM'):
+            return None
+        return BOOL
+
+    def visit_str_relop_expr(self, str_relop_expr):
+        str_rel = str_relop_expr.str_rel
+        if not self.check_operands(str_relop_expr, [(str_relop_expr.str_expr0, STRING),
+                                                    (str_relop_expr.str_expr1, STRING)],
+                                   f'Relational operator \'{str_rel}\' can only be used with type STRING.'):
+            return None
+        return BOOL
+
+    def visit_print_stmt(self, print_stmt):
+        self.evaluate(print_stmt.expr)
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 import inspect
 
+import ast
+
 
 def decorate_all_methods(decorator_fn):
     def decorate(cls):
@@ -27,6 +29,9 @@ class Visitor(ABC):
     def visit_assign_stmt(self, assign_stmt):
         pass
 
+    def visit_index_assign_stmt(self, index_assign_stmt):
+        pass
+
     def visit_ident(self, ident):
         pass
 
@@ -51,6 +56,12 @@ class Visitor(ABC):
     def visit_pos_expr(self, pos_expr):
         pass
 
+    def visit_index_expr(self, index_expr):
+        pass
+
+    def visit_reduction_expr(self, reduction_expr):
+        pass
+
     def visit_readstr_expr(self, readstr_expr):
         pass
 
@@ -60,6 +71,12 @@ class Visitor(ABC):
     def visit_substr_expr(self, substr_expr):
         pass
 
+    def visit_array_expr(self, array_expr):
+        pass
+
+    def visit_readarray_expr(self, readarray_expr):
+        pass
+
     def visit_if_stmt(self, if_stmt):
         pass
 
@@ -80,3 +97,126 @@ class Visitor(ABC):
 
     def visit_print_stmt(self, print_stmt):
         pass
+
+    # Nodes fused by the ''Fuser'' are visited as the nodes they were
+    # made from, unless a visitor has a fast path for them.
+
+    def visit_increment_stmt(self, increment_stmt):
+        return self.visit_assign_stmt(increment_stmt)
+
+    def visit_counted_while_stmt(self, counted_while_stmt):
+        return self.visit_while_stmt(counted_while_stmt)
+
+    def visit_compare_branch_stmt(self, compare_branch_stmt):
+        return self.visit_if_stmt(compare_branch_stmt)
+
+
+class Transformer(Visitor):
+    """
+    Base class for AST-to-AST passes. Every ''visit_*'' method
+    returns a new node built from the transformed children, leaving
+    the input tree untouched. Subclasses override the methods for
+    the nodes they rewrite. New nodes take the line number of the
+    node they replace.
+    """
+
+    def transform(self, node):
+        new_node = node.accept(self)
+        if new_node.lineno is None:
+            new_node.lineno = node.lineno
+        return new_node
+
+    def visit_program(self, program):
+        return ast.Program(self.transform(program.instr))
+
+    def visit_instr(self, instr):
+        return ast.Instr([self.transform(simple_instr) for simple_instr in instr.simple_instr_list])
+
+    def visit_instr_block(self, instr_block):
+        return ast.InstrBlock(self.transform(instr_block.instr))
+
+    def visit_exit_stmt(self, exit_stmt):
+        return ast.ExitStmt()
+
+    def visit_assign_stmt(self, assign_stmt):
+        return ast.AssignStmt(assign_stmt.ident, self.transform(assign_stmt.expr))
+
+    def visit_index_assign_stmt(self, index_assign_stmt):
+        return ast.IndexAssignStmt(self.transform(index_assign_stmt.ident), self.transform(index_assign_stmt.num_expr),
+                                   self.transform(index_assign_stmt.expr))
+
+    def visit_ident(self, ident):
+        return ast.Ident(ident.name)
+
+    def visit_literal(self, literal):
+        return ast.Literal(literal.value)
+
+    def visit_readint_expr(self, readint_expr):
+        return ast.ReadintExpr()
+
+    def visit_unary_expr(self, unary_expr):
+        return ast.UnaryExpr(self.transform(unary_expr.num_expr))
+
+    def visit_binop_expr(self, binop_expr):
+        return ast.BinopExpr(self.transform(binop_expr.num_expr0), binop_expr.op,
+                             self.transform(binop_expr.num_expr1))
+
+    def visit_grouping_expr(self, grouping_expr):
+        return ast.GroupingExpr(self.transform(grouping_expr.num_expr))
+
+    def visit_len_expr(self, len_expr):
+        return ast.LenExpr(self.transform(len_expr.str_expr))
+
+    def visit_pos_expr(self, pos_expr):
+        return ast.PosExpr(self.transform(pos_expr.str_expr0), self.transform(pos_expr.str_expr1))
+
+    def visit_index_expr(self, index_expr):
+        return ast.IndexExpr(self.transform(index_expr.ident), self.transform(index_expr.num_expr))
+
+    def visit_reduction_expr(self, reduction_expr):
+        return ast.ReductionExpr(reduction_expr.reduction, self.transform(reduction_expr.array_expr))
+
+    def visit_readstr_expr(self, readstr_expr):
+        return ast.ReadstrExpr()
+
+    def visit_concat_expr(self, concat_expr):
+        return ast.ConcatExpr(self.transform(concat_expr.str_expr0), self.transform(concat_expr.str_expr1))
+
+    def visit_substr_expr(self, substr_expr):
+        return ast.SubstrExpr(self.transform(substr_expr.str_expr), self.transform(substr_expr.num_expr0),
+                              self.transform(substr_expr.num_expr1))
+
+    def visit_array_expr(self, array_expr):
+        return ast.ArrayExpr(self.transform(array_expr.num_expr))
+
+    def visit_readarray_expr(self, readarray_expr):
+        return ast.ReadarrayExpr()
+
+    def visit_if_stmt(self, if_stmt):
+        else_simple_instr = None
+        if if_stmt.else_simple_instr is not None:
+            else_simple_instr = self.transform(if_stmt.else_simple_instr)
+        return ast.IfStmt(self.transform(if_stmt.cond), self.transform(if_stmt.true_simple_instr),
+                          else_simple_instr)
+
+    def visit_while_stmt(self, while_stmt):
+        return ast.WhileStmt(self.transform(while_stmt.cond), self.transform(while_stmt.simple_instr),
+                             while_stmt.do_while)
+
+    def visit_not_expr(self, not_expr):
+        return ast.NotExpr(self.transform(not_expr.bool_expr))
+
+    def visit_boolop_expr(self, boolop_expr):
+        return ast.BoolopExpr(self.transform(boolop_expr.bool_expr0), boolop_expr.bool_op,
+                              self.transform(boolop_expr.bool_expr1))
+
+    def visit_num_relop_expr(self, num_relop_expr):
+        return ast.NumRelopExpr(self.transform(num_relop_expr.num_expr0), num_relop_expr.num_rel,
+                                self.transform(num_relop_expr.num_expr1))
+
+    def visit_str_relop_expr(self, str_relop_expr):
+        return ast.StrRelopExpr(self.transform(str_relop_expr.str_expr0), str_relop_expr.str_rel,
+                                self.transform(str_relop_expr.str_expr1))
+
+    def visit_print_stmt(self, print_stmt):
+        return ast.PrintStmt(self.transform(print_stmt.expr))
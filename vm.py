@@ -0,0 +1,142 @@
+from errors import error
+from environment import Environment
+from bytecode import (LOAD_CONST, LOAD_NAME, STORE_NAME, BINARY_OP,
+                      COMPARE_NUM, COMPARE_STR, JUMP, JUMP_IF_FALSE, JUMP_IF_TRUE,
+                      CHECK_BOOL, POP_TOP, NEGATE, NOT, BOOL_OP, LENGTH, POSITION,
+                      CONCAT, SUBSTR, READINT, READSTR, PRINT, EXIT,
+                      binary_ops, binary_fns, num_rels, num_rel_fns, str_rels,
+                      str_rel_fns, check_bool_msgs)
+
+
+class VM:
+    def __init__(self):
+        """
+        Initializes a stack-based virtual machine running
+        ''CodeObject'' instances produced by the compiler.
+        """
+        self.environment = Environment()
+
+    def run(self, code_object):
+        """
+        Runs ''code_object'' until it falls off its end or exits.
+        Variable accesses work directly on the environment's
+        dictionary, performing the same checks as
+        ''Environment.get'' and ''Environment.assign''.
+        :param code_object: Compiled program to run.
+        """
+        code = code_object.code
+        consts = code_object.consts
+        names = code_object.names
+        values = self.environment.values
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        end = len(code)
+        pc = 0
+
+        while pc < end:
+            op = code[pc]
+            arg = code[pc + 1]
+            pc += 2
+
+            if op == LOAD_NAME:
+                value = values.get(names[arg])
+                if value is None:
+                    error('', 'Variable not declared.')
+                push(value)
+            elif op == LOAD_CONST:
+                push(consts[arg])
+            elif op == STORE_NAME:
+                value = pop()
+                name = names[arg]
+                existing_value = values.get(name)
+                if existing_value is not None and not isinstance(value, type(existing_value)):
+                    error('', 'Variable type does not match.')
+                values[name] = value
+            elif op == BINARY_OP:
+                right = pop()
+                left = pop()
+                if not (isinstance(left, int) and isinstance(right, int)):
+                    error('', f'Binary operator {binary_ops[arg]} can only be applied to arguments of type NUM.')
+                push(binary_fns[arg](left, right))
+            elif op == COMPARE_NUM:
+                right = pop()
+                left = pop()
+                if not (isinstance(left, int) and isinstance(right, int)):
+                    error('', f'Relational operator \'{num_rels[arg]}\' can only be used with type NUM')
+                push(num_rel_fns[arg](left, right))
+            elif op == JUMP_IF_FALSE:
+                if not pop():
+                    pc = arg
+            elif op == JUMP:
+                pc = arg
+            elif op == JUMP_IF_TRUE:
+                if pop():
+                    pc = arg
+            elif op == CHECK_BOOL:
+                if not isinstance(stack[-1], bool):
+                    error('', check_bool_msgs[arg])
+            elif op == POP_TOP:
+                pop()
+            elif op == COMPARE_STR:
+                right = pop()
+                left = pop()
+                if not (isinstance(left, str) and isinstance(right, str)):
+                    error('', f'Relational operator \'{str_rels[arg]}\' can only be used with type STRING.')
+                push(str_rel_fns[arg](left, right))
+            elif op == BOOL_OP:
+                right = pop()
+                left = pop()
+                if not (isinstance(left, bool) and isinstance(right, bool)):
+                    error('', 'Boolean operators can only be used with boolean expressions.')
+                push((left and right) if arg == 0 else (left or right))
+            elif op == NOT:
+                value = pop()
+                if not isinstance(value, bool):
+                    error('', '\'not\' keyword can only be used with a boolean expression.')
+                push(not value)
+            elif op == NEGATE:
+                push(-pop())
+            elif op == PRINT:
+                print(pop())
+            elif op == CONCAT:
+                right = pop()
+                left = pop()
+                if not (isinstance(left, str) and isinstance(right, str)):
+                    error('', 'Arguments passed to concatenate() must be of type STRING.')
+                push(''.join([left, right]))
+            elif op == SUBSTR:
+                end_index = pop()
+                start = pop()
+                string = pop()
+                if not (isinstance(string, str) and isinstance(start, int) and isinstance(end_index, int)):
+                    error('', 'Arguments passed to substring() must be of appropriate types.')
+                if start < 1 or end_index < 0:
+                    push('')
+                else:
+                    push(string[start - 1:end_index])
+            elif op == LENGTH:
+                value = pop()
+                if not isinstance(value, str):
+                    error('', 'Argument passed to length() must be of type STRING.')
+                push(len(value))
+            elif op == POSITION:
+                right = pop()
+                left = pop()
+                if not (isinstance(left, str) and isinstance(right, str)):
+                    error('', 'Arguments passed to position() must be of type STRING.')
+                pos = left.find(right)
+                push(0 if pos == -1 else pos)
+            elif op == READINT:
+                i = input()
+                try:
+                    i = int(i)
+                except ValueError:
+                    error('', 'Input to readint must be of type NUM.')
+                push(i)
+            elif op == READSTR:
+                push(input())
+            elif op == EXIT:
+                exit()
+            else:
+                error('', f'Unknown opcode {op}.')